@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import List, Set, Tuple, TYPE_CHECKING
+from Types.LeafEvaluator import LeafEvaluator
+from Types.QuiescenceSearch import MATE_SCORE, QuiescenceSearch
+from Types.SearchResult import MoveScore, SearchResult
+from Types.TranspositionTable import BOUND_EXACT, BOUND_LOWER, BOUND_UPPER, TranspositionTable
+
+if TYPE_CHECKING:
+    from Types.Game import Game
+    from Types.Player import Player
+
+DEFAULT_DEPTH: int = 3  # The depth a search iterates to when it is given no limit
+MATE_THRESHOLD: int = MATE_SCORE - 1000  # Scores beyond this are king captures, their distance counted in plies
+NODE_CHECK_INTERVAL: int = 64  # The amount of nodes searched between two checks of the time limit
+KILLER_SLOTS: int = 2  # The amount of quiet moves remembered per ply for causing a cutoff
+TT_MOVE_ORDER: int = 1 << 30  # The ordering rank of the transposition table's move, searched first
+WINNING_CAPTURE_ORDER: int = 1 << 20  # Added to the MVV-LVA rank of captures that do not lose material
+KILLER_ORDER: int = 1 << 10  # The ordering rank of the first killer move, the next killers ranking one lower each
+NULL_MOVE_REDUCTION: int = 2  # The plies a null move search is shallower by, on top of the ply the null move takes
+NULL_MOVE_MIN_DEPTH: int = 3  # The depth below which null moves are not tried, their search being too shallow to trust
+LMR_MIN_DEPTH: int = 3  # The depth below which no move is reduced
+LMR_FULL_DEPTH_MOVES: int = 3  # The amount of moves, in ordering rank, searched to the full depth before any reduction
+LMR_DEEP_MOVES: int = 12  # The ordering rank from which late moves are reduced by a second ply
+FUTILITY_MARGINS: Tuple[int, ...] = (0, 200, 500)  # The most a quiet move may gain, by plies left, up to futility depth
+
+
+class SearchAborted(Exception):
+    """
+    Unwinds an alpha-beta search once its time is up, or it was asked to stop, the unfinished iteration being dropped
+    """
+    pass
+
+
+class AlphaBetaSearch:
+    """
+    Depth-first negamax search with alpha-beta pruning, https://www.chessprogramming.org/Alpha-Beta, deepened one ply
+    at a time, https://www.chessprogramming.org/Iterative_Deepening, until the depth or time limit is reached, so the
+    result of the last finished iteration is always at hand. Its leaves are extended by a QuiescenceSearch, so no leaf
+    is scored in the middle of an exchange.
+
+    Moves are ordered by the transposition table's move first, then captures that do not lose material by MVV-LVA,
+    then killer moves, https://www.chessprogramming.org/Killer_Heuristic, then the other moves, with captures that lose
+    material last. Results are stored in a TranspositionTable, alongside the statistics of the Monte Carlo search if
+    both share one. Scores are in centipawns, from the point of view of the player to move.
+
+    The search is made selective by three techniques, each with its own toggle so its effect can be measured:
+
+    - Null-move pruning, https://www.chessprogramming.org/Null_Move_Pruning, passes the turn and searches the position
+      NULL_MOVE_REDUCTION plies shallower, cutting the node off if the player to move still reaches beta. Null moves
+      are not tried in check, twice in a row, or by a player left with only its king and pawns, where passing may well
+      be the best move (zugzwang) and the cutoff would be wrong.
+    - Late move reductions, https://www.chessprogramming.org/Late_Move_Reductions, search the quiet moves ranked after
+      the first LMR_FULL_DEPTH_MOVES with a null window one ply shallower, two from LMR_DEEP_MOVES on, and search them
+      again to the full depth only if they beat alpha.
+    - Futility pruning, https://www.chessprogramming.org/Futility_Pruning, skips the quiet moves of a node one or two
+      plies from the horizon when the static evaluation, plus the most such a move may gain, cannot reach alpha.
+    """
+
+    def __init__(self: AlphaBetaSearch, game: Game, root_moves: List[List[int]] | None = None,
+                 transposition_table: TranspositionTable | None = None,
+                 quiescence: QuiescenceSearch | None = None, null_move: bool = True,
+                 late_move_reductions: bool = True, futility_pruning: bool = True) -> None:
+        """
+        Initializes a search rooted at the game supplied
+
+        :param game: The game to search, it is never modified by the search
+        :param root_moves: The moves the root is restricted to, defaults to every valid move
+        :param transposition_table: The table to store results in, defaults to a new table
+        :param quiescence: The quiescence search extending the leaves, defaults to a new QuiescenceSearch
+        :param null_move: Whether nodes are cut off by null-move pruning
+        :param late_move_reductions: Whether late quiet moves are searched to a reduced depth first
+        :param futility_pruning: Whether quiet moves that cannot reach alpha are skipped near the horizon
+        """
+        self.game: Game = game
+        self.root_moves: List[List[int]] | None = root_moves
+        self.transposition_table: TranspositionTable = transposition_table if transposition_table is not None \
+            else TranspositionTable()
+        self.quiescence: QuiescenceSearch = quiescence if quiescence is not None else QuiescenceSearch()
+        self.null_move: bool = null_move
+        self.late_move_reductions: bool = late_move_reductions
+        self.futility_pruning: bool = futility_pruning
+        self.killers: List[List[List[int]]] = []  # The quiet moves that caused a cutoff, by ply
+        self.stop_event: threading.Event = threading.Event()
+        self.deadline: float | None = None
+        self.node_limit: int | None = None
+        self.nodes: int = 0
+        self.completed_depth: int = 0
+        self.best_move: List[int] | None = None
+        self.best_score: int = 0
+        #  the score, nodes and exactness of every root move, best first
+        self.move_scores: List[Tuple[List[int], int, int, bool]] = []
+        self.elapsed: float = 0
+        self.null_move_cutoffs: int = 0  # The amount of nodes cut off by a null move search
+        self.reduced_moves: int = 0  # The amount of moves searched to a reduced depth
+        self.researched_moves: int = 0  # The amount of reduced moves searched again, having beaten alpha
+        self.futile_moves: int = 0  # The amount of moves skipped by futility pruning
+
+    def stop(self: AlphaBetaSearch) -> None:
+        """
+        Asks a running search to stop, the iteration in progress being dropped
+
+        :return: None
+        """
+        self.stop_event.set()
+
+    def search(self: AlphaBetaSearch, depth: int | None = None, time_limit: float | None = None,
+               nodes: int | None = None) -> SearchResult:
+        """
+        Deepens the search one ply at a time until any limit is reached, or `stop` is called, defaulting to
+        DEFAULT_DEPTH when no limit is supplied
+
+        :param depth: The depth of the last iteration
+        :param time_limit: The maximum amount of seconds to search for
+        :param nodes: The maximum amount of nodes to search, on top of those already searched
+        :return: The result of the last finished iteration
+        """
+        if depth is None and time_limit is None and nodes is None:
+            depth = DEFAULT_DEPTH
+        start = time.perf_counter()
+        self.stop_event.clear()
+        self.deadline = start + time_limit if time_limit is not None else None
+        self.node_limit = self.nodes + nodes if nodes is not None else None
+        current_depth = 1
+        while depth is None or current_depth <= depth:
+            try:
+                self.search_root(current_depth)
+            except SearchAborted:
+                break
+            self.completed_depth = current_depth
+            if abs(self.best_score) > MATE_THRESHOLD:
+                #  a forced king capture was found, searching deeper cannot change the outcome
+                break
+            current_depth += 1
+        self.elapsed += time.perf_counter() - start
+        return self.result()
+
+    def count_node(self: AlphaBetaSearch) -> None:
+        """
+        Counts a node, aborting the search if its time or nodes are up. The node limit only applies once the first
+        iteration is done, so the search always has a move to answer with.
+
+        :return: None
+        """
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit and self.completed_depth > 0:
+            raise SearchAborted()
+        if self.nodes % NODE_CHECK_INTERVAL == 0 and (
+                self.stop_event.is_set() or (self.deadline is not None and time.perf_counter() >= self.deadline)):
+            raise SearchAborted()
+
+    def search_root(self: AlphaBetaSearch, depth: int) -> int:
+        """
+        Runs one iteration, searching every root move to the depth supplied, the best move of the previous iteration
+        first. Only the first move is searched with an open window, the others are only proven no better than the best
+        so far, their score then being an upper bound, unless they turn out better and are searched again.
+
+        :param depth: The depth of the iteration
+        :return: The score of the root
+        """
+        moves = [each_move[:] for each_move in self.root_moves] if self.root_moves is not None \
+            else self.game.generate_valid_moves()
+        previous_order = {tuple(each_move): index for index, (each_move, _, _, _) in enumerate(self.move_scores)}
+        if len(previous_order) > 0:
+            moves.sort(key=lambda each_move: previous_order.get(tuple(each_move), len(previous_order)))
+        else:
+            moves = self.order_moves(self.game, moves, None, 0)
+        if self.best_move is None and len(moves) > 0:
+            #  the first iteration may be cut short by the time limit or `stop`, the best ordered move stands in until
+            #  a move has been searched
+            self.best_move = moves[0]
+        alpha = -math.inf
+        scores: List[Tuple[List[int], int, int, bool]] = []
+        for index, each_move in enumerate(moves):
+            nodes = self.nodes
+            child = self.game.make_move(each_move)
+            exact = True
+            if index == 0:
+                score = -self.negamax(child, depth - 1, -MATE_SCORE, MATE_SCORE, 1)
+            else:
+                #  the later moves only need to be proven worse than the best so far, unless they turn out better
+                score = -self.negamax(child, depth - 1, -alpha - 1, -alpha, 1)
+                if score > alpha:
+                    score = -self.negamax(child, depth - 1, -MATE_SCORE, -alpha, 1)
+                exact = score > alpha
+            scores.append((each_move, score, self.nodes - nodes, exact))
+            if self.completed_depth == 0 and score > alpha:
+                #  without a finished iteration to fall back on, the best move searched so far is kept
+                self.best_move, self.best_score = each_move, score
+            alpha = max(alpha, score)
+        #  an exact score ranks above a bound of the same value, the bound only being proven no better
+        scores.sort(key=lambda each_score: (each_score[1], each_score[3]), reverse=True)
+        self.move_scores = scores
+        self.best_move, self.best_score = (scores[0][0], scores[0][1]) if len(scores) > 0 else (None, 0)
+        if self.best_move is not None:
+            self.store(self.game.position_hash(), depth, self.best_score, BOUND_EXACT, self.best_move, 0)
+        return self.best_score
+
+    @staticmethod
+    def has_non_pawn_material(player: Player) -> bool:
+        """
+        Checks if a player has any piece besides its king and pawns, without which passing the turn is too often the
+        best move for null-move pruning to be trusted
+
+        :param player: The player whose pieces are checked
+        :return: Whether the player has a knight, bishop, rook or queen
+        """
+        return any(each_piece.name not in ("King", "Pawn") for each_piece in player.pieces)
+
+    def negamax(self: AlphaBetaSearch, game: Game, depth: int, alpha: int, beta: int, ply: int,
+                allow_null: bool = True) -> int:
+        """
+        Searches the game to the depth supplied, handing the leaves to the quiescence search
+
+        :param game: The game to search, it is never modified
+        :param depth: The plies left to search
+        :param alpha: The score the player to move is already assured of
+        :param beta: The score the opponent is already assured of, a score at or above it is cut off
+        :param ply: The distance of the game from the root
+        :param allow_null: Whether a null move may be tried, False right after one
+        :return: The score in centipawns from the point of view of the player to move
+        """
+        self.count_node()
+        if self.quiescence.can_capture_king(game):
+            return MATE_SCORE - ply
+        if game.is_draw():
+            return 0
+        if depth <= 0:
+            return self.quiescence.search(game, alpha, beta)
+        key = game.position_hash()
+        entry = self.transposition_table.probe(key)
+        tt_move: List[int] | None = None
+        if entry is not None and entry.best_move is not None:
+            tt_move = entry.best_move
+            if entry.depth >= depth:
+                score = self.score_from_table(entry.score, ply)
+                if entry.bound == BOUND_EXACT or (entry.bound == BOUND_LOWER and score >= beta) or \
+                        (entry.bound == BOUND_UPPER and score <= alpha):
+                    return score
+        in_check = self.quiescence.in_check(game)
+        #  a player in check has no static score to speak of, it must evade, so neither pruning applies
+        static_score = self.quiescence.evaluate(game) if not in_check else 0
+        if self.null_move and allow_null and not in_check and depth >= NULL_MOVE_MIN_DEPTH and \
+                static_score >= beta and abs(beta) < MATE_THRESHOLD and \
+                self.has_non_pawn_material(game.current_player()):
+            #  pass the turn, if the opponent still cannot bring the score under beta, a real move will not either
+            score = -self.negamax(game.clone().next_turn(), depth - 1 - NULL_MOVE_REDUCTION, -beta, -beta + 1, ply + 1,
+                                  False)
+            if score >= beta:
+                self.null_move_cutoffs += 1
+                return beta
+        moves = game.generate_valid_moves()
+        if len(moves) == 0:
+            #  a player with no moves is lost if in check, its king being captured on the next ply, otherwise it is a
+            #  stalemate
+            return -(MATE_SCORE - ply - 1) if in_check else 0
+        futile = self.futility_pruning and not in_check and depth < len(FUTILITY_MARGINS) and \
+            abs(alpha) < MATE_THRESHOLD and static_score + FUTILITY_MARGINS[depth] <= alpha
+        killers = self.killers[ply] if ply < len(self.killers) else []
+        original_alpha = alpha
+        best_score = -math.inf
+        best_move: List[int] | None = None
+        for index, each_move in enumerate(self.order_moves(game, moves, tt_move, ply)):
+            quiet = game.board.grab_piece(each_move[2], each_move[3]) is None
+            if futile and quiet and index > 0:
+                self.futile_moves += 1
+                best_score = max(best_score, static_score + FUTILITY_MARGINS[depth])
+                continue
+            child = game.make_move(each_move)
+            if self.late_move_reductions and depth >= LMR_MIN_DEPTH and index >= LMR_FULL_DEPTH_MOVES and quiet and \
+                    not in_check and each_move not in killers:
+                reduction = min(1 if index < LMR_DEEP_MOVES else 2, depth - 2)
+                self.reduced_moves += 1
+                score = -self.negamax(child, depth - 1 - reduction, -alpha - 1, -alpha, ply + 1)
+                if score > alpha:
+                    self.researched_moves += 1
+                    score = -self.negamax(child, depth - 1, -beta, -alpha, ply + 1)
+            else:
+                score = -self.negamax(child, depth - 1, -beta, -alpha, ply + 1)
+            if score > best_score:
+                best_score = score
+                best_move = each_move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                if quiet:
+                    self.add_killer(each_move, ply)
+                break
+        bound = BOUND_UPPER if best_score <= original_alpha else BOUND_LOWER if best_score >= beta else BOUND_EXACT
+        self.store(key, depth, best_score, bound, best_move, ply)
+        return best_score
+
+    def order_moves(self: AlphaBetaSearch, game: Game, moves: List[List[int]], tt_move: List[int] | None,
+                    ply: int) -> List[List[int]]:
+        """
+        Orders moves so the ones likeliest to cause a cutoff are searched first
+
+        :param game: The game the moves are played in
+        :param moves: The moves to order
+        :param tt_move: The best move the transposition table holds for the game, if any
+        :param ply: The distance of the game from the root, selecting its killer moves
+        :return: The ordered moves
+        """
+        killers = self.killers[ply] if ply < len(self.killers) else []
+
+        def rank(move: List[int]) -> int:
+            if move == tt_move:
+                return TT_MOVE_ORDER
+            capture_rank = QuiescenceSearch.capture_order(game, move)
+            if capture_rank > 0:
+                if game.board.static_exchange_evaluation(*move) >= 0:
+                    return WINNING_CAPTURE_ORDER + capture_rank
+                return -WINNING_CAPTURE_ORDER + capture_rank
+            if move in killers:
+                return KILLER_ORDER - killers.index(move)
+            return 0
+        return sorted(moves, key=rank, reverse=True)
+
+    def add_killer(self: AlphaBetaSearch, move: List[int], ply: int) -> None:
+        """
+        Remembers a quiet move that caused a cutoff, so it is tried early in the other positions of the same ply
+
+        :param move: The move that caused the cutoff
+        :param ply: The distance of the position from the root
+        :return: None
+        """
+        while len(self.killers) <= ply:
+            self.killers.append([])
+        killers = self.killers[ply]
+        if move in killers:
+            return
+        killers.insert(0, move)
+        del killers[KILLER_SLOTS:]
+
+    @staticmethod
+    def score_to_table(score: int, ply: int) -> int:
+        """
+        Converts a score to the form stored in the transposition table, king captures counted from the position
+        rather than from the root
+
+        :param score: The score of the position
+        :param ply: The distance of the position from the root
+        :return: The score to store
+        """
+        if score > MATE_THRESHOLD:
+            return score + ply
+        if score < -MATE_THRESHOLD:
+            return score - ply
+        return score
+
+    @staticmethod
+    def score_from_table(score: int, ply: int) -> int:
+        """
+        Converts a score read from the transposition table back to a score counted from the root
+
+        :param score: The stored score
+        :param ply: The distance of the position from the root
+        :return: The score of the position
+        """
+        if score > MATE_THRESHOLD:
+            return score - ply
+        if score < -MATE_THRESHOLD:
+            return score + ply
+        return score
+
+    def store(self: AlphaBetaSearch, key: int, depth: int, score: int, bound: int, best_move: List[int] | None,
+              ply: int) -> None:
+        """
+        Stores the result of a position in the transposition table, keeping the statistics the Monte Carlo search
+        may have stored for it
+
+        :param key: The position hash of the position
+        :param depth: The depth the position was searched to
+        :param score: The score of the position
+        :param bound: Whether the score is exact, or a lower or upper bound
+        :param best_move: The best move found from the position
+        :param ply: The distance of the position from the root
+        :return: None
+        """
+        entry = self.transposition_table.entry(key)
+        if entry.depth > depth and entry.best_move is not None:
+            #  a deeper result is worth more than this one
+            return
+        entry.depth = depth
+        entry.score = self.score_to_table(score, ply)
+        entry.bound = bound
+        entry.best_move = best_move
+        self.transposition_table.store(entry)
+
+    def principal_variation(self: AlphaBetaSearch) -> List[List[int]]:
+        """
+        Follows the best moves of the transposition table from the root, as deep as the last finished iteration
+
+        :return: The line of moves the search expects to be played
+        """
+        if self.best_move is None:
+            return []
+        line: List[List[int]] = [self.best_move]
+        game = self.game.make_move(self.best_move)
+        seen: Set[int] = {self.game.position_hash()}
+        while len(line) < max(self.completed_depth, 1) and game.position_hash() not in seen:
+            seen.add(game.position_hash())
+            entry = self.transposition_table.probe(game.position_hash())
+            if entry is None or entry.best_move is None or entry.best_move not in game.generate_valid_moves():
+                break
+            line.append(entry.best_move)
+            game = game.make_move(entry.best_move)
+        return line
+
+    def result(self: AlphaBetaSearch) -> SearchResult:
+        """
+        Summarizes the last finished iteration, scores being converted to expected results
+
+        :return: The result of the search
+        """
+        return SearchResult(
+            self.best_move,
+            LeafEvaluator.centipawn_value(self.best_score),
+            self.nodes,
+            self.completed_depth,
+            self.elapsed,
+            self.principal_variation(),
+            [MoveScore(each_move, LeafEvaluator.centipawn_value(each_score), each_nodes, each_exact)
+             for each_move, each_score, each_nodes, each_exact in self.move_scores]
+        )
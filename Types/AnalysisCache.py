@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+from Types.GameLog import decode_move, encode_move
+from Types.LookupTables import CACHE_DIRECTORY_VARIABLE
+
+ANALYSIS_FORMAT_VERSION: int = 2  # Bumped whenever the schema or the meaning of the stored values change
+ANALYSIS_CACHE_ENTRIES: int = 1 << 20  # The amount of positions kept before the least valuable ones are evicted
+ANALYSIS_BATCH_SIZE: int = 64  # The amount of writes buffered before they are committed in one transaction
+EVICTION_SLACK: float = 0.1  # The fraction of the cap evicted at once, so eviction does not run on every flush
+BUSY_TIMEOUT: float = 5  # The seconds a write waits for another process to commit before giving up
+
+
+@dataclass
+class AnalysisEntry:
+    """
+    Represents what a finished search learned about a position, kept across processes and restarts
+
+    :var: key - The position hash of the position, side to move included
+    :var: best_move - The best move found from the position, in the format [from_x, from_y, to_x, to_y]
+    :var: score - The expected result of the best move for the player making it, from 0 (loss) to 1 (win)
+    :var: visits - The amount of times the search visited the position
+    :var: depth - The deepest ply the search reached below the position
+    :var: best_move_visits - The amount of those visits that went through the best move
+    """
+    key: int
+    best_move: Optional[List[int]]
+    score: float
+    visits: int
+    depth: int
+    best_move_visits: int = 0
+
+
+class AnalysisCache:
+    """
+    A persistent store of search results, keyed by position hash, so positions searched by any process, before or
+    since the last restart, are not searched from nothing again. It is backed by an SQLite database in write-ahead
+    logging mode, https://www.sqlite.org/wal.html, so any amount of processes read it while one of them writes.
+
+    Results are buffered and written ANALYSIS_BATCH_SIZE at a time, in one transaction, a result only replacing the
+    stored result of its position if it is backed by at least as many visits. Lookups of buffered results are answered
+    from the buffer. Once the database holds more than `max_entries` positions, the shallowest analyses are evicted
+    first, and the least recently used among analyses of the same depth.
+
+    A cache is safe to share between the threads of a process. A forked process opens its own connection.
+    """
+
+    def __init__(self: AnalysisCache, path: str | None = None, max_entries: int = ANALYSIS_CACHE_ENTRIES,
+                 batch_size: int = ANALYSIS_BATCH_SIZE) -> None:
+        """
+        Opens the cache, creating the database if it does not exist yet
+
+        :param path: The path to the database, defaults to `cache_path()`
+        :param max_entries: The amount of positions kept before the least valuable ones are evicted
+        :param batch_size: The amount of writes buffered before they are committed
+        """
+        self.path: str = path if path is not None else AnalysisCache.cache_path()
+        self.max_entries: int = max_entries
+        self.batch_size: int = max(batch_size, 1)
+        self.lock: threading.Lock = threading.Lock()
+        self.pending: Dict[int, AnalysisEntry] = {}  # The buffered results, by key
+        self.touched: Set[int] = set()  # The keys looked up since the last flush, their use recorded on the next one
+        self.hits: int = 0
+        self.misses: int = 0
+        self.connection: sqlite3.Connection | None = None
+        self.process_id: int = 0
+        self.connect()
+
+    @staticmethod
+    def cache_path() -> str:
+        """
+        Finds where the database lives, next to the lookup table cache, in the directory named by the
+        CHESS_PREDICTOR_CACHE environment variable, or in ~/.cache/ChessPredictor otherwise
+
+        :return: The path to the database
+        """
+        directory = os.environ.get(CACHE_DIRECTORY_VARIABLE) or \
+            os.path.join(os.path.expanduser("~"), ".cache", "ChessPredictor")
+        return os.path.join(directory, "analysis-v{}.sqlite".format(ANALYSIS_FORMAT_VERSION))
+
+    @staticmethod
+    def to_column(key: int) -> int:
+        """
+        Converts an unsigned 64 bit position hash to the signed integer SQLite stores
+
+        :param key: The position hash
+        :return: The key column value
+        """
+        return key - (1 << 64) if key >= 1 << 63 else key
+
+    def connect(self: AnalysisCache) -> sqlite3.Connection:
+        """
+        Opens the connection of the calling process, creating the table if needed. A connection inherited through a
+        fork is abandoned, never closed, as its parent is still using it.
+
+        :return: The connection
+        """
+        if self.connection is not None and self.process_id == os.getpid():
+            return self.connection
+        directory = os.path.dirname(self.path)
+        if directory != "":
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False,
+                                          isolation_level=None)
+        self.process_id = os.getpid()
+        self.pending = {}
+        self.touched = set()
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS analysis ("
+            "key INTEGER PRIMARY KEY, best_move INTEGER, score REAL NOT NULL, visits INTEGER NOT NULL, "
+            "depth INTEGER NOT NULL, best_move_visits INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS analysis_eviction ON analysis (depth, last_used)")
+        return self.connection
+
+    def lookup(self: AnalysisCache, key: int) -> AnalysisEntry | None:
+        """
+        Looks up the stored result of the position supplied, marking it as recently used, the use being written along
+        with the next batch
+
+        :param key: The position hash of the position
+        :return: The stored result, or None if the position has not been searched
+        """
+        with self.lock:
+            connection = self.connect()
+            entry = self.pending.get(key)
+            if entry is None:
+                row = connection.execute(
+                    "SELECT best_move, score, visits, depth, best_move_visits FROM analysis WHERE key = ?",
+                    (AnalysisCache.to_column(key),)
+                ).fetchone()
+                if row is not None:
+                    entry = AnalysisEntry(key, decode_move(row[0]) if row[0] is not None else None, row[1], row[2],
+                                          row[3], row[4])
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.touched.add(key)
+            if len(self.touched) >= self.batch_size:
+                self.write_pending()
+            return entry
+
+    def record(self: AnalysisCache, entry: AnalysisEntry) -> None:
+        """
+        Buffers the result of a search, writing the buffer once it holds `batch_size` results
+
+        :param entry: The result to store
+        :return: None
+        """
+        with self.lock:
+            self.connect()
+            buffered = self.pending.get(entry.key)
+            if buffered is None or entry.visits >= buffered.visits:
+                self.pending[entry.key] = entry
+            if len(self.pending) >= self.batch_size:
+                self.write_pending()
+
+    def flush(self: AnalysisCache) -> None:
+        """
+        Writes every buffered result, and the use of every position looked up
+
+        :return: None
+        """
+        with self.lock:
+            self.connect()
+            self.write_pending()
+
+    def write_pending(self: AnalysisCache) -> None:
+        """
+        Writes the buffer in one transaction, then evicts the least valuable positions if the cache is over its cap.
+        The caller holds the lock.
+
+        :return: None
+        """
+        if len(self.pending) == 0 and len(self.touched) == 0:
+            return
+        now = time.time()
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "INSERT INTO analysis (key, best_move, score, visits, depth, best_move_visits, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET best_move = excluded.best_move, score = excluded.score, "
+                "visits = excluded.visits, depth = excluded.depth, best_move_visits = excluded.best_move_visits, "
+                "last_used = excluded.last_used "
+                "WHERE excluded.visits >= analysis.visits",
+                [(AnalysisCache.to_column(each_entry.key),
+                  encode_move(each_entry.best_move) if each_entry.best_move is not None else None,
+                  each_entry.score, each_entry.visits, each_entry.depth, each_entry.best_move_visits, now)
+                 for each_entry in self.pending.values()]
+            )
+            connection.executemany("UPDATE analysis SET last_used = ? WHERE key = ?",
+                                   [(now, AnalysisCache.to_column(each_key)) for each_key in self.touched])
+            excess = connection.execute("SELECT COUNT(*) FROM analysis").fetchone()[0] - self.max_entries
+            if excess > 0:
+                connection.execute(
+                    "DELETE FROM analysis WHERE key IN (SELECT key FROM analysis ORDER BY depth, last_used LIMIT ?)",
+                    (excess + int(self.max_entries * EVICTION_SLACK),)
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self.pending = {}
+        self.touched = set()
+
+    @property
+    def hit_rate(self: AnalysisCache) -> float:
+        """
+        The fraction of lookups that found their position in the cache
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0
+
+    def close(self: AnalysisCache) -> None:
+        """
+        Writes the buffer and closes the connection
+
+        :return: None
+        """
+        with self.lock:
+            if self.connection is None or self.process_id != os.getpid():
+                return
+            self.write_pending()
+            self.connection.close()
+            self.connection = None
+
+    def __len__(self: AnalysisCache) -> int:
+        with self.lock:
+            connection = self.connect()
+            self.write_pending()
+            return connection.execute("SELECT COUNT(*) FROM analysis").fetchone()[0]
+
+    def __enter__(self: AnalysisCache) -> AnalysisCache:
+        return self
+
+    def __exit__(self: AnalysisCache, *exception_info: object) -> None:
+        self.close()
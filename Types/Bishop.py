@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 from Types.ChessPiece import ChessPiece
+from Types.PieceType import PieceType
 from Types.MoveSet import InfiniteDirection
 from Types.MoveSet import MoveSet
 
@@ -8,10 +9,18 @@ if TYPE_CHECKING:
     from Types.Player import Team
 
 
+BISHOP_MOVES: Tuple[MoveSet, ...] = (MoveSet(0, 0, InfiniteDirection(False, False, True)),)
+
+
 class Bishop(ChessPiece):
     """
     Represents a Bishop piece on the chess board. https://en.wikipedia.org/wiki/Bishop_(chess)
     """
+    __slots__ = ()
+
+    piece_type: PieceType = PieceType("Bishop", BISHOP_MOVES, BISHOP_MOVES)
+    name: str = piece_type.name
+
     def __init__(self: Bishop, x: int, y: int, team: Team) -> None:
         """
         Initializes a Bishop instance, placing it at the x and y coordinates supplied
@@ -20,9 +29,5 @@ class Bishop(ChessPiece):
         :param y: The initial y coordinate where the Bishop piece is being placed
         :param team: The team the piece belongs to
         """
-        super().__init__(x, y,
-                         [MoveSet(0, 0, InfiniteDirection(False, False, True))],
-                         [MoveSet(0, 0, InfiniteDirection(False, False, True))],
-                         team)
-        self.name = "Bishop"
+        super().__init__(x, y, team)
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Set, Tuple, TYPE_CHECKING
+from Types.Helpers import piece_value
 from Types.Player import Team
+from Types.Zobrist import ZOBRIST
 
 if TYPE_CHECKING:
     from Types.ChessPiece import ChessPiece
@@ -32,6 +34,10 @@ class Board:
             row = []
         self.player_one: Optional[Player] = None
         self.player_two: Optional[Player] = None
+        self.zobrist_hash: int = 0
+        self.pawn_hash: int = 0  # The Zobrist hash of the pawns alone, keying the pawn structure cache
+        self.halfmove_clock: int = 0
+        self.hash_history: List[int] = [self.zobrist_hash]
 
     def set_player_one(self: Board, player: Player) -> Board:
         """
@@ -66,6 +72,10 @@ class Board:
         self.board[y][x] = chess_piece
         chess_piece.x = x
         chess_piece.y = y
+        piece_key = ZOBRIST.piece_key(chess_piece, x, y, self.width)
+        self.zobrist_hash ^= piece_key
+        if chess_piece.name == "Pawn":
+            self.pawn_hash ^= piece_key
         return self
 
     def remove_piece(self: Board, x: int, y: int) -> ChessPiece | None:
@@ -79,6 +89,11 @@ class Board:
         """
         removed_piece = self.board[y][x]
         self.board[y][x] = None
+        if removed_piece is not None:
+            piece_key = ZOBRIST.piece_key(removed_piece, x, y, self.width)
+            self.zobrist_hash ^= piece_key
+            if removed_piece.name == "Pawn":
+                self.pawn_hash ^= piece_key
         return removed_piece
 
     def clear(self: Board) -> Board:
@@ -88,8 +103,73 @@ class Board:
         :return: The modified Board instance
         """
         self.board = [[] * self.height]
+        self.zobrist_hash = 0
+        self.pawn_hash = 0
+        self.reset_history()
         return self
 
+    def reset_history(self: Board) -> Board:
+        """
+        Resets the fifty-move counter and the position history, making the current position the first one recorded.
+        Used whenever a position is set up from scratch rather than reached by moving pieces.
+
+        :return: The modified Board instance
+        """
+        self.halfmove_clock = 0
+        self.hash_history = [self.zobrist_hash]
+        return self
+
+    def repetition_count(self: Board) -> int:
+        """
+        Counts how many times the current position has occurred, the current occurrence included. Only positions since
+        the last capture or pawn move can repeat, and only every other ply has the same side to move, so we walk the
+        hash history back two plies at a time within the fifty-move window.
+
+        :return: The amount of times the current position has been reached
+        """
+        count = 1
+        last_index = len(self.hash_history) - 1
+        oldest_index = max(0, last_index - self.halfmove_clock)
+        for index in range(last_index - 2, oldest_index - 1, -2):
+            if self.hash_history[index] == self.zobrist_hash:
+                count += 1
+        return count
+
+    def is_insufficient_material(self: Board) -> bool:
+        """
+        Checks if neither player has enough material left to deliver checkmate, that is bare kings, a king and a single
+        minor piece against a bare king, or kings and same-colored bishops only.
+
+        :return: Whether the position is a dead draw by insufficient material
+        """
+        remaining_pieces: List[ChessPiece] = []
+        for each_row in self.board:
+            for each_piece in each_row:
+                if each_piece is not None and each_piece.name != "King":
+                    if each_piece.name not in ["Knight", "Bishop"]:
+                        return False
+                    remaining_pieces.append(each_piece)
+        if len(remaining_pieces) <= 1:
+            return True
+        if all(each_piece.name == "Bishop" for each_piece in remaining_pieces):
+            square_colors = set((each_piece.x + each_piece.y) % 2 for each_piece in remaining_pieces)
+            return len(square_colors) == 1
+        return False
+
+    def material(self: Board, team: Team) -> int:
+        """
+        Sums up the value of all pieces the team still has on the board, kings excluded
+
+        :param team: The team whose material is being counted
+        :return: The material of the team in centipawns
+        """
+        total = 0
+        for each_row in self.board:
+            for each_piece in each_row:
+                if each_piece is not None and each_piece.team == team and each_piece.name != "King":
+                    total += piece_value(each_piece.name)
+        return total
+
     def grab_piece(self, x: int, y: int) -> ChessPiece | None:
         """
         Accesses and returns the piece at indexes x and y.
@@ -139,6 +219,98 @@ class Board:
         moving_to_piece = self.grab_piece(to_x, to_y)
         return moving_to_piece is not None and moving_to_piece.team != moving_team
 
+    def attacks_square(self: Board, piece: ChessPiece, x: int, y: int,
+                       removed: Set[Tuple[int, int]] | None = None) -> bool:
+        """
+        Checks if the piece could capture on the square x, y from where it stands, without generating any moves. Pieces
+        standing on the squares in `removed` are treated as already gone, which lets sliding pieces x-ray through
+        pieces that have been traded off during an exchange.
+
+        :param piece: The piece that may be attacking the square
+        :param x: The column of the square being attacked
+        :param y: The row of the square being attacked
+        :param removed: The squares to treat as empty, in the format (x, y)
+        :return: Whether the piece attacks the square
+        """
+        delta_x = x - piece.x
+        delta_y = y - piece.y
+        if delta_x == 0 and delta_y == 0:
+            return False
+        for each_move in piece.move_set:
+            if each_move.infinite_direction is None:
+                if each_move.x == delta_x and each_move.y == delta_y:
+                    return True
+                continue
+            aligned = (each_move.infinite_direction.x and delta_y == 0) or \
+                (each_move.infinite_direction.y and delta_x == 0) or \
+                (each_move.infinite_direction.diagonal and abs(delta_x) == abs(delta_y))
+            if not aligned:
+                continue
+            step_x = (delta_x > 0) - (delta_x < 0)
+            step_y = (delta_y > 0) - (delta_y < 0)
+            current_x = piece.x + step_x
+            current_y = piece.y + step_y
+            while (current_x, current_y) != (x, y):
+                if self.board[current_y][current_x] is not None and \
+                        (removed is None or (current_x, current_y) not in removed):
+                    break
+                current_x += step_x
+                current_y += step_y
+            else:
+                return True
+        return False
+
+    def attackers_to(self: Board, x: int, y: int, team: Team,
+                     removed: Set[Tuple[int, int]] | None = None) -> List[ChessPiece]:
+        """
+        Finds all pieces of the team supplied that attack the square x, y
+
+        :param x: The column of the square being attacked
+        :param y: The row of the square being attacked
+        :param team: The team whose attackers are being looked for
+        :param removed: The squares to treat as empty, their pieces are never counted as attackers
+        :return: The attacking pieces
+        """
+        attacking_player: Player = self.player_one if self.player_one.team == team else self.player_two
+        return [each_piece for each_piece in attacking_player.pieces
+                if (removed is None or (each_piece.x, each_piece.y) not in removed)
+                and self.attacks_square(each_piece, x, y, removed)]
+
+    def static_exchange_evaluation(self: Board, from_x: int, from_y: int, to_x: int, to_y: int) -> int:
+        """
+        Statically evaluates the exchange started by moving the piece at from_x, from_y onto to_x, to_y,
+        https://www.chessprogramming.org/Static_Exchange_Evaluation. Both sides keep recapturing on the square with
+        their least valuable attacker, each side being free to stop once recapturing no longer pays off. No moves are
+        made on the board, the exchange is resolved purely from attack information.
+
+        :param from_x: The column of the piece starting the exchange
+        :param from_y: The row of the piece starting the exchange
+        :param to_x: The column of the square being exchanged on
+        :param to_y: The row of the square being exchanged on
+        :return: The material the moving side expects to win, in centipawns, negative if the capture loses material
+        """
+        moving_piece = self.grab_piece(from_x, from_y)
+        target_piece = self.grab_piece(to_x, to_y)
+        gains: List[int] = [piece_value(target_piece.name) if target_piece is not None else 0]
+        removed: Set[Tuple[int, int]] = {(from_x, from_y), (to_x, to_y)}
+        piece_on_square_value = piece_value(moving_piece.name)
+        side = Team.BLACK if moving_piece.team == Team.WHITE else Team.WHITE
+        while True:
+            attackers = self.attackers_to(to_x, to_y, side, removed)
+            if len(attackers) == 0:
+                break
+            least_valuable_attacker = min(attackers, key=lambda each_piece: piece_value(each_piece.name))
+            #  the speculative gain if the side recaptures, assuming it loses the recapturing piece afterwards
+            gains.append(piece_on_square_value - gains[-1])
+            piece_on_square_value = piece_value(least_valuable_attacker.name)
+            removed.add((least_valuable_attacker.x, least_valuable_attacker.y))
+            side = Team.BLACK if side == Team.WHITE else Team.WHITE
+        #  negamax the gains back to the first capture, each side picking between recapturing and standing pat
+        while len(gains) > 1:
+            last_gain = gains.pop()
+            gains[-1] = -max(-gains[-1], last_gain)
+        return gains[0]
+
     def capture_piece(self: Board, to_x: int, to_y: int, moving_team: Team) -> ChessPiece:
         """
         Captures the piece at the coordinates `to_x` and `to_y`.
@@ -196,13 +368,18 @@ class Board:
         removed_piece: ChessPiece | None = None
         moving_player = self.player_one if self.player_one.team == moving_team else self.player_two
         if self.validate_move(to_x, to_y, moving_team):
-            if self.is_capture(to_x, to_y, moving_team):
+            is_capture = self.is_capture(to_x, to_y, moving_team)
+            if is_capture:
                 self.capture_piece(to_x, to_y, moving_team)
             removed_piece = self.remove_piece(from_x, from_y)
             self.place_piece(removed_piece, to_x, to_y)
             removed_piece_index = moving_player.pieces.index(removed_piece)
             moving_player.pieces.remove(removed_piece)
             moving_player.pieces.insert(removed_piece_index, removed_piece)
+            #  captures and pawn moves are irreversible, so they reset the fifty-move counter and no earlier position
+            #  can repeat after them
+            self.halfmove_clock = 0 if is_capture or removed_piece.name == "Pawn" else self.halfmove_clock + 1
+            self.hash_history.append(self.zobrist_hash)
         return self
 
     def set_board(self: Board, player_1: Player, player_2: Player) -> Board:
@@ -214,6 +391,7 @@ class Board:
         :return: The Board instance
         """
         for piece_1, piece_2 in zip(player_1.pieces, player_2.pieces):
-            self.board[piece_1.y][piece_1.x] = piece_1
-            self.board[piece_2.y][piece_2.x] = piece_2
+            self.place_piece(piece_1, piece_1.x, piece_1.y)
+            self.place_piece(piece_2, piece_2.x, piece_2.y)
+        self.reset_history()
         return self
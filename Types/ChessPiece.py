@@ -1,38 +1,68 @@
 from __future__ import annotations
-from typing import List, TYPE_CHECKING
+from typing import Dict, List, Tuple, TYPE_CHECKING
+from Types.LookupTables import LOOKUP_TABLES
 
 if TYPE_CHECKING:
     from Types.MoveSet import MoveSet
+    from Types.PieceType import PieceType
     from Types.Player import Team
     from Types.Board import Board
 
 
 class ChessPiece:
     """
-    Represents a ChessPiece, contains fields x, y, and move_set.
+    Represents a ChessPiece, contains fields x, y, and team. Everything pieces of one type share, such as the name and
+    the move_set, lives on the PieceType descriptor of the piece's class, so each piece only holds its square and team.
 
     :var: x - The x coordinate
     :var: y - The y coordinate
-    :var: move_set - The moveset of the piece
+    :var: team - The team of the piece
+    :var: piece_type - The shared descriptor of the piece's type, set by each subclass
 
     """
-    def __init__(self: ChessPiece, x: int, y: int, move_set: List[MoveSet], capture_moves: List[MoveSet], team: Team):
+    __slots__ = ("x", "y", "team")
+
+    piece_type: PieceType | None = None
+    name: str = ''
+
+    def __init__(self: ChessPiece, x: int, y: int, team: Team):
         """
-        Initializes a new instance of the ChessPiece, which holds all the necessities for a chess piece, such as the
-        x and y coordinates, the move_set, capture_moves, and the team
+        Initializes a new instance of the ChessPiece, which holds the x and y coordinates, and the team
 
         :param x: The column where the piece is being placed
         :param y: The row where the piece is being placed
-        :param move_set: The move set of the piece
-        :param capture_moves: The capture moves of the piece
         :param team: The team of the piece
         """
         self.x = x
         self.y = y
-        self.move_set = move_set
-        self.capture_moves = capture_moves
         self.team = team
-        self.name = ''
+
+    @property
+    def move_set(self: ChessPiece) -> Tuple[MoveSet, ...]:
+        """
+        The move set of the piece, shared by every piece of its type
+        """
+        return self.piece_type.move_set
+
+    @property
+    def capture_moves(self: ChessPiece) -> Tuple[MoveSet, ...]:
+        """
+        The capture moves of the piece, shared by every piece of its type
+        """
+        return self.piece_type.capture_moves
+
+    def __copy__(self: ChessPiece) -> ChessPiece:
+        copied_piece = object.__new__(type(self))
+        copied_piece.x = self.x
+        copied_piece.y = self.y
+        copied_piece.team = self.team
+        return copied_piece
+
+    def __deepcopy__(self: ChessPiece, memo: Dict[int, object]) -> ChessPiece:
+        #  the team is an enum and the piece type is shared, so there is nothing deeper to copy
+        copied_piece = self.__copy__()
+        memo[id(self)] = copied_piece
+        return copied_piece
 
     def set_team(self: ChessPiece, team: Team) -> ChessPiece:
         """
@@ -53,104 +83,36 @@ class ChessPiece:
 
         :return: All the possible moves the chess piece can make
         """
-        #  check if move is infinite, if so, we generate a large amount of them
-        #  While cycling through coordinates, check if piece is on spot, if it is, then break out of the loop
+        #  check if move is infinite, if so, we walk the precomputed rays of each direction it can move in
+        #  While walking a ray, check if piece is on spot, if it is, then break out of the loop
 
-        infinite_moves = [x for x in filter(lambda move: move.infinite_direction is not None, self.move_set)]
+        ray_indexes = self.piece_type.ray_indexes
         potential_moves = []
-        if len(infinite_moves) > 0:
+        square = self.y * 8 + self.x
+        if len(ray_indexes) > 0:
             #  we have infinite moves, time to generate tons of potential moves we can make!
-            for each_infinite_move in infinite_moves:
-                if each_infinite_move.infinite_direction.x:
-                    #  can move infinitely in the x
-                    x_moving_left = self.x - 1
-                    while x_moving_left >= 0:
-                        if board.grab_piece(x_moving_left, self.y) is not None:
-                            if board.grab_piece(x_moving_left, self.y).team != self.team:
-                                potential_moves.append([x_moving_left, self.y])
-                            break
-                        potential_moves.append([x_moving_left, self.y])
-                        x_moving_left -= 1
-                    x_moving_right = self.x + 1
-                    while x_moving_right < 8:
-                        if board.grab_piece(x_moving_right, self.y) is not None:
-                            if board.grab_piece(x_moving_right, self.y).team != self.team:
-                                potential_moves.append([x_moving_right, self.y])
-                            break
-                        potential_moves.append([x_moving_right, self.y])
-                        x_moving_right += 1
-                elif each_infinite_move.infinite_direction.y:
-                    #  can move infinitely in the y
-                    y_moving_up = self.y - 1
-                    while y_moving_up >= 0:
-                        if board.grab_piece(self.x, y_moving_up) is not None:
-                            if board.grab_piece(self.x, y_moving_up).team != self.team:
-                                potential_moves.append([self.x, y_moving_up])
-                            break
-                        potential_moves.append([self.x,  y_moving_up])
-                        y_moving_up -= 1
-                    y_moving_down = self.y + 1
-                    while y_moving_down < 8:
-                        if board.grab_piece(self.x, y_moving_down) is not None:
-                            if board.grab_piece(self.x, y_moving_down).team != self.team:
-                                potential_moves.append([self.x, y_moving_down])
-                            break
-                        potential_moves.append([self.x, y_moving_down])
-                        y_moving_down += 1
-                elif each_infinite_move.infinite_direction.diagonal:
-                    #  can move infinitely in the diagonal direction
-                    diag_up_right_x = self.x + 1
-                    diag_up_right_y = self.y - 1
-                    while diag_up_right_y >= 0 and diag_up_right_x < 8:
-                        if board.grab_piece(diag_up_right_x, diag_up_right_y) is not None:
-                            if board.grab_piece(diag_up_right_x, diag_up_right_y).team != self.team:
-                                potential_moves.append([diag_up_right_x, diag_up_right_y])
-                            break
-                        potential_moves.append([diag_up_right_x, diag_up_right_y])
-                        diag_up_right_x += 1
-                        diag_up_right_y -= 1
-
-                    diag_up_left_x = self.x - 1
-                    diag_up_left_y = self.y - 1
-                    while diag_up_left_x >= 0 and diag_up_left_y >= 0:
-                        if board.grab_piece(diag_up_left_x, diag_up_left_y) is not None:
-                            if board.grab_piece(diag_up_left_x, diag_up_left_y).team != self.team:
-                                potential_moves.append([diag_up_left_x, diag_up_left_y])
-                            break
-                        potential_moves.append([diag_up_left_x, diag_up_left_y])
-                        diag_up_left_x -= 1
-                        diag_up_left_y -= 1
-
-                    diag_down_left_x = self.x - 1
-                    diag_down_left_y = self.y + 1
-                    while diag_down_left_x >= 0 and diag_down_left_y < 8:
-                        if board.grab_piece(diag_down_left_x, diag_down_left_y) is not None:
-                            if board.grab_piece(diag_down_left_x, diag_down_left_y).team != self.team:
-                                potential_moves.append([diag_down_left_x, diag_down_left_y])
-                            break
-                        potential_moves.append([diag_down_left_x, diag_down_left_y])
-                        diag_down_left_x -= 1
-                        diag_down_left_y += 1
-
-                    diag_down_right_x = self.x + 1
-                    diag_down_right_y = self.y + 1
-                    while diag_down_right_x < 8 and diag_down_right_y < 8:
-                        if board.grab_piece(diag_down_right_x, diag_down_right_y) is not None:
-                            if board.grab_piece(diag_down_right_x, diag_down_right_y).team != self.team:
-                                potential_moves.append([diag_down_right_x, diag_down_right_y])
-                            break
-                        potential_moves.append([diag_down_right_x, diag_down_right_y])
-                        diag_down_right_x += 1
-                        diag_down_right_y += 1
+            for each_ray_index in ray_indexes:
+                for ray_x, ray_y in LOOKUP_TABLES.rays[each_ray_index][square]:
+                    occupying_piece = board.board[ray_y][ray_x]
+                    if occupying_piece is not None:
+                        if occupying_piece.team != self.team:
+                            potential_moves.append([ray_x, ray_y])
+                        break
+                    potential_moves.append([ray_x, ray_y])
+            return potential_moves
+        elif self.name in LOOKUP_TABLES.leaper_targets:
+            #  we have a fixed move-set, its targets from every square are precomputed and already within the board
+            for target_x, target_y in LOOKUP_TABLES.leaper_targets[self.name][square]:
+                occupying_piece = board.board[target_y][target_x]
+                if occupying_piece is None or occupying_piece.team != self.team:
+                    potential_moves.append([target_x, target_y])
             return potential_moves
         else:
-            #  we have a fixed move-set, that means we will only generate k moves, one for each move in the move-set
-            for each_move in self.move_set:
-                modified_x = self.x + each_move.x
-                modified_y = self.y + each_move.y
+            #  a fixed move-set without precomputed targets, we generate k moves, one for each offset in the move-set
+            for offset_x, offset_y in self.piece_type.offsets:
+                modified_x = self.x + offset_x
+                modified_y = self.y + offset_y
                 if (modified_x >= 8 or modified_x < 0 or modified_y >= 8 or modified_y < 0) or board.grab_piece(modified_x, modified_y) is not None and board.grab_piece(modified_x, modified_y).team == self.team:
                     continue
                 potential_moves.append([modified_x, modified_y])
-            potential_moves = list(filter(lambda x: (x[0] < 8 and x[1] < 8) and (x[0] >= 0 and x[1] >= 0), potential_moves))
             return potential_moves
-
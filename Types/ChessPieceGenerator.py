@@ -42,6 +42,18 @@ class ChessPieceGenerator:
             }
         }
 
+    def generate_piece(self: ChessPieceGenerator, name: str, x: int, y: int) -> ChessPiece:
+        """
+        Generates a single piece for the generator's team, used when setting up a position other than the initial one
+
+        :param name: The name of the piece, such as "Pawn" or "Queen"
+        :param x: The column where the piece is being placed
+        :param y: The row where the piece is being placed
+        :return: The generated chess piece
+        """
+        piece_types = {"Bishop": Bishop, "King": King, "Knight": Knight, "Pawn": Pawn, "Queen": Queen, "Rook": Rook}
+        return piece_types[name](x, y, self.team)
+
     def generate_initial_pieces(self: ChessPieceGenerator) -> List[ChessPiece]:
         """
         Generates an array of all the starting chess pieces, configured for each respective team that requests them
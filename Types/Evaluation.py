@@ -0,0 +1,119 @@
+from __future__ import annotations
+from typing import Dict, List, TYPE_CHECKING
+from Types.Helpers import piece_value
+from Types.LookupTables import LOOKUP_TABLES, LookupTables
+from Types.PawnHashTable import PAWN_HASH_TABLE, PawnHashTable
+from Types.Player import Team
+
+if TYPE_CHECKING:
+    from Types.Board import Board
+
+PASSED_PAWN_BONUS: List[int] = [0, 10, 15, 25, 40, 60, 90, 0]  # By the amount of rows a passed pawn has advanced
+DOUBLED_PAWN_PENALTY: int = 15  # For every pawn on a file beyond the first of its team
+ISOLATED_PAWN_PENALTY: int = 15  # For every pawn with no pawn of its team on a neighbouring file
+
+
+class Evaluation:
+    """
+    Static evaluation of a position, https://www.chessprogramming.org/Evaluation, scoring the material of each player
+    along with the piece-square bonus of every piece, read from the lookup tables, and the pawn structure of each
+    player: passed pawns earn a bonus, doubled and isolated pawns a penalty. The pawn structure score is cached in a
+    PawnHashTable, keyed by the board's pawn hash.
+    """
+
+    def __init__(self: Evaluation, tables: LookupTables = LOOKUP_TABLES,
+                 pawn_table: PawnHashTable | None = PAWN_HASH_TABLE) -> None:
+        """
+        Initializes an Evaluation instance
+
+        :param tables: The lookup tables holding the piece-square tables
+        :param pawn_table: The cache of pawn structure scores, shared by default, or None to score pawns every time
+        """
+        self.tables: LookupTables = tables
+        self.pawn_table: PawnHashTable | None = pawn_table
+
+    def evaluate(self: Evaluation, board: Board) -> int:
+        """
+        Evaluates the board from white's point of view
+
+        :param board: The board to evaluate
+        :return: The score of the position in centipawns, positive when white is better
+        """
+        score = 0
+        for each_row in board.board:
+            for each_piece in each_row:
+                if each_piece is None:
+                    continue
+                piece_score = self.tables.piece_square_value(each_piece.name, each_piece.team, each_piece.x,
+                                                             each_piece.y)
+                if each_piece.name != "King":
+                    piece_score += piece_value(each_piece.name)
+                score += piece_score if each_piece.team == Team.WHITE else -piece_score
+        return score + self.pawn_structure(board)
+
+    def pawn_structure(self: Evaluation, board: Board) -> int:
+        """
+        Looks up the pawn structure score of the board in the pawn hash table, scoring and storing it on a miss
+
+        :param board: The board to evaluate
+        :return: The pawn structure score in centipawns, positive when white's pawns are better
+        """
+        if self.pawn_table is None:
+            return self.score_pawn_structure(board)
+        score = self.pawn_table.probe(board.pawn_hash)
+        if score is None:
+            score = self.score_pawn_structure(board)
+            self.pawn_table.store(board.pawn_hash, score)
+        return score
+
+    @staticmethod
+    def score_pawn_structure(board: Board) -> int:
+        """
+        Scores the pawn structure of the board, without the cache. White's pawns advance towards the last row, and
+        black's towards the first.
+
+        :param board: The board to evaluate
+        :return: The pawn structure score in centipawns, positive when white's pawns are better
+        """
+        #  the rows of every pawn, by team and by file
+        pawn_rows: Dict[Team, List[List[int]]] = {each_team: [[] for _ in range(board.width)] for each_team in Team}
+        for each_row in board.board:
+            for each_piece in each_row:
+                if each_piece is not None and each_piece.name == "Pawn":
+                    pawn_rows[each_piece.team][each_piece.x].append(each_piece.y)
+        score = 0
+        for each_team in Team:
+            sign = 1 if each_team == Team.WHITE else -1
+            own_rows = pawn_rows[each_team]
+            enemy_rows = pawn_rows[Team.BLACK if each_team == Team.WHITE else Team.WHITE]
+            for x in range(board.width):
+                if len(own_rows[x]) == 0:
+                    continue
+                neighbouring_files = [each_file for each_file in [x - 1, x, x + 1] if 0 <= each_file < board.width]
+                score -= sign * DOUBLED_PAWN_PENALTY * (len(own_rows[x]) - 1)
+                if all(len(own_rows[each_file]) == 0 for each_file in neighbouring_files if each_file != x):
+                    score -= sign * ISOLATED_PAWN_PENALTY * len(own_rows[x])
+                blockers = [enemy_y for each_file in neighbouring_files for enemy_y in enemy_rows[each_file]]
+                for y in own_rows[x]:
+                    #  a pawn is passed when no enemy pawn stands ahead of it, on its file or a neighbouring one, and
+                    #  it is not stuck behind a pawn of its own team
+                    if each_team == Team.WHITE:
+                        passed = y == max(own_rows[x]) and all(enemy_y <= y for enemy_y in blockers)
+                        advanced = y
+                    else:
+                        passed = y == min(own_rows[x]) and all(enemy_y >= y for enemy_y in blockers)
+                        advanced = board.height - 1 - y
+                    if passed:
+                        score += sign * PASSED_PAWN_BONUS[min(advanced, len(PASSED_PAWN_BONUS) - 1)]
+        return score
+
+    def evaluate_for(self: Evaluation, board: Board, team: Team) -> int:
+        """
+        Evaluates the board from the point of view of the team supplied
+
+        :param board: The board to evaluate
+        :param team: The team the score is relative to
+        :return: The score of the position in centipawns, positive when the team is better
+        """
+        score = self.evaluate(board)
+        return score if team == Team.WHITE else -score
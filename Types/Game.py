@@ -1,20 +1,33 @@
 from __future__ import annotations
 
-import random
 from copy import deepcopy
 from typing import List, TYPE_CHECKING
 from Types.ChessPieceGenerator import ChessPieceGenerator
-from Types.Helpers import flip_coin, CoinFace
+from Types.Evaluation import Evaluation
+from Types.Helpers import flip_coin, CoinFace, FEN_PIECE_NAMES
 from Types.Player import Team, Player
 from Types.GameTree import GameTree
 from Types.GameTreeNode import GameTreeNode
+from Types.MonteCarloSearch import MonteCarloSearch
+from Types.SearchResult import SearchResult
+from Types.SimulationRandom import SimulationRandom, SIMULATION_RANDOM
+from Types.Zobrist import ZOBRIST
 import time
 
+from Types.Board import Board
+
 if TYPE_CHECKING:
-    from Types.Board import Board
     from Types.Player import Player
     from Types.King import King
     from Types.ChessPiece import ChessPiece
+    from Types.TranspositionTable import TranspositionTable
+    from Types.AnalysisCache import AnalysisCache
+    from Types.LeafEvaluator import LeafEvaluator
+
+PLAYOUT_PLY_LIMIT: int = 300  # The amount of plies a playout may run before it is adjudicated
+ADJUDICATION_MARGIN: int = 300  # The lead, in centipawns, needed to win an adjudicated playout
+HINT_ITERATIONS: int = 400  # The amount of search iterations spent on scoring the moves of a selected piece
+STARTING_FEN: str = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"  # The initial position, white to move
 
 
 class Game:
@@ -22,14 +35,17 @@ class Game:
     Game instance, represents a chess game being played
     """
 
-    def __init__(self: Game, board: Board, player_1: Player, player_2: Player, turn: Team = None) -> None:
+    def __init__(self: Game, board: Board, player_1: Player, player_2: Player, turn: Team = None,
+                 rng: SimulationRandom | None = None) -> None:
         """
         Initializes a Game instance, which takes in a board, and 2 players, and sets the proper fields to prepare for the game
 
         :param board: The Board instance
         :param player_1: The Player instance, player 1
         :param player_2: The Player instance, player 2
+        :param rng: The random stream the game's coin flip and playouts draw from, defaults to the shared stream
         """
+        self.rng: SimulationRandom = rng if rng is not None else SIMULATION_RANDOM
         self.board: Board = deepcopy(board)
 
         if not turn:
@@ -45,7 +61,7 @@ class Game:
             self.board.player_one = self.player_1
             self.board.player_two = self.player_2
             self.board.set_board(self.board.player_one, self.board.player_two)
-            self.turn: Team | None = Team.BLACK if flip_coin() == CoinFace.HEADS else Team.WHITE
+            self.turn: Team | None = Team.BLACK if flip_coin(self.rng) == CoinFace.HEADS else Team.WHITE
         else:
             self.turn = turn
             self.board.player_one = deepcopy(player_1)
@@ -66,6 +82,65 @@ class Game:
             self.board.player_one.pieces = self.player_1.pieces[:]
             self.board.player_two.pieces = self.player_2.pieces[:]
 
+    @staticmethod
+    def from_fen(fen: str = STARTING_FEN, rng: SimulationRandom | None = None) -> Game:
+        """
+        Sets up a game from a position in Forsyth-Edwards Notation, https://www.chessprogramming.org/Forsyth-Edwards_Notation.
+        Castling rights and en passant squares are ignored, since the engine does not play either move.
+
+        :param fen: The position, defaults to the initial position with white to move
+        :param rng: The random stream of the game, defaults to the shared stream
+        :return: The Game instance
+        """
+        fields = fen.split()
+        board = Board()
+        white_player = Player()
+        white_player.team = Team.WHITE
+        black_player = Player()
+        black_player.team = Team.BLACK
+        generators = {Team.WHITE: ChessPieceGenerator(Team.WHITE), Team.BLACK: ChessPieceGenerator(Team.BLACK)}
+        for rank_index, each_rank in enumerate(fields[0].split("/")):
+            y = 7 - rank_index
+            file_index = 0
+            for each_character in each_rank:
+                if each_character.isdigit():
+                    file_index += int(each_character)
+                    continue
+                team = Team.WHITE if each_character.isupper() else Team.BLACK
+                x = 7 - file_index
+                board.place_piece(generators[team].generate_piece(FEN_PIECE_NAMES[each_character.lower()], x, y), x, y)
+                file_index += 1
+        board.reset_history()
+        if len(fields) > 4:
+            board.halfmove_clock = int(fields[4])
+        turn = Team.BLACK if len(fields) > 1 and fields[1] == "b" else Team.WHITE
+        return Game(board, white_player, black_player, turn, rng)
+
+    def to_fen(self: Game) -> str:
+        """
+        Describes the game's position in Forsyth-Edwards Notation
+
+        :return: The position, without castling rights or en passant squares
+        """
+        piece_letters = {name: letter for letter, name in FEN_PIECE_NAMES.items()}
+        ranks: List[str] = []
+        for y in range(7, -1, -1):
+            rank = ""
+            empty_squares = 0
+            for x in range(7, -1, -1):
+                piece = self.board.grab_piece(x, y)
+                if piece is None:
+                    empty_squares += 1
+                    continue
+                if empty_squares > 0:
+                    rank += str(empty_squares)
+                    empty_squares = 0
+                letter = piece_letters[piece.name]
+                rank += letter.upper() if piece.team == Team.WHITE else letter
+            ranks.append(rank + (str(empty_squares) if empty_squares > 0 else ""))
+        return "{} {} - - {} {}".format("/".join(ranks), "w" if self.turn == Team.WHITE else "b",
+                                        self.board.halfmove_clock, len(self.board.hash_history) // 2 + 1)
+
     def end_game(self: Game) -> None:
         """
         Ends the game, clearing the board and clearing all player's owned pieces and captured pieces
@@ -80,6 +155,23 @@ class Game:
         self.turn = Team.BLACK if self.turn == Team.WHITE else Team.WHITE
         return self
 
+    def clone(self: Game) -> Game:
+        """
+        Copies the game, the copy sharing no board or pieces with this instance, but drawing from the same random stream
+
+        :return: The copied Game instance
+        """
+        return Game(self.board, Player(self.player_1), Player(self.player_2), self.turn, self.rng)
+
+    def make_move(self: Game, move: List[int]) -> Game:
+        """
+        Copies the game and plays the move supplied on the copy, as the player whose turn it is
+
+        :param move: The move to play, in the format [from_x, from_y, to_x, to_y]
+        :return: The copied Game instance, after the move
+        """
+        return self.clone().simulate_move(move[0], move[1], move[2], move[3], self.current_player().team)
+
     def simulate_move(self: Game, from_x: int, from_y: int, to_x: int, to_y: int, team: Team) -> Game:
         """
         Simulate a move from the player currently in session, assume the move is valid. Used for the MCTS
@@ -95,51 +187,135 @@ class Game:
         self.next_turn()
         return self
 
-    def playout_game(self: Game) -> Team:
+    def current_player(self: Game) -> Player:
+        """
+        Finds the player whose turn it currently is
+
+        :return: The Player instance that is moving
+        """
+        return self.player_1 if self.turn == Team.WHITE and self.player_1.team == Team.WHITE else self.player_2
+
+    def generate_valid_moves(self: Game, player: Player | None = None) -> List[List[int]]:
         """
-        Randomly chooses moves as the user to play-out the game, until a winner is decided
+        Generates every valid move the player can make, in the format [from_x, from_y, to_x, to_y]
 
-        :return: The player that won
+        :param player: The player to generate the moves for, defaults to the player whose turn it is
+        :return: The list of valid moves
+        """
+        moving_player = player if player is not None else self.current_player()
+        all_valid_moves: List[List[int]] = []
+        for each_piece in moving_player.pieces:
+            for each_move in each_piece.generate_potential_moves(self.board):
+                if self.board.validate_move(each_move[0], each_move[1], moving_player.team):
+                    all_valid_moves.append([each_piece.x, each_piece.y] + each_move)
+        return all_valid_moves
+
+    def position_hash(self: Game) -> int:
+        """
+        Computes the Zobrist hash of the game's position, the board's placement hash combined with the side to move
+
+        :return: The 64-bit hash of the position
+        """
+        return self.board.zobrist_hash ^ ZOBRIST.side_key if self.turn == Team.BLACK else self.board.zobrist_hash
+
+    def is_draw(self: Game) -> bool:
+        """
+        Checks if the game is drawn by threefold repetition, the fifty-move rule or insufficient material
+
+        :return: Whether the game is a draw
+        """
+        return self.board.halfmove_clock >= 100 or self.board.repetition_count() >= 3 or \
+            self.board.is_insufficient_material()
+
+    def adjudicate(self: Game, margin: int = ADJUDICATION_MARGIN) -> Team | None:
+        """
+        Adjudicates an unfinished game by its static evaluation, awarding the win to a player who leads by at least the
+        margin supplied, and calling it a draw otherwise
+
+        :param margin: The lead, in centipawns, a player needs to be awarded the win
+        :return: The team that won, or None if the game is adjudicated a draw
+        """
+        balance = Evaluation().evaluate(self.board)
+        if balance >= margin:
+            return Team.WHITE
+        elif balance <= -margin:
+            return Team.BLACK
+        return None
+
+    def playout_game(self: Game, max_plies: int = PLAYOUT_PLY_LIMIT,
+                     adjudication_margin: int = ADJUDICATION_MARGIN) -> Team | None:
+        """
+        Randomly chooses moves as the user to play-out the game, until a winner is decided, the game is drawn, or the
+        ply cap is reached, in which case the game is adjudicated by its static evaluation
+
+        :param max_plies: The maximum amount of plies to play before adjudicating the game
+        :param adjudication_margin: The lead, in centipawns, needed to win an adjudicated game
+        :return: The player that won, or None if the game ended in a draw
         """
         # we check if either player is in checkmate, if not, we make a random move from the list of available moves
         # the player can make
+        if self.is_checkmate():
+            return Team.BLACK if self.turn == Team.WHITE else Team.WHITE
         current_player: Player | None = None
         total_moves: int = 0
         while not self.is_checkmate():
-            current_player: Player = self.player_1 if self.turn == Team.WHITE and self.player_1.team == Team.WHITE else self.player_2
-            all_valid_potential_moves: List[List[int]] = []
-            for each_piece in current_player.pieces:
-                all_valid_potential_moves.extend([
-                    [each_piece.x, each_piece.y] + each_move
-                    if self.board.validate_move(each_move[0], each_move[1], current_player.team)
-                    else []
-                    for each_move in each_piece.generate_potential_moves(self.board)
-                ])
-            all_valid_potential_moves = list(filter(lambda x: len(x) > 0, all_valid_potential_moves))
+            if self.is_draw():
+                return None
+            if total_moves >= max_plies:
+                return self.adjudicate(adjudication_margin)
+            current_player = self.current_player()
+            all_valid_potential_moves: List[List[int]] = self.generate_valid_moves(current_player)
+            if len(all_valid_potential_moves) == 0:
+                #  the player has no moves to make, which is a stalemate
+                return None
             all_valid_capture_moves = list(filter(lambda x: self.board.is_capture(x[2], x[3], current_player.team), all_valid_potential_moves))
+            #  only captures that do not lose material in the exchange that follows are preferred, losing captures
+            #  are left out of the random choice whenever the player has anything else to play
+            winning_capture_moves = list(filter(lambda x: self.board.static_exchange_evaluation(*x) >= 0, all_valid_capture_moves))
+            losing_capture_moves = [x for x in all_valid_capture_moves if x not in winning_capture_moves]
+            other_moves = [x for x in all_valid_potential_moves if x not in losing_capture_moves]
             random_move_choice: List[int] | None = None
-            #  print("# potential {}  |  # of capture {}".format(len(all_valid_potential_moves), len(all_valid_capture_moves)))
-            if len(all_valid_potential_moves) == 0 and len(all_valid_capture_moves) == 0:
-                self.board.print_board()
-                for each_piece in current_player.pieces:
-                    all_valid_potential_moves.extend([
-                        [each_piece.x, each_piece.y] + each_move
-                        if self.board.validate_move(each_move[0], each_move[1], current_player.team)
-                        else []
-                        for each_move in each_piece.generate_potential_moves(self.board)
-                    ])
-            if len(all_valid_capture_moves) > 0:
-                random_move_choice = random.choice(all_valid_capture_moves)
+            if len(winning_capture_moves) > 0:
+                random_move_choice = self.rng.choice(winning_capture_moves)
+            elif len(other_moves) > 0:
+                random_move_choice = self.rng.choice(other_moves)
             else:
-                random_move_choice = random.choice(all_valid_potential_moves)
+                random_move_choice = self.rng.choice(all_valid_potential_moves)
 
             self.simulate_move(random_move_choice[0], random_move_choice[1], random_move_choice[2],
                                random_move_choice[3], current_player.team)
-            #  self.board.print_board()
             total_moves += 1
-            #  print("Total Moves {}".format(total_moves))
         return current_player.team
 
+    def score_piece_moves(self: Game, x: int, y: int, iterations: int = HINT_ITERATIONS,
+                          time_limit: float | None = None,
+                          transposition_table: TranspositionTable | None = None,
+                          analysis_cache: AnalysisCache | None = None,
+                          evaluator: LeafEvaluator | None = None) -> SearchResult:
+        """
+        Scores every place the piece at x, y can move to, used when the user selects a piece. All of the piece's moves
+        are searched in one tree, restricted at the root to the piece's moves, so every candidate line shares the same
+        tree and transposition table instead of being searched separately.
+
+        :param x: The column of the selected piece
+        :param y: The row of the selected piece
+        :param iterations: The maximum amount of search iterations, raised to the amount of moves so each is visited
+        :param time_limit: The maximum amount of seconds to search for
+        :param transposition_table: The table to share statistics through, defaults to a new table
+        :param analysis_cache: The persistent store of search results, warm-starting the search with the best move of
+            the position if it is one of the piece's moves
+        :param evaluator: The evaluator scoring the leaves, such as a QuiescenceEvaluator, defaults to random playouts
+        :return: The search result, its move_scores holding the score of every destination of the piece, empty if the
+            square holds no piece of the player to move or the piece cannot move
+        """
+        piece_moves = [each_move for each_move in self.generate_valid_moves()
+                       if each_move[0] == x and each_move[1] == y]
+        if len(piece_moves) == 0:
+            return SearchResult(None, 0.5, 0, 0, 0)
+        search = MonteCarloSearch(self, piece_moves, transposition_table=transposition_table, evaluator=evaluator,
+                                  analysis_cache=analysis_cache)
+        return search.search(max(iterations, len(piece_moves)), time_limit)
+
     def is_in_kings_space(self: Game, king: King, piece: ChessPiece) -> List[bool, List[int]]:
         """
         Checks if the piece supplied to the function is occupying any space the king can potentially move to
@@ -292,6 +468,11 @@ class Game:
                 node.denominator = 0 if game.turn == Team.WHITE else 1
                 node.numerator = 0 if game.turn == Team.BLACK else 1
                 return node
+            if game.is_draw():
+                node = GameTreeNode(game)
+                node.numerator = 0.5
+                node.denominator = 0.5
+                return node
             game_clone = game
         else:
             game_clone = self
@@ -299,21 +480,18 @@ class Game:
         if depth == 10:
             play_out_result = game.playout_game()
             node = GameTreeNode(game)
-            node.numerator = 0 if play_out_result == Team.BLACK else 1
-            node.denominator = 0 if play_out_result == Team.WHITE else 1
+            if play_out_result is None:
+                #  a drawn playout counts as half a result for both sides
+                node.numerator = 0.5
+                node.denominator = 0.5
+            else:
+                node.numerator = 0 if play_out_result == Team.BLACK else 1
+                node.denominator = 0 if play_out_result == Team.WHITE else 1
             return node
         monte_carlo_tree = GameTree().set_root(GameTreeNode(game_clone))
         #  process whose turn it is, and then make a random guess for the move to make
         current_player = game_clone.player_1 if game_clone.player_1.team == Team.WHITE else game_clone.player_2
-        all_valid_potential_moves: List[List[int]] = []
-        for each_piece in current_player.pieces:
-            all_valid_potential_moves.extend([
-                [each_piece.x, each_piece.y] + each_move
-                if game_clone.board.validate_move(each_move[0], each_move[1], current_player.team)
-                else []
-                for each_move in each_piece.generate_potential_moves(game_clone.board)
-            ])
-        all_valid_potential_moves = list(filter(lambda x: len(x) > 0, all_valid_potential_moves))
+        all_valid_potential_moves: List[List[int]] = game_clone.generate_valid_moves(current_player)
         child_game_instances = []
         for each_valid_move in all_valid_potential_moves:
             child_game_instances.append(
@@ -330,9 +508,7 @@ class Game:
             monte_carlo_tree.root.add_child(GameTreeNode(each_simulated_game))
         for each_simulated_game_child in monte_carlo_tree.root.children:
             # randomly play-out each node
-            print("simulating")
             simulation_result = game_clone.monte_carlo(each_simulated_game_child.value, depth + 1)
-            print("simulating done")
             monte_carlo_tree.root.denominator += simulation_result.denominator
             monte_carlo_tree.root.numerator += simulation_result.numerator
         max_denominator = 0
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import mmap
+import os
+import sys
+from array import array
+from dataclasses import dataclass, field
+from struct import Struct
+from typing import Iterator, List
+from Types.Player import Team
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+GAME_LOG_MAGIC: bytes = b"CPGL"  # Marks a file as a game log
+GAME_LOG_FORMAT_VERSION: int = 1  # Bumped whenever the layout of the log changes
+GAME_LOG_HEADER: Struct = Struct("<4sI")  # The magic and the format version
+RECORD_LENGTH: Struct = Struct("<I")  # The length of a record, in bytes, not counting the length itself
+RECORD_HEADER: Struct = Struct("<IBxH")  # The amount of moves, the result, and the length of the starting position
+INDEX_SUFFIX: str = ".idx"  # Appended to the log's path to name its index of record offsets
+
+RESULT_WHITE: int = 0  # White won the game
+RESULT_BLACK: int = 1  # Black won the game
+RESULT_DRAW: int = 2  # The game was drawn
+
+
+def encode_move(move: List[int]) -> int:
+    """
+    Packs a move into 16 bits, the from square in bits 0-5 and the to square in bits 6-11, squares counted y * 8 + x.
+    Bits 12-15 are left for move flags, such as promotions, which the engine does not play yet.
+
+    :param move: The move, in the format [from_x, from_y, to_x, to_y]
+    :return: The 16 bit code of the move
+    """
+    return (move[1] * 8 + move[0]) | (move[3] * 8 + move[2]) << 6
+
+
+def decode_move(code: int) -> List[int]:
+    """
+    Unpacks a move packed by `encode_move`
+
+    :param code: The 16 bit code of the move
+    :return: The move, in the format [from_x, from_y, to_x, to_y]
+    """
+    from_square = code & 0x3F
+    to_square = (code >> 6) & 0x3F
+    return [from_square % 8, from_square // 8, to_square % 8, to_square // 8]
+
+
+@dataclass
+class GameRecord:
+    """
+    A game read from a game log
+
+    :var: winner - The team that won, or None if the game was drawn
+    :var: moves - The moves played, in the format [from_x, from_y, to_x, to_y]
+    :var: fen - The starting position, in Forsyth-Edwards Notation, or None for the initial position
+    """
+    winner: Team | None
+    moves: List[List[int]] = field(default_factory=list)
+    fen: str | None = None
+
+
+class GameLogWriter:
+    """
+    Appends games to a game log, a compact binary file of length-prefixed records, each move taking 2 bytes. Next to
+    the log, an index file holds the offset of every record, as 8 byte integers, so a game's id is its position in the
+    index.
+
+    Several writers, in separate processes, may append to the same log. Each append takes an exclusive lock on the
+    log, where the platform supports it, and writes the record before its index entry, so a reader never sees an
+    index entry for a record that is not there yet. Everything is stored little-endian.
+    """
+
+    def __init__(self: GameLogWriter, path: str) -> None:
+        """
+        Opens a log for appending, creating it if it does not exist yet
+
+        :param path: The path of the log
+        """
+        self.path: str = path
+        self.log_file = open(path, "ab")
+        self.index_file = open(path + INDEX_SUFFIX, "ab")
+
+    def append(self: GameLogWriter, moves: List[List[int]], winner: Team | None, fen: str | None = None) -> int:
+        """
+        Appends a game to the log
+
+        :param moves: The moves played, in the format [from_x, from_y, to_x, to_y]
+        :param winner: The team that won, or None if the game was drawn
+        :param fen: The starting position, or None if the game started from the initial position
+        :return: The id of the game
+        """
+        encoded_fen = fen.encode("ascii") if fen is not None else b""
+        result = RESULT_DRAW if winner is None else RESULT_WHITE if winner == Team.WHITE else RESULT_BLACK
+        codes = array("H", [encode_move(each_move) for each_move in moves])
+        if sys.byteorder == "big":
+            codes.byteswap()
+        payload = RECORD_HEADER.pack(len(moves), result, len(encoded_fen)) + encoded_fen + codes.tobytes()
+        if fcntl is not None:
+            fcntl.flock(self.log_file.fileno(), fcntl.LOCK_EX)
+        try:
+            offset = os.fstat(self.log_file.fileno()).st_size
+            if offset == 0:
+                self.log_file.write(GAME_LOG_HEADER.pack(GAME_LOG_MAGIC, GAME_LOG_FORMAT_VERSION))
+                offset = GAME_LOG_HEADER.size
+            self.log_file.write(RECORD_LENGTH.pack(len(payload)) + payload)
+            self.log_file.flush()
+            game_id = os.fstat(self.index_file.fileno()).st_size // 8
+            self.index_file.write(offset.to_bytes(8, "little"))
+            self.index_file.flush()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self.log_file.fileno(), fcntl.LOCK_UN)
+        return game_id
+
+    def close(self: GameLogWriter) -> None:
+        self.log_file.close()
+        self.index_file.close()
+
+    def __enter__(self: GameLogWriter) -> GameLogWriter:
+        return self
+
+    def __exit__(self: GameLogWriter, *exception_info: object) -> None:
+        self.close()
+
+
+class GameLogReader:
+    """
+    Reads games from a game log, by id or in order, through a memory map of the log. Only the games appended before
+    the reader was opened, or last refreshed, are visible.
+    """
+
+    def __init__(self: GameLogReader, path: str) -> None:
+        """
+        Opens a log for reading
+
+        :param path: The path of the log
+        """
+        self.path: str = path
+        self.log_file = open(path, "rb")
+        self.log_map: mmap.mmap | None = None
+        self.offsets: array = array("Q")
+        self.refresh()
+
+    def refresh(self: GameLogReader) -> GameLogReader:
+        """
+        Maps the log again, making the games appended since the reader was opened visible
+
+        :return: The reader
+        """
+        with open(self.path + INDEX_SUFFIX, "rb") as index_file:
+            index_bytes = index_file.read()
+        self.offsets = array("Q")
+        self.offsets.frombytes(index_bytes[:len(index_bytes) // 8 * 8])
+        if sys.byteorder == "big":
+            self.offsets.byteswap()
+        if self.log_map is not None:
+            self.log_map.close()
+            self.log_map = None
+        if os.fstat(self.log_file.fileno()).st_size > 0:
+            self.log_map = mmap.mmap(self.log_file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version = GAME_LOG_HEADER.unpack_from(self.log_map, 0)
+            if magic != GAME_LOG_MAGIC or version != GAME_LOG_FORMAT_VERSION:
+                raise ValueError("{} is not a version {} game log".format(self.path, GAME_LOG_FORMAT_VERSION))
+        return self
+
+    def read(self: GameLogReader, game_id: int) -> GameRecord:
+        """
+        Reads a single game
+
+        :param game_id: The id of the game, as returned by GameLogWriter.append
+        :return: The game
+        """
+        offset = self.offsets[game_id] + RECORD_LENGTH.size
+        move_count, result, fen_length = RECORD_HEADER.unpack_from(self.log_map, offset)
+        offset += RECORD_HEADER.size
+        fen = bytes(self.log_map[offset:offset + fen_length]).decode("ascii") if fen_length > 0 else None
+        offset += fen_length
+        codes = array("H")
+        codes.frombytes(self.log_map[offset:offset + move_count * 2])
+        if sys.byteorder == "big":
+            codes.byteswap()
+        winner = None if result == RESULT_DRAW else Team.WHITE if result == RESULT_WHITE else Team.BLACK
+        return GameRecord(winner, [decode_move(each_code) for each_code in codes], fen)
+
+    def __len__(self: GameLogReader) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self: GameLogReader, game_id: int) -> GameRecord:
+        return self.read(game_id)
+
+    def __iter__(self: GameLogReader) -> Iterator[GameRecord]:
+        for game_id in range(len(self.offsets)):
+            yield self.read(game_id)
+
+    def close(self: GameLogReader) -> None:
+        if self.log_map is not None:
+            self.log_map.close()
+        self.log_file.close()
+
+    def __enter__(self: GameLogReader) -> GameLogReader:
+        return self
+
+    def __exit__(self: GameLogReader, *exception_info: object) -> None:
+        self.close()
@@ -1,22 +1,41 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from contextlib import nullcontext
+from typing import Callable, ContextManager, List, Set, TYPE_CHECKING
+from Types.Helpers import deep_getsizeof
 
 if TYPE_CHECKING:
     from Types.GameTreeNode import GameTreeNode
 
+EVICTION_WATERMARK: float = 0.9  # Eviction frees nodes until the tree is back under this fraction of its budget
+
 
 class GameTree:
     """
     Represents a game tree, https://en.wikipedia.org/wiki/Game_tree, the one being used for chess in this instance will
     be utilizing the minmax algorithm, set to 10 plies ahead, and utilizing as well the alpha-beta pruning to maximize
     the efficiency of analyzing the tree.
+
+    The tree can be given a budget, either in nodes or in bytes. Once attaching a node takes the tree over its budget,
+    the least visited subtrees are collapsed: their nodes keep their own statistics, but drop their children, and are
+    expanded again should the search come back to them.
     """
 
-    def __init__(self: GameTree) -> None:
+    def __init__(self: GameTree, max_nodes: int | None = None, max_bytes: int | None = None) -> None:
         """
         Initializes a GameTree instance with a root equal to None
+
+        :param max_nodes: The maximum amount of nodes the tree holds, unlimited if None
+        :param max_bytes: The maximum amount of memory the tree holds, in bytes, unlimited if None
         """
         self.root: GameTreeNode | None = None
+        self.max_nodes: int | None = max_nodes
+        self.max_bytes: int | None = max_bytes
+        self.bytes_per_node: int = 0
+        self.node_count: int = 0
+        self.hits: int = 0  # The amount of times the search reused a node already in the tree
+        self.expansions: int = 0  # The amount of nodes attached to the tree
+        self.collapses: int = 0  # The amount of subtrees collapsed by eviction
+        self.evictions: int = 0  # The amount of nodes freed by eviction
 
     def set_root(self, node: GameTreeNode):
         """
@@ -26,5 +45,114 @@ class GameTree:
         :return: The tree instance
         """
         self.root = node
+        node.parent = None
+        self.node_count = GameTree.subtree_size(node)
+        if self.max_bytes is not None and self.bytes_per_node == 0:
+            #  every node holds a full Game snapshot, which dwarfs the node itself, so measuring the root once gives
+            #  a good estimate for all of them
+            self.bytes_per_node = deep_getsizeof(node)
         return self
 
+    @staticmethod
+    def subtree_size(node: GameTreeNode) -> int:
+        """
+        Counts the nodes in the subtree rooted at the node supplied, the node included
+
+        :param node: The root of the subtree
+        :return: The amount of nodes in the subtree
+        """
+        size = 0
+        pending: List[GameTreeNode] = [node]
+        while len(pending) > 0:
+            current = pending.pop()
+            size += 1
+            pending.extend(current.children)
+        return size
+
+    def contains(self: GameTree, node: GameTreeNode) -> bool:
+        """
+        Checks if the node is still attached to the tree, by walking its ancestors up to the root
+
+        :param node: The node to look for
+        :return: Whether the node is in the tree
+        """
+        while node.parent is not None:
+            node = node.parent
+        return node is self.root
+
+    def node_budget(self: GameTree) -> int | None:
+        """
+        Computes the maximum amount of nodes the tree may hold, from whichever of its budgets is the tightest
+
+        :return: The maximum amount of nodes, or None if the tree is unlimited
+        """
+        budgets: List[int] = []
+        if self.max_nodes is not None:
+            budgets.append(self.max_nodes)
+        if self.max_bytes is not None and self.bytes_per_node > 0:
+            budgets.append(self.max_bytes // self.bytes_per_node)
+        return max(min(budgets), 1) if len(budgets) > 0 else None
+
+    def attach(self: GameTree, parent: GameTreeNode, child: GameTreeNode,
+               node_lock: Callable[[GameTreeNode], ContextManager] | None = None) -> GameTreeNode:
+        """
+        Adds the child to the parent, evicting cold subtrees if the tree goes over its budget. The new child and its
+        ancestors are never evicted.
+
+        :param parent: The node already in the tree
+        :param child: The node being attached
+        :param node_lock: Finds the lock guarding the children and moves of a node, held while it is collapsed, for
+            trees searched by several threads
+        :return: The attached child
+        """
+        parent.add_child(child)
+        self.node_count += 1
+        self.expansions += 1
+        budget = self.node_budget()
+        if budget is not None and self.node_count > budget:
+            self.evict(int(budget * EVICTION_WATERMARK), child, node_lock)
+        return child
+
+    def evict(self: GameTree, target_count: int, protected: GameTreeNode | None = None,
+              node_lock: Callable[[GameTreeNode], ContextManager] | None = None) -> int:
+        """
+        Collapses the least visited subtrees until the tree holds at most `target_count` nodes, or nothing more can be
+        collapsed. A collapsed node keeps its statistics, but its children are dropped and its moves are generated anew
+        if the search expands it again.
+
+        :param target_count: The amount of nodes to bring the tree down to
+        :param protected: A node that must stay in the tree, along with all of its ancestors
+        :param node_lock: Finds the lock guarding the children and moves of a node, held while it is collapsed
+        :return: The amount of nodes freed
+        """
+        protected_nodes: Set[int] = set()
+        while protected is not None:
+            protected_nodes.add(id(protected))
+            protected = protected.parent
+        candidates: List[GameTreeNode] = []
+        pending: List[GameTreeNode] = list(self.root.children)
+        while len(pending) > 0:
+            current = pending.pop()
+            if len(current.children) > 0:
+                if id(current) not in protected_nodes:
+                    candidates.append(current)
+                pending.extend(current.children)
+        candidates.sort(key=lambda each_node: each_node.denominator)
+        freed = 0
+        for each_candidate in candidates:
+            if self.node_count <= target_count:
+                break
+            if len(each_candidate.children) == 0 or not self.contains(each_candidate):
+                #  already freed along with a colder ancestor
+                continue
+            with node_lock(each_candidate) if node_lock is not None else nullcontext():
+                removed = GameTree.subtree_size(each_candidate) - 1
+                for each_child in each_candidate.children:
+                    each_child.parent = None
+                each_candidate.children = []
+                each_candidate.untried_moves = None
+            self.node_count -= removed
+            freed += removed
+            self.collapses += 1
+        self.evictions += freed
+        return freed
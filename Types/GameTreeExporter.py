@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Dict, List, TextIO, Tuple, TYPE_CHECKING
+from Types.Helpers import move_name
+from Types.Player import Team
+
+if TYPE_CHECKING:
+    from Types.GameTree import GameTree
+    from Types.GameTreeNode import GameTreeNode
+
+
+class GameTreeExporter:
+    """
+    Streams the statistics of a search tree to a JSON-lines file for offline analysis, one line per node, written
+    depth-first so every node comes right after its parent. Each line holds the node's id, its parent's id, its depth,
+    the move leading to it, whose turn it is, its numerator, denominator and score, the amount of children it has, and
+    the Zobrist hash of its position.
+
+    The walk keeps one entry per node on the current path, the node and the index of its next child, so it never holds
+    more than a single path, and never copies the nodes' games. The tree may be exported while it is being searched,
+    the statistics written being those of the moment each node is reached, though nodes attached or evicted during
+    the walk may be missed.
+    """
+
+    def __init__(self: GameTreeExporter, min_visits: float = 1, max_depth: int | None = None) -> None:
+        """
+        Initializes the exporter
+
+        :param min_visits: The denominator a node needs to be exported, the nodes below it are skipped too
+        :param max_depth: The deepest ply exported, the root being ply 0, unlimited if None
+        """
+        self.min_visits: float = min_visits
+        self.max_depth: int | None = max_depth
+
+    def describe(self: GameTreeExporter, node: GameTreeNode, node_id: int, parent_id: int | None,
+                 depth: int) -> Dict[str, object]:
+        """
+        Describes a node as one line of the export
+
+        :param node: The node to describe
+        :param node_id: The id of the node, its position in the export
+        :param parent_id: The id of the node's parent, None for the root
+        :param depth: The ply of the node, the root being ply 0
+        :return: The fields of the node's line
+        """
+        return {
+            "id": node_id,
+            "parent": parent_id,
+            "depth": depth,
+            "move": move_name(node.move) if node.move is not None else None,
+            "turn": "w" if node.value.turn == Team.WHITE else "b",
+            "numerator": node.numerator,
+            "denominator": node.denominator,
+            "score": node.numerator / node.denominator if node.denominator > 0 else None,
+            "children": len(node.children),
+            "hash": node.value.position_hash(),
+        }
+
+    def export(self: GameTreeExporter, tree: GameTree, output: str | TextIO) -> int:
+        """
+        Writes the tree, depth-first, as JSON lines
+
+        :param tree: The tree to export
+        :param output: The stream to write to, or the path of the file to write, compressed with gzip if it ends in .gz
+        :return: The amount of nodes written
+        """
+        if isinstance(output, str):
+            with (gzip.open(output, "wt") if output.endswith(".gz") else open(output, "w")) as output_file:
+                return self.export(tree, output_file)
+        if tree.root is None or tree.root.denominator < self.min_visits:
+            return 0
+        written = 0
+        #  the path from the root to the current node, each entry holding a node, its id and its next child's index
+        path: List[Tuple[GameTreeNode, int, int]] = []
+        node, parent_id = tree.root, None
+        while True:
+            if node is not None:
+                output.write(json.dumps(self.describe(node, written, parent_id, len(path)), separators=(",", ":")))
+                output.write("\n")
+                path.append((node, written, 0))
+                written += 1
+                node = None
+            if len(path) == 0:
+                return written
+            current, current_id, child_index = path[-1]
+            children = current.children
+            if (self.max_depth is not None and len(path) > self.max_depth) or child_index >= len(children):
+                path.pop()
+                continue
+            path[-1] = (current, current_id, child_index + 1)
+            child = children[child_index]
+            if child.denominator >= self.min_visits:
+                node, parent_id = child, current_id
@@ -10,15 +10,18 @@ class GameTreeNode:
     Represents a node in the tree, only contains a value.
     """
 
-    def __init__(self: GameTreeNode, value: Game) -> None:
+    def __init__(self: GameTreeNode, value: Game, move: List[int] | None = None) -> None:
         """
         Initializes a new GameTreeNode instance with the Game snapshot supplied
 
         :param value: A snapshot of the current game instance
+        :param move: The move that led to this snapshot, in the format [from_x, from_y, to_x, to_y]
         """
         self.numerator = 0
         self.denominator = 1
         self.value = value
+        self.move: List[int] | None = move
+        self.untried_moves: List[List[int]] | None = None
         self.children: List[GameTreeNode] = []
         self.parent: GameTreeNode | None = None
 
@@ -1,5 +1,7 @@
-from secrets import randbelow
+from sys import getsizeof
 from enum import Enum
+from typing import List
+from Types.SimulationRandom import SimulationRandom, SIMULATION_RANDOM
 
 
 class CoinFace(Enum):
@@ -10,9 +12,106 @@ class CoinFace(Enum):
     TAILS = 1
 
 
-def flip_coin() -> CoinFace:
+def flip_coin(rng: SimulationRandom = SIMULATION_RANDOM) -> CoinFace:
     """
     Flips a coin, either returning Heads or Tails
+    :param rng: The random stream to flip the coin with
     :return: The CoinFace enum equivalent of the coin flip
     """
-    return CoinFace(randbelow(2))
+    return CoinFace(rng.flip())
+
+
+class PieceValue(Enum):
+    """
+    Represents the material value of each chess piece, in centipawns, keyed by the piece's name in upper case
+    """
+    PAWN = 100
+    KNIGHT = 320
+    BISHOP = 330
+    ROOK = 500
+    QUEEN = 900
+    KING = 20000
+
+
+def piece_value(name: str) -> int:
+    """
+    Looks up the material value of a piece by its name
+
+    :param name: The name of the piece, such as "Pawn" or "Queen"
+    :return: The value of the piece in centipawns
+    """
+    return PieceValue[name.upper()].value
+
+
+def deep_getsizeof(value: object) -> int:
+    """
+    Estimates the memory held by an object and everything it references, counting shared objects once
+
+    :param value: The object to measure
+    :return: The estimated size of the object graph, in bytes
+    """
+    seen = set()
+    pending = [value]
+    total = 0
+    while len(pending) > 0:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, (type, Enum)):
+            continue
+        seen.add(id(current))
+        total += getsizeof(current)
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        if hasattr(current, "__dict__"):
+            pending.append(current.__dict__)
+        for each_slot in getattr(type(current), "__slots__", ()):
+            if hasattr(current, each_slot):
+                pending.append(getattr(current, each_slot))
+    return total
+
+
+FEN_PIECE_NAMES = {"p": "Pawn", "n": "Knight", "b": "Bishop", "r": "Rook", "q": "Queen", "k": "King"}
+
+
+def square_name(x: int, y: int) -> str:
+    """
+    Converts board coordinates to the square's algebraic name. Rank 1 is row 0, and file a is column 7, since the
+    kings start on column 3, which is the e-file.
+
+    :param x: The column of the square
+    :param y: The row of the square
+    :return: The name of the square, such as "e2"
+    """
+    return "{}{}".format(chr(ord("a") + 7 - x), y + 1)
+
+
+def parse_square(name: str) -> List[int]:
+    """
+    Converts the algebraic name of a square to board coordinates
+
+    :param name: The name of the square, such as "e2"
+    :return: The coordinates of the square, in the format [x, y]
+    """
+    return [7 - (ord(name[0]) - ord("a")), int(name[1]) - 1]
+
+
+def move_name(move: List[int]) -> str:
+    """
+    Converts a move to long algebraic notation, as used by the UCI protocol
+
+    :param move: The move, in the format [from_x, from_y, to_x, to_y]
+    :return: The name of the move, such as "e2e4"
+    """
+    return square_name(move[0], move[1]) + square_name(move[2], move[3])
+
+
+def parse_move(name: str) -> List[int]:
+    """
+    Converts a move in long algebraic notation to board coordinates, ignoring any promotion suffix
+
+    :param name: The name of the move, such as "e2e4"
+    :return: The move, in the format [from_x, from_y, to_x, to_y]
+    """
+    return parse_square(name[0:2]) + parse_square(name[2:4])
@@ -1,16 +1,26 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 from Types.MoveSet import MoveSet
 from Types.ChessPiece import ChessPiece
+from Types.PieceType import PieceType
 
 if TYPE_CHECKING:
     from Types.Player import Team
 
 
+KING_MOVES: Tuple[MoveSet, ...] = (MoveSet(1, 0), MoveSet(1, 1), MoveSet(1, -1), MoveSet(0, 1),
+                                   MoveSet(0, -1), MoveSet(-1, -1), MoveSet(-1, 0), MoveSet(-1, 1))
+
+
 class King(ChessPiece):
     """
     The King chess piece. https://en.wikipedia.org/wiki/King_(chess)
     """
+    __slots__ = ()
+
+    piece_type: PieceType = PieceType("King", KING_MOVES, KING_MOVES)
+    name: str = piece_type.name
+
     def __init__(self: King, x: int, y: int, team: Team) -> None:
         """
         Initializes a King instance, placing it at the x and y coordinates supplied
@@ -19,23 +29,4 @@ class King(ChessPiece):
         :param y: The row where the King will be placed initially
         :param team: The team the piece belongs to
         """
-        super().__init__(x, y, [
-            MoveSet(1, 0),
-            MoveSet(1, 1),
-            MoveSet(1, -1),
-            MoveSet(0, 1),
-            MoveSet(0, -1),
-            MoveSet(-1, -1),
-            MoveSet(-1, 0),
-            MoveSet(-1, 1)
-        ], [
-            MoveSet(1, 0),
-            MoveSet(1, 1),
-            MoveSet(1, -1),
-            MoveSet(0, 1),
-            MoveSet(0, -1),
-            MoveSet(-1, -1),
-            MoveSet(-1, 0),
-            MoveSet(-1, 1)
-        ], team)
-        self.name = "King"
+        super().__init__(x, y, team)
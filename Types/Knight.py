@@ -1,16 +1,26 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 from Types.MoveSet import MoveSet
 from Types.ChessPiece import ChessPiece
+from Types.PieceType import PieceType
 
 if TYPE_CHECKING:
     from Types.Player import Team
 
 
+KNIGHT_MOVES: Tuple[MoveSet, ...] = (MoveSet(-1, 2), MoveSet(1, 2), MoveSet(2, 1), MoveSet(2, -1),
+                                     MoveSet(-2, 1), MoveSet(-2, -1), MoveSet(1, -2), MoveSet(-1, -2))
+
+
 class Knight(ChessPiece):
     """
     Represents a knight piece on the chess board. https://en.wikipedia.org/wiki/Knight_(chess)
     """
+    __slots__ = ()
+
+    piece_type: PieceType = PieceType("Knight", KNIGHT_MOVES, KNIGHT_MOVES)
+    name: str = piece_type.name
+
     def __init__(self: Knight, x: int, y: int, team: Team) -> None:
         """
         Initializes a Knight instance on the chess board, placing the knight at the x and y coordinates supplied
@@ -19,23 +29,4 @@ class Knight(ChessPiece):
         :param y: The row where the knight will be placed
         :param team: The team the piece belongs to
         """
-        super().__init__(x, y, [
-            MoveSet(-1, 2),
-            MoveSet(1, 2),
-            MoveSet(2, 1),
-            MoveSet(2, -1),
-            MoveSet(-2, 1),
-            MoveSet(-2, -1),
-            MoveSet(1, -2),
-            MoveSet(-1, -2)
-        ], [
-            MoveSet(-1, 2),
-            MoveSet(1, 2),
-            MoveSet(2, 1),
-            MoveSet(2, -1),
-            MoveSet(-2, 1),
-            MoveSet(-2, -1),
-            MoveSet(1, -2),
-            MoveSet(-1, -2)
-        ], team)
-        self.name = "Knight"
+        super().__init__(x, y, team)
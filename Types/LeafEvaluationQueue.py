@@ -0,0 +1,59 @@
+from __future__ import annotations
+from typing import Callable, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from Types.Game import Game
+    from Types.LeafEvaluator import LeafEvaluator
+
+
+class LeafEvaluationQueue:
+    """
+    Collects the leaves of many in-flight selections and scores them with the evaluator in a single batch, once enough
+    of them are pending. Each leaf comes with a callback, which receives its value once the batch has been scored.
+    """
+
+    def __init__(self: LeafEvaluationQueue, evaluator: LeafEvaluator, batch_size: int = 1) -> None:
+        """
+        Initializes an empty queue
+
+        :param evaluator: The evaluator scoring the batches
+        :param batch_size: The amount of pending leaves that triggers scoring a batch
+        """
+        self.evaluator: LeafEvaluator = evaluator
+        self.batch_size: int = max(batch_size, 1)
+        self.pending_games: List[Game] = []
+        self.pending_callbacks: List[Callable[[float], None]] = []
+        self.batches: int = 0  # The amount of batches scored
+        self.evaluated: int = 0  # The amount of leaves scored
+
+    def submit(self: LeafEvaluationQueue, game: Game, callback: Callable[[float], None]) -> None:
+        """
+        Queues a leaf, scoring the batch if the queue is full
+
+        :param game: The leaf to score
+        :param callback: Receives the expected result for white of the leaf once it is scored
+        :return: None
+        """
+        self.pending_games.append(game)
+        self.pending_callbacks.append(callback)
+        if len(self.pending_games) >= self.batch_size:
+            self.flush()
+
+    def flush(self: LeafEvaluationQueue) -> None:
+        """
+        Scores every pending leaf, whether or not the batch is full, and hands each value to its callback
+
+        :return: None
+        """
+        if len(self.pending_games) == 0:
+            return
+        games, callbacks = self.pending_games, self.pending_callbacks
+        self.pending_games, self.pending_callbacks = [], []
+        values = self.evaluator.evaluate(games)
+        self.batches += 1
+        self.evaluated += len(games)
+        for each_callback, each_value in zip(callbacks, values):
+            each_callback(each_value)
+
+    def __len__(self: LeafEvaluationQueue) -> int:
+        return len(self.pending_games)
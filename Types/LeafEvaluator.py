@@ -0,0 +1,93 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import List, TYPE_CHECKING
+from Types.Player import Team
+
+if TYPE_CHECKING:
+    from Types.Game import Game
+
+SCORE_SCALE: float = 400  # The centipawn lead that makes a player 10 times more likely to win than to lose
+
+
+class LeafEvaluator(ABC):
+    """
+    Scores the leaves of a search. Leaves are always handed over in batches, so evaluators that can score many
+    positions at once, such as a vectorized model, pay their fixed cost once per batch instead of once per leaf.
+
+    Every value is the expected result for white, from 0 (black wins) to 1 (white wins), 0.5 being a draw.
+    """
+
+    @abstractmethod
+    def evaluate(self: LeafEvaluator, games: List[Game]) -> List[float]:
+        """
+        Scores every game supplied, none of them are modified
+
+        :param games: The leaves to score
+        :return: The expected result for white of each game, in the same order
+        """
+
+    @staticmethod
+    def result_value(result: Team | None) -> float:
+        """
+        Converts the result of a finished game to a value
+
+        :param result: The team that won, or None if the game was a draw
+        :return: 1 if white won, 0 if black won, 0.5 for a draw
+        """
+        if result is None:
+            return 0.5
+        return 1 if result == Team.WHITE else 0
+
+    @staticmethod
+    def centipawn_value(score: float) -> float:
+        """
+        Converts a centipawn score to an expected result, along the logistic curve scaled by SCORE_SCALE
+
+        :param score: The score in centipawns, positive when white is better
+        :return: The expected result for white, from 0 (black wins) to 1 (white wins)
+        """
+        return 1 / (1 + 10 ** (-min(max(score, -4 * SCORE_SCALE), 4 * SCORE_SCALE) / SCORE_SCALE))
+
+    @staticmethod
+    def terminal_value(game: Game) -> float | None:
+        """
+        Scores the game exactly if it is already over
+
+        :param game: The game to score
+        :return: The value of the finished game, or None if the game is still being played
+        """
+        if game.is_checkmate():
+            return LeafEvaluator.result_value(Team.BLACK if game.turn == Team.WHITE else Team.WHITE)
+        if game.is_draw():
+            return 0.5
+        return None
+
+
+class PlayoutEvaluator(LeafEvaluator):
+    """
+    Scores each leaf with a single random playout, the classic Monte Carlo evaluation
+    """
+
+    def __init__(self: PlayoutEvaluator, playout_plies: int | None = None) -> None:
+        """
+        Initializes a PlayoutEvaluator instance
+
+        :param playout_plies: The ply cap of each playout, defaults to the playout's own cap
+        """
+        self.playout_plies: int | None = playout_plies
+
+    def evaluate(self: PlayoutEvaluator, games: List[Game]) -> List[float]:
+        """
+        Plays out a copy of every game supplied
+
+        :param games: The leaves to score
+        :return: The result for white of each playout, in the same order
+        """
+        values: List[float] = []
+        for each_game in games:
+            playout_game = each_game.clone()
+            if self.playout_plies is None:
+                values.append(self.result_value(playout_game.playout_game()))
+            else:
+                values.append(self.result_value(playout_game.playout_game(self.playout_plies)))
+        return values
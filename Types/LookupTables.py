@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from random import Random
+from typing import Dict, List, Tuple
+from Types.Player import Team
+
+TABLES_MAGIC: bytes = b"CPLT"  # Marks a file as a ChessPredictor lookup table cache
+TABLES_FORMAT_VERSION: int = 1  # Bumped whenever the layout or the contents of the tables change
+# magic, format version, source checksum, payload length and payload checksum, padded so the tables that follow are
+# aligned to 8 bytes
+TABLES_HEADER = struct.Struct("<4sIIII4x")
+ZOBRIST_SEED: int = 0x5EED  # The seed the Zobrist keys are drawn from
+CACHE_DIRECTORY_VARIABLE: str = "CHESS_PREDICTOR_CACHE"  # Environment variable overriding the cache directory
+SQUARES: int = 64
+WIDTH: int = 8
+
+PIECE_NAMES: List[str] = ["Pawn", "Knight", "Bishop", "Rook", "Queen", "King"]
+LEAPER_NAMES: List[str] = ["Pawn", "Knight", "King"]
+LEAPER_OFFSETS: Dict[str, List[Tuple[int, int]]] = {
+    "Pawn": [(0, 1), (0, 2)],
+    "Knight": [(-1, 2), (1, 2), (2, 1), (2, -1), (-2, 1), (-2, -1), (1, -2), (-1, -2)],
+    "King": [(1, 0), (1, 1), (1, -1), (0, 1), (0, -1), (-1, -1), (-1, 0), (-1, 1)]
+}
+MAX_LEAPER_TARGETS: int = 8
+# The directions sliding pieces move in, grouped the way generate_potential_moves walks them: along the x plane, along
+# the y plane, and diagonally
+RAY_DIRECTIONS: List[Tuple[int, int]] = [(-1, 0), (1, 0), (0, -1), (0, 1), (1, -1), (-1, -1), (-1, 1), (1, 1)]
+X_RAYS: Tuple[int, ...] = (0, 1)  # The indexes of the rays along the x plane
+Y_RAYS: Tuple[int, ...] = (2, 3)  # The indexes of the rays along the y plane
+DIAGONAL_RAYS: Tuple[int, ...] = (4, 5, 6, 7)  # The indexes of the diagonal rays
+MAX_RAY_LENGTH: int = 7
+
+# Piece-square tables, https://www.chessprogramming.org/Simplified_Evaluation_Function, written from white's point of
+# view with rank 8 first and file a first, as they usually are printed
+PIECE_SQUARE_TABLES: Dict[str, List[int]] = {
+    "Pawn": [
+        0, 0, 0, 0, 0, 0, 0, 0,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        10, 10, 20, 30, 30, 20, 10, 10,
+        5, 5, 10, 25, 25, 10, 5, 5,
+        0, 0, 0, 20, 20, 0, 0, 0,
+        5, -5, -10, 0, 0, -10, -5, 5,
+        5, 10, 10, -20, -20, 10, 10, 5,
+        0, 0, 0, 0, 0, 0, 0, 0
+    ],
+    "Knight": [
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20, 0, 0, 0, 0, -20, -40,
+        -30, 0, 10, 15, 15, 10, 0, -30,
+        -30, 5, 15, 20, 20, 15, 5, -30,
+        -30, 0, 15, 20, 20, 15, 0, -30,
+        -30, 5, 10, 15, 15, 10, 5, -30,
+        -40, -20, 0, 5, 5, 0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50
+    ],
+    "Bishop": [
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 10, 10, 5, 0, -10,
+        -10, 5, 5, 10, 10, 5, 5, -10,
+        -10, 0, 10, 10, 10, 10, 0, -10,
+        -10, 10, 10, 10, 10, 10, 10, -10,
+        -10, 5, 0, 0, 0, 0, 5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20
+    ],
+    "Rook": [
+        0, 0, 0, 0, 0, 0, 0, 0,
+        5, 10, 10, 10, 10, 10, 10, 5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        0, 0, 0, 5, 5, 0, 0, 0
+    ],
+    "Queen": [
+        -20, -10, -10, -5, -5, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 5, 5, 5, 0, -10,
+        -5, 0, 5, 5, 5, 5, 0, -5,
+        0, 0, 5, 5, 5, 5, 0, -5,
+        -10, 5, 5, 5, 5, 5, 0, -10,
+        -10, 0, 5, 0, 0, 0, 0, -10,
+        -20, -10, -10, -5, -5, -10, -10, -20
+    ],
+    "King": [
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+        20, 20, 0, 0, 0, 0, 20, 20,
+        20, 30, 10, 0, 0, 10, 30, 20
+    ]
+}
+
+
+class LookupTables:
+    """
+    Houses every table precomputed for move generation, hashing and evaluation: the Zobrist keys, the piece-square
+    tables, the targets of the pieces with a fixed move-set (leapers), and the rays of the sliding pieces.
+
+    Generating the tables takes far longer than reading them, so they are serialized into a versioned binary cache file
+    the first time they are built, and every later process maps that file into memory instead. A cache file written by
+    a different version of the tables, or one that is truncated or corrupted, is regenerated automatically.
+
+    Squares are flattened as y * 8 + x, the board being 8 by 8.
+    """
+
+    def __init__(self: LookupTables, payload: bytes | mmap.mmap, source: mmap.mmap | None = None) -> None:
+        """
+        Initializes the tables from a serialized payload, laid out the way `serialize` writes it
+
+        :param payload: The serialized tables, either in memory or mapped from the cache file
+        :param source: The memory map the payload views, kept open for as long as the tables are alive
+        """
+        self.source: mmap.mmap | None = source
+        view = memoryview(payload)
+        offset = TABLES_HEADER.size
+        zobrist_length = len(Team) * len(PIECE_NAMES) * SQUARES + 1
+        self.zobrist_keys: memoryview = view[offset:offset + zobrist_length * 8].cast("Q")
+        offset += zobrist_length * 8
+        pst_length = len(PIECE_NAMES) * SQUARES
+        self.piece_square_values: memoryview = view[offset:offset + pst_length * 2].cast("h")
+        offset += pst_length * 2
+        leaper_length = len(LEAPER_NAMES) * SQUARES * MAX_LEAPER_TARGETS
+        leaper_view = view[offset:offset + leaper_length].cast("b")
+        offset += leaper_length
+        ray_view = view[offset:offset + len(RAY_DIRECTIONS) * SQUARES * MAX_RAY_LENGTH].cast("b")
+        #  the target and ray tables are walked on every move generated, so they are unpacked into tuples once,
+        #  which is a single pass over a few kilobytes
+        self.leaper_targets: Dict[str, List[Tuple[Tuple[int, int], ...]]] = {}
+        for name_index, each_name in enumerate(LEAPER_NAMES):
+            self.leaper_targets[each_name] = [
+                LookupTables.unpack_squares(leaper_view, (name_index * SQUARES + square) * MAX_LEAPER_TARGETS,
+                                            MAX_LEAPER_TARGETS)
+                for square in range(SQUARES)
+            ]
+        self.rays: List[List[Tuple[Tuple[int, int], ...]]] = [
+            [LookupTables.unpack_squares(ray_view, (direction_index * SQUARES + square) * MAX_RAY_LENGTH,
+                                         MAX_RAY_LENGTH) for square in range(SQUARES)]
+            for direction_index in range(len(RAY_DIRECTIONS))
+        ]
+
+    @staticmethod
+    def unpack_squares(view: memoryview, start: int, length: int) -> Tuple[Tuple[int, int], ...]:
+        """
+        Unpacks a run of flattened squares, padded with -1, into coordinates
+
+        :param view: The table being unpacked
+        :param start: The index the run starts at
+        :param length: The length of the run, padding included
+        :return: The squares of the run, in the format (x, y)
+        """
+        return tuple((square % WIDTH, square // WIDTH) for square in view[start:start + length] if square >= 0)
+
+    def zobrist_offset(self: LookupTables, name: str, team: Team) -> int:
+        """
+        Finds where the Zobrist keys of a piece start in the key table
+
+        :param name: The name of the piece
+        :param team: The team of the piece
+        :return: The index of the piece's key for square 0
+        """
+        return (team.value * len(PIECE_NAMES) + PIECE_NAMES.index(name)) * SQUARES
+
+    def side_key(self: LookupTables) -> int:
+        """
+        Looks up the Zobrist key XOR-ed into the hash when black is to move
+
+        :return: The side-to-move key
+        """
+        return self.zobrist_keys[len(self.zobrist_keys) - 1]
+
+    def piece_square_value(self: LookupTables, name: str, team: Team, x: int, y: int) -> int:
+        """
+        Looks up the positional bonus of a piece standing on the square x, y. Rank 1 is row 0 and file a is column 7,
+        black's tables being white's mirrored across the middle of the board.
+
+        :param name: The name of the piece
+        :param team: The team of the piece
+        :param x: The column of the square
+        :param y: The row of the square
+        :return: The bonus of the square, in centipawns
+        """
+        row = 7 - y if team == Team.WHITE else y
+        return self.piece_square_values[PIECE_NAMES.index(name) * SQUARES + row * WIDTH + (7 - x)]
+
+    @staticmethod
+    def source_checksum() -> int:
+        """
+        Computes a checksum over everything the tables are generated from, so a cache file written from different
+        sources is detected as stale
+
+        :return: The checksum of the table sources
+        """
+        sources = repr((TABLES_FORMAT_VERSION, ZOBRIST_SEED, sys.byteorder, PIECE_NAMES, LEAPER_OFFSETS,
+                        RAY_DIRECTIONS, PIECE_SQUARE_TABLES))
+        return zlib.crc32(sources.encode())
+
+    @staticmethod
+    def serialize() -> bytes:
+        """
+        Generates every table and serializes them, header included
+
+        :return: The contents of the cache file
+        """
+        generator = Random(ZOBRIST_SEED)
+        zobrist_keys = array("Q", [generator.getrandbits(64)
+                                   for _ in range(len(Team) * len(PIECE_NAMES) * SQUARES + 1)])
+        piece_square_values = array("h")
+        for each_name in PIECE_NAMES:
+            piece_square_values.extend(PIECE_SQUARE_TABLES[each_name])
+        leaper_targets = array("b")
+        for each_name in LEAPER_NAMES:
+            for square in range(SQUARES):
+                x, y = square % WIDTH, square // WIDTH
+                targets = [(y + offset_y) * WIDTH + x + offset_x for offset_x, offset_y in LEAPER_OFFSETS[each_name]
+                           if 0 <= x + offset_x < WIDTH and 0 <= y + offset_y < WIDTH]
+                leaper_targets.extend(targets + [-1] * (MAX_LEAPER_TARGETS - len(targets)))
+        rays = array("b")
+        for step_x, step_y in RAY_DIRECTIONS:
+            for square in range(SQUARES):
+                ray: List[int] = []
+                x, y = square % WIDTH + step_x, square // WIDTH + step_y
+                while 0 <= x < WIDTH and 0 <= y < WIDTH:
+                    ray.append(y * WIDTH + x)
+                    x, y = x + step_x, y + step_y
+                rays.extend(ray + [-1] * (MAX_RAY_LENGTH - len(ray)))
+        payload = zobrist_keys.tobytes() + piece_square_values.tobytes() + leaper_targets.tobytes() + rays.tobytes()
+        return TABLES_HEADER.pack(TABLES_MAGIC, TABLES_FORMAT_VERSION, LookupTables.source_checksum(), len(payload),
+                                  zlib.crc32(payload)) + payload
+
+    @staticmethod
+    def is_valid(contents: bytes | mmap.mmap) -> bool:
+        """
+        Checks if the contents of a cache file were written by this version of the tables and are intact
+
+        :param contents: The contents of the cache file
+        :return: Whether the tables can be read from the contents
+        """
+        if len(contents) < TABLES_HEADER.size:
+            return False
+        magic, version, checksum, payload_length, payload_checksum = TABLES_HEADER.unpack_from(contents)
+        return magic == TABLES_MAGIC and version == TABLES_FORMAT_VERSION and \
+            checksum == LookupTables.source_checksum() and \
+            len(contents) == TABLES_HEADER.size + payload_length and \
+            zlib.crc32(memoryview(contents)[TABLES_HEADER.size:]) == payload_checksum
+
+    @staticmethod
+    def cache_path() -> str:
+        """
+        Finds where the cache file lives, in the directory named by the CHESS_PREDICTOR_CACHE environment variable, or
+        in ~/.cache/ChessPredictor otherwise
+
+        :return: The path to the cache file
+        """
+        directory = os.environ.get(CACHE_DIRECTORY_VARIABLE) or \
+            os.path.join(os.path.expanduser("~"), ".cache", "ChessPredictor")
+        return os.path.join(directory, "lookup-tables-v{}.bin".format(TABLES_FORMAT_VERSION))
+
+    @staticmethod
+    def write_cache(path: str, contents: bytes) -> None:
+        """
+        Writes the cache file atomically, so processes starting at the same time never map a half-written file
+
+        :param path: The path to the cache file
+        :param contents: The serialized tables
+        :return: None
+        """
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".lookup-tables-")
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(contents)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    @staticmethod
+    def load(path: str | None = None) -> LookupTables:
+        """
+        Maps the tables from the cache file, regenerating the file first if it is missing or stale. If the cache cannot
+        be written, for instance on a read-only file system, the freshly generated tables are used from memory.
+
+        :param path: The path to the cache file, defaults to `cache_path()`
+        :return: The lookup tables
+        """
+        path = path if path is not None else LookupTables.cache_path()
+        try:
+            with open(path, "rb") as cache_file:
+                mapped = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if LookupTables.is_valid(mapped):
+                return LookupTables(mapped, mapped)
+            mapped.close()
+        except (OSError, ValueError):
+            pass
+        contents = LookupTables.serialize()
+        try:
+            LookupTables.write_cache(path, contents)
+        except OSError:
+            pass
+        return LookupTables(contents)
+
+
+LOOKUP_TABLES: LookupTables = LookupTables.load()
@@ -0,0 +1,636 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import queue
+import threading
+import time
+import traceback
+from typing import List, Tuple, TYPE_CHECKING
+from Types.AnalysisCache import AnalysisCache, AnalysisEntry
+from Types.GameTree import GameTree
+from Types.GameTreeNode import GameTreeNode
+from Types.LeafEvaluationQueue import LeafEvaluationQueue
+from Types.LeafEvaluator import LeafEvaluator, PlayoutEvaluator
+from Types.Player import Team
+from Types.SearchResult import MoveScore, SearchResult
+from Types.SearchStats import GameCounters, Recording, SamplingProfiler, SearchStats, TimedEvaluator, counted, timed
+from Types.SharedNodePool import SharedNodePool
+from Types.SharedTranspositionTable import SharedTranspositionTable
+from Types.SimulationRandom import SimulationRandom
+from Types.TranspositionTable import TranspositionTable
+
+if TYPE_CHECKING:
+    from Types.Game import Game
+
+DEFAULT_ITERATIONS: int = 1000  # The amount of iterations a search runs when it is given no limit
+LOCK_STRIPES: int = 256  # The amount of locks the nodes of the tree are spread over
+WORKER_POLL_INTERVAL: float = 0.1  # The seconds the search waits on its worker processes before checking they live
+
+
+class MonteCarloSearch:
+    """
+    Monte Carlo tree search, https://en.wikipedia.org/wiki/Monte_Carlo_tree_search, selecting moves with the UCT
+    formula. Unlike Game.monte_carlo, which expands every move down to a fixed depth, the search grows the tree by one
+    node per iteration, so it can stop after any amount of iterations and pick up where it left off when searched again.
+
+    Node statistics are mirrored into a TranspositionTable, so every line reaching the same position shares what has
+    been learned about it, and the root can be restricted to a subset of the moves, such as the moves of one piece.
+
+    Leaves are scored by a LeafEvaluator, random playouts by default, through a LeafEvaluationQueue. With a batch size
+    above 1, several selections are run before their leaves are scored together. Each selection counts its visit on the
+    way down, before its value is known, which steers the following selections towards other leaves.
+
+    The search can run tree-parallel, https://www.chessprogramming.org/Parallel_Search, with several workers descending
+    the same tree. Every worker applies a virtual loss to the nodes it descends through, so the others spread out over
+    different lines, and takes it back when backing up its value. Workers are threads sharing the tree, guarded by
+    striped per-node locks, which pays off when the evaluator releases the GIL, as NumPy does. Otherwise, workers are
+    processes, each keeping its own nodes but sharing their statistics through a SharedNodePool, or through the
+    search's table if it is a SharedTranspositionTable, every worker process then reading and writing the one table.
+
+    Every worker draws from its own SimulationRandom stream, spawned from the search's stream, and hands it to the games
+    it expands, so their playouts draw from it too. A seeded single-worker search is fully reproducible.
+
+    With an AnalysisCache, a fresh root is warm-started from the stored result of its position, its best move being
+    expanded first and credited with the stored visits and score, and the result of every unrestricted search is
+    recorded back, so what was learned survives the process.
+
+    With instrumentation, the search counts the nodes it expands, the playouts it runs, and the calls to the hot methods
+    of Game, and times its phases, into a SearchStats returned with every result. Instrumentation works by wrapping the
+    methods involved while an instrumented search runs, so a search without it runs the plain methods, paying nothing.
+    A SamplingProfiler may be attached to sample the workers while they search.
+    """
+
+    def __init__(self: MonteCarloSearch, game: Game, root_moves: List[List[int]] | None = None,
+                 exploration: float = math.sqrt(2), transposition_table: TranspositionTable | None = None,
+                 playout_plies: int | None = None, max_nodes: int | None = None,
+                 max_bytes: int | None = None, evaluator: LeafEvaluator | None = None, batch_size: int = 1,
+                 threads: int = 1, processes: int = 1, virtual_loss: int = 1,
+                 node_pool: SharedNodePool | SharedTranspositionTable | None = None, seed: int | None = None,
+                 analysis_cache: AnalysisCache | None = None, instrument: bool = False,
+                 profiler: SamplingProfiler | None = None) -> None:
+        """
+        Initializes a search rooted at the game supplied
+
+        :param game: The game to search, it is never modified by the search
+        :param root_moves: The moves the root is restricted to, defaults to every valid move
+        :param exploration: The exploration constant of the UCT formula
+        :param transposition_table: The table to share statistics through, defaults to a new table, a
+            SharedTranspositionTable being shared with the worker processes too, in place of a SharedNodePool
+        :param playout_plies: The ply cap of each playout, used by the default evaluator
+        :param max_nodes: The maximum amount of nodes the tree may hold, unlimited if None
+        :param max_bytes: The maximum amount of memory the tree may hold, in bytes, unlimited if None
+        :param evaluator: The evaluator scoring the leaves, defaults to random playouts
+        :param batch_size: The amount of leaves each worker scores together in one batch
+        :param threads: The amount of threads descending the tree
+        :param processes: The amount of processes descending the tree, used instead of threads when above 1
+        :param virtual_loss: The amount of lost visits a worker applies to every node it descends through
+        :param node_pool: The shared statistics to read and write, set on the searches run by worker processes
+        :param seed: The seed of the search's random stream, defaults to a stream spawned from the game's
+        :param analysis_cache: The persistent store of search results to warm-start from and record to
+        :param instrument: Whether to gather SearchStats, returned with every result
+        :param profiler: The sampling profiler watching the workers while they search, its samples being added to the
+            stats if the search is instrumented
+        """
+        self.exploration: float = exploration
+        self.transposition_table: TranspositionTable = transposition_table if transposition_table is not None \
+            else TranspositionTable()
+        self.evaluator: LeafEvaluator = evaluator if evaluator is not None else PlayoutEvaluator(playout_plies)
+        self.batch_size: int = batch_size
+        self.queue: LeafEvaluationQueue = LeafEvaluationQueue(self.evaluator, batch_size)
+        self.max_nodes: int | None = max_nodes
+        self.max_bytes: int | None = max_bytes
+        self.tree: GameTree = GameTree(max_nodes, max_bytes).set_root(self.create_node(game))
+        self.root_moves: List[List[int]] | None = root_moves
+        if root_moves is not None:
+            self.tree.root.untried_moves = [each_move[:] for each_move in root_moves]
+        self.threads: int = max(threads, 1)
+        self.processes: int = max(processes, 1)
+        self.virtual_loss: int = max(virtual_loss, 1)
+        self.node_pool: SharedNodePool | SharedTranspositionTable | None = node_pool
+        self.rng: SimulationRandom = SimulationRandom(seed) if seed is not None else game.rng.spawn()
+        self.node_locks: List[threading.Lock] = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self.tree_lock: threading.Lock = threading.Lock()
+        self.table_lock: threading.Lock = threading.Lock()
+        self.counter_lock: threading.Lock = threading.Lock()
+        self.stop_event: threading.Event = threading.Event()
+        self.iteration_target: int | None = None
+        self.deadline: float | None = None
+        self.iterations: int = 0
+        self.max_depth: int = 0
+        self.elapsed: float = 0
+        self.analysis_cache: AnalysisCache | None = analysis_cache
+        self.analysis: AnalysisEntry | None = self.load_analysis()
+        self.stats: SearchStats | None = SearchStats() if instrument else None
+        self.profiler: SamplingProfiler | None = profiler
+        self.leaf_evaluator: LeafEvaluator = self.evaluator
+        if self.stats is not None:
+            #  the phases are timed by wrapping this search's own methods, so other searches run the plain ones
+            self.select_leaf = timed("selection", self.select_leaf)
+            self.backpropagate = timed("backpropagation", self.backpropagate)
+            self.create_node = counted("nodes_expanded", self.create_node)
+            self.leaf_evaluator = TimedEvaluator(self.evaluator)
+            self.queue = LeafEvaluationQueue(self.leaf_evaluator, batch_size)
+
+    @staticmethod
+    def create_node(game: Game, move: List[int] | None = None) -> GameTreeNode:
+        """
+        Creates a node that has not been visited yet
+
+        :param game: The game snapshot of the node
+        :param move: The move that led to the snapshot
+        :return: The new node
+        """
+        node = GameTreeNode(game, move)
+        node.denominator = 0
+        return node
+
+    @staticmethod
+    def is_terminal(game: Game) -> bool:
+        """
+        Checks if the game is over, either by checkmate or by a draw
+
+        :param game: The game to check
+        :return: Whether no more moves should be searched from the game
+        """
+        return game.is_checkmate() or game.is_draw()
+
+    @staticmethod
+    def reward(node: GameTreeNode, value: float) -> float:
+        """
+        Converts the value of a leaf to the reward of the player who moved into the node
+
+        :param node: The node being rewarded
+        :param value: The expected result for white of the leaf
+        :return: The expected result for the player who moved into the node, from 0 (loss) to 1 (win)
+        """
+        return value if node.value.turn == Team.BLACK else 1 - value
+
+    def node_lock(self: MonteCarloSearch, node: GameTreeNode) -> threading.Lock:
+        """
+        Finds the lock guarding the node
+
+        :param node: The node to lock
+        :return: The lock of the node's stripe
+        """
+        return self.node_locks[id(node) % LOCK_STRIPES]
+
+    def stop(self: MonteCarloSearch) -> None:
+        """
+        Asks a running search to stop, every worker finishing the iteration it is in
+
+        :return: None
+        """
+        self.stop_event.set()
+
+    def search(self: MonteCarloSearch, iterations: int | None = None, time_limit: float | None = None) -> SearchResult:
+        """
+        Runs search iterations until either limit is reached, or `stop` is called, defaulting to DEFAULT_ITERATIONS
+        when neither limit is supplied
+
+        :param iterations: The maximum amount of iterations to run
+        :param time_limit: The maximum amount of seconds to search for
+        :return: The result of the search so far
+        """
+        if iterations is None and time_limit is None:
+            iterations = DEFAULT_ITERATIONS
+        start = time.perf_counter()
+        self.stop_event.clear()
+        self.iteration_target = self.iterations + iterations if iterations is not None else None
+        self.deadline = start + time_limit if time_limit is not None else None
+        if self.stats is not None:
+            GameCounters.install(type(self.tree.root.value))
+        if self.profiler is not None:
+            self.profiler.start()
+        try:
+            if self.processes > 1 and self.node_pool is None:
+                self.search_processes(iterations, time_limit)
+            elif self.threads > 1:
+                workers = [threading.Thread(target=self.run_worker, args=(
+                    LeafEvaluationQueue(self.leaf_evaluator, self.batch_size), self.rng.spawn()
+                )) for _ in range(self.threads)]
+                for each_worker in workers:
+                    each_worker.start()
+                for each_worker in workers:
+                    each_worker.join()
+            else:
+                self.run_worker(self.queue, self.rng)
+        finally:
+            if self.profiler is not None:
+                self.profiler.stop()
+                if self.stats is not None:
+                    self.stats.samples = dict(self.profiler.samples)
+            if self.stats is not None:
+                GameCounters.uninstall(type(self.tree.root.value))
+        self.elapsed += time.perf_counter() - start
+        result = self.result()
+        self.save_analysis(result)
+        return result
+
+    def claim_iteration(self: MonteCarloSearch) -> bool:
+        """
+        Claims the next iteration for the calling worker, if the search has any left
+
+        :return: Whether the worker should run another iteration
+        """
+        if self.stop_event.is_set() or (self.deadline is not None and time.perf_counter() >= self.deadline):
+            return False
+        with self.counter_lock:
+            if self.iteration_target is not None and self.iterations >= self.iteration_target:
+                return False
+            self.iterations += 1
+            return True
+
+    def run_worker(self: MonteCarloSearch, queue: LeafEvaluationQueue, rng: SimulationRandom) -> None:
+        """
+        Runs iterations until the search is out of them, then scores the leaves still pending in the worker's queue
+
+        :param queue: The worker's own queue of leaves
+        :param rng: The worker's own random stream
+        :return: None
+        """
+        if self.profiler is not None:
+            self.profiler.watch()
+        #  every worker records into stats of its own, added to the search's once it is done
+        stats = SearchStats() if self.stats is not None else None
+        with Recording(stats):
+            while self.claim_iteration():
+                self.run_iteration(queue, rng)
+            queue.flush()
+        if stats is not None:
+            with self.counter_lock:
+                self.stats.merge(stats)
+
+    def run_iteration(self: MonteCarloSearch, queue: LeafEvaluationQueue | None = None,
+                      rng: SimulationRandom | None = None) -> None:
+        """
+        Runs a single iteration of the search, selecting a leaf, expanding one of its moves, and queueing the new node
+        to be scored, its value being backed up to the root once its batch is scored
+
+        :param queue: The queue to score the leaf through, defaults to the search's own queue
+        :param rng: The random stream to draw from, defaults to the search's own stream
+        :return: None
+        """
+        path = self.select_leaf(rng if rng is not None else self.rng)
+        (queue if queue is not None else self.queue).submit(path[-1].value,
+                                                             lambda value: self.backpropagate(path, value))
+        self.max_depth = max(self.max_depth, len(path) - 1)
+
+    def select_leaf(self: MonteCarloSearch, rng: SimulationRandom) -> List[GameTreeNode]:
+        """
+        Descends from the root to a leaf, expanding one of the leaf's moves if it has any left, and applies a virtual
+        loss to every node on the way
+
+        :param rng: The random stream picking the move to expand, handed to the expanded game for its playouts
+        :return: The nodes from the root to the selected leaf
+        """
+        node = self.tree.root
+        path: List[GameTreeNode] = [node]
+        self.update_statistics(node, 0, self.virtual_loss)
+        while True:
+            move: List[int] | None = None
+            with self.node_lock(node):
+                if node.untried_moves is None:
+                    node.untried_moves = [] if self.is_terminal(node.value) else node.value.generate_valid_moves()
+                untried_moves = node.untried_moves
+                if len(untried_moves) > 0:
+                    move = untried_moves.pop(rng.below(len(untried_moves)))
+                elif len(node.children) > 0:
+                    child = self.select_child(node)
+                else:
+                    #  the game is over at this node, there is nothing left to expand
+                    break
+            if move is not None:
+                child_game = node.value.make_move(move)
+                child_game.rng = rng
+                child = self.create_node(child_game, move)
+                with self.tree_lock:
+                    #  eviction only runs under the tree lock, if it collapsed the node, or one of its ancestors, since
+                    #  the move was popped, the child is scored but left out of the tree
+                    if node.untried_moves is untried_moves and self.tree.contains(node):
+                        self.tree.attach(node, child, self.node_lock)
+                path.append(child)
+                self.update_statistics(child, 0, self.virtual_loss)
+                break
+            self.tree.hits += 1
+            path.append(child)
+            self.update_statistics(child, 0, self.virtual_loss)
+            node = child
+        return path
+
+    def select_child(self: MonteCarloSearch, node: GameTreeNode) -> GameTreeNode:
+        """
+        Selects the child with the highest UCT value. The exploitation term comes from the shared statistics of the
+        child's position, which hold every line reaching it.
+
+        :param node: The node whose children are being selected from
+        :return: The selected child
+        """
+        log_visits = math.log(max(node.denominator, 1))
+        best_child: GameTreeNode | None = None
+        best_value = -math.inf
+        for each_child in node.children:
+            if each_child.denominator == 0:
+                return each_child
+            numerator, denominator = self.shared_statistics(each_child)
+            if denominator > 0:
+                mean = numerator / denominator
+            else:
+                mean = each_child.numerator / each_child.denominator
+            value = mean + self.exploration * math.sqrt(log_visits / each_child.denominator)
+            if value > best_value:
+                best_child = each_child
+                best_value = value
+        return best_child
+
+    def shared_statistics(self: MonteCarloSearch, node: GameTreeNode) -> Tuple[float, float]:
+        """
+        Reads the statistics of the node's position, from the shared node pool when searching in a worker process, and
+        from the transposition table otherwise
+
+        :param node: The node being looked up
+        :return: The numerator and denominator of the position
+        """
+        key = node.value.position_hash()
+        if self.node_pool is not None:
+            return self.node_pool.statistics(key)
+        entry = self.transposition_table.probe(key)
+        return (entry.numerator, entry.denominator) if entry is not None else (0, 0)
+
+    def update_statistics(self: MonteCarloSearch, node: GameTreeNode, numerator: float, denominator: float) -> None:
+        """
+        Adds to the statistics of the node, and to the shared statistics of its position
+
+        :param node: The node being updated
+        :param numerator: The amount added to the numerator
+        :param denominator: The amount added to the denominator
+        :return: None
+        """
+        with self.node_lock(node):
+            node.numerator += numerator
+            node.denominator += denominator
+        key = node.value.position_hash()
+        if self.node_pool is not None:
+            self.node_pool.update(key, numerator, denominator)
+            return
+        with self.table_lock:
+            entry = self.transposition_table.entry(key)
+            entry.numerator += numerator
+            entry.denominator += denominator
+            #  a table in shared memory hands out copies of its entries, which only reach it once stored
+            self.transposition_table.store(entry)
+
+    def backpropagate(self: MonteCarloSearch, path: List[GameTreeNode], value: float) -> None:
+        """
+        Backs the value of the leaf up the path, rewarding both the nodes and their shared statistics. Every node keeps
+        one of the visits counted during the selection, the rest of its virtual loss being taken back.
+
+        :param path: The nodes from the root to the scored leaf
+        :param value: The expected result for white of the leaf
+        :return: None
+        """
+        for each_node in path:
+            self.update_statistics(each_node, self.reward(each_node, value), 1 - self.virtual_loss)
+
+    def search_processes(self: MonteCarloSearch, iterations: int | None, time_limit: float | None) -> None:
+        """
+        Runs the search in worker processes sharing a SharedNodePool, or the search's SharedTranspositionTable, then
+        reads the statistics of the root moves back from it
+
+        :param iterations: The maximum amount of iterations to run, split between the workers
+        :param time_limit: The maximum amount of seconds to search for
+        :return: None
+        """
+        shared_table = isinstance(self.transposition_table, SharedTranspositionTable)
+        pool = self.transposition_table if shared_table else SharedNodePool.create()
+        try:
+            results = multiprocessing.Queue()
+            worker_iterations = math.ceil(iterations / self.processes) if iterations is not None else None
+            workers = [multiprocessing.Process(target=MonteCarloSearch.run_process_worker, args=(
+                self.tree.root.value, self.root_moves, pool.handle(), worker_iterations, time_limit, self.evaluator,
+                self.exploration, self.batch_size, self.virtual_loss, self.max_nodes, self.max_bytes,
+                self.rng.spawn().seed, results, shared_table, self.stats is not None
+            )) for _ in range(self.processes)]
+            try:
+                for each_worker in workers:
+                    each_worker.start()
+                for _ in workers:
+                    worker_iterations, worker_depth, worker_stats = self.next_worker_result(results, workers)
+                    self.iterations += worker_iterations
+                    self.max_depth = max(self.max_depth, worker_depth)
+                    if worker_stats is not None:
+                        self.stats.merge(worker_stats)
+            finally:
+                #  a failed worker leaves the others running, they are stopped rather than waited on
+                for each_worker in workers:
+                    if each_worker.is_alive():
+                        each_worker.terminate()
+                    if each_worker.pid is not None:
+                        each_worker.join()
+            self.collect_node_pool(pool)
+        finally:
+            if not shared_table:
+                pool.close()
+
+    @staticmethod
+    def next_worker_result(results: multiprocessing.Queue,
+                           workers: List[multiprocessing.Process]) -> Tuple[int, int, SearchStats | None]:
+        """
+        Waits for the next worker process to put its result on the queue, checking every WORKER_POLL_INTERVAL
+        seconds that no worker died before it could
+
+        :param results: The queue the workers put their results on
+        :param workers: The worker processes
+        :return: The worker's iteration count, depth and stats
+        """
+        while True:
+            try:
+                worker_iterations, worker_depth, worker_stats, error = results.get(timeout=WORKER_POLL_INTERVAL)
+            except queue.Empty:
+                for each_worker in workers:
+                    if each_worker.exitcode not in (None, 0):
+                        raise RuntimeError("A search worker process died with exit code {}".format(
+                            each_worker.exitcode))
+                continue
+            if error is not None:
+                raise RuntimeError("A search worker process failed:\n{}".format(error))
+            return worker_iterations, worker_depth, worker_stats
+
+    @staticmethod
+    def run_process_worker(game: Game, root_moves: List[List[int]] | None,
+                           pool_handle: Tuple[str, int, List[multiprocessing.Lock]] | Tuple[str, int],
+                           iterations: int | None,
+                           time_limit: float | None, evaluator: LeafEvaluator, exploration: float, batch_size: int,
+                           virtual_loss: int, max_nodes: int | None, max_bytes: int | None, seed: int,
+                           results: multiprocessing.Queue, shared_table: bool = False,
+                           instrument: bool = False) -> None:
+        """
+        Runs the search of one worker process, attached to the shared node pool, or to the shared transposition
+        table, which then holds the statistics in its place
+
+        :return: None, the worker's iteration count, depth, stats and error, None unless the search raised, are put
+            on the results queue
+        """
+        pool = SharedTranspositionTable.attach(*pool_handle) if shared_table else SharedNodePool.attach(*pool_handle)
+        try:
+            search = MonteCarloSearch(game, root_moves, exploration,
+                                      transposition_table=pool if shared_table else None, max_nodes=max_nodes,
+                                      max_bytes=max_bytes, evaluator=evaluator, batch_size=batch_size,
+                                      virtual_loss=virtual_loss, node_pool=pool, seed=seed, instrument=instrument)
+            search.search(iterations, time_limit)
+            results.put((search.iterations, search.max_depth, search.stats, None))
+        except Exception:
+            #  the parent waits on a result from every worker, so a failure is put on the queue in place of one
+            results.put((0, 0, None, traceback.format_exc()))
+        finally:
+            pool.close()
+
+    def collect_node_pool(self: MonteCarloSearch, pool: SharedNodePool | SharedTranspositionTable) -> None:
+        """
+        Expands every root move and adds the statistics the workers gathered in the pool to the root and its children.
+        A shared transposition table already holds every visit of the search, the nodes' own included, so the nodes
+        take its statistics as they are, unless their entry is missing from it.
+
+        :param pool: The pool, or the search's shared table, the workers searched with
+        :return: None
+        """
+        root = self.tree.root
+        if root.untried_moves is None:
+            root.untried_moves = [] if self.is_terminal(root.value) else root.value.generate_valid_moves()
+        while len(root.untried_moves) > 0:
+            move = root.untried_moves.pop()
+            self.tree.attach(root, self.create_node(root.value.make_move(move), move))
+        for each_node in [root] + root.children:
+            numerator, denominator = pool.statistics(each_node.value.position_hash())
+            if pool is self.transposition_table:
+                if denominator <= 0:
+                    #  the entry was replaced, or torn by a racing write, so the node keeps its own counts
+                    continue
+                with self.node_lock(each_node):
+                    each_node.numerator = numerator
+                    each_node.denominator = denominator
+            else:
+                self.update_statistics(each_node, numerator, denominator)
+
+    def advance(self: MonteCarloSearch, move: List[int]) -> bool:
+        """
+        Re-roots the search at the position after the move supplied, so the search of the next position carries on
+        from the subtree already grown below the move, such as the tree grown while pondering on the opponent's time.
+        The rest of the tree is dropped. Must not be called while the search is running.
+
+        :param move: The move played from the root, in the format [from_x, from_y, to_x, to_y]
+        :return: Whether the move had been searched, in which case its subtree is kept, otherwise the search restarts
+        """
+        root = self.tree.root
+        child = next((each_child for each_child in root.children if each_child.move == move), None)
+        self.root_moves = None
+        if child is None:
+            self.tree.set_root(self.create_node(root.value.make_move(move), move))
+            self.max_depth = 0
+            self.analysis = self.load_analysis()
+            return False
+        self.tree.set_root(child)
+        self.max_depth = max(self.max_depth - 1, 0)
+        #  the analysis was of the previous root, the new root is only warm-started if it has not been visited yet
+        self.analysis = self.load_analysis()
+        return True
+
+    def load_analysis(self: MonteCarloSearch) -> AnalysisEntry | None:
+        """
+        Warm-starts a fresh root from the analysis cache, expanding the stored best move and crediting it, and the
+        root, with the visits that went through the move and its score. The shared statistics of the move are only
+        credited if the transposition table knows nothing of its position yet, so searches sharing a table do not count
+        the stored visits twice.
+
+        :return: The stored result the root was warm-started from, or None if there was none, or its move is not one
+            the root may play
+        """
+        root = self.tree.root
+        if self.analysis_cache is None or self.node_pool is not None or root.denominator > 0:
+            return None
+        entry = self.analysis_cache.lookup(root.value.position_hash())
+        if entry is None or entry.best_move is None or entry.best_move_visits <= 0:
+            return None
+        if root.untried_moves is None:
+            root.untried_moves = [] if self.is_terminal(root.value) else root.value.generate_valid_moves()
+        if entry.best_move not in root.untried_moves:
+            #  the stored move is not one of the root moves, the root being restricted, or the hash having collided
+            return None
+        root.untried_moves.remove(entry.best_move)
+        child = self.create_node(root.value.make_move(entry.best_move), entry.best_move)
+        child.value.rng = self.rng
+        self.tree.attach(root, child)
+        visits = entry.best_move_visits
+        with self.node_lock(root):
+            root.numerator += (1 - entry.score) * visits
+            root.denominator += visits
+        if self.transposition_table.probe(child.value.position_hash()) is None:
+            self.update_statistics(child, entry.score * visits, visits)
+        else:
+            child.numerator += entry.score * visits
+            child.denominator += visits
+        self.max_depth = max(self.max_depth, entry.depth)
+        return entry
+
+    def analysis_covers(self: MonteCarloSearch, iterations: int | None) -> bool:
+        """
+        Checks if the stored result the root was warm-started from is backed by at least the amount of iterations a
+        caller is about to search, in which case the caller may answer with `result()` right away
+
+        :param iterations: The amount of iterations the caller is about to search, None if limited by time only
+        :return: Whether searching can be skipped
+        """
+        return self.analysis is not None and self.root_moves is None and iterations is not None and \
+            self.analysis.visits >= iterations
+
+    def save_analysis(self: MonteCarloSearch, result: SearchResult) -> None:
+        """
+        Records the result of the search of the root in the analysis cache. Results of a root restricted to some of its
+        moves are not recorded, their best move not being the best move of the position.
+
+        :param result: The result of the search
+        :return: None
+        """
+        if self.analysis_cache is None or self.node_pool is not None or self.root_moves is not None or \
+                result.best_move is None or self.tree.root.denominator <= 0:
+            return
+        self.analysis_cache.record(AnalysisEntry(self.tree.root.value.position_hash(), result.best_move,
+                                                 result.score, int(self.tree.root.denominator), result.depth,
+                                                 int(result.move_scores[0].visits)))
+
+    def principal_variation(self: MonteCarloSearch) -> List[List[int]]:
+        """
+        Follows the most visited child from the root down to a leaf
+
+        :return: The line of moves the search expects to be played
+        """
+        line: List[List[int]] = []
+        node = self.tree.root
+        while len(node.children) > 0:
+            node = max(node.children, key=lambda each_child: each_child.denominator)
+            line.append(node.move)
+        return line
+
+    def result(self: MonteCarloSearch) -> SearchResult:
+        """
+        Summarizes the search so far. Root moves that were never visited are reported with a neutral score of 0.5.
+
+        :return: The result of the search
+        """
+        root = self.tree.root
+        move_scores = [MoveScore(each_child.move, each_child.numerator / max(each_child.denominator, 1),
+                                 each_child.denominator) for each_child in root.children]
+        move_scores.sort(key=lambda each_score: (each_score.visits, each_score.score), reverse=True)
+        if root.untried_moves is not None:
+            move_scores.extend(MoveScore(each_move, 0.5, 0) for each_move in root.untried_moves)
+        best_score = move_scores[0] if len(move_scores) > 0 else None
+        return SearchResult(
+            best_score.move if best_score is not None else None,
+            best_score.score if best_score is not None else 0.5,
+            self.iterations,
+            self.max_depth,
+            self.elapsed,
+            self.principal_variation(),
+            move_scores,
+            self.stats.copy() if self.stats is not None else None
+        )
@@ -4,10 +4,10 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class InfiniteDirection:
     """
-    Represents the details of the infinite direction movement
+    Represents the details of the infinite direction movement, frozen so every piece of a type can share it
 
     :var: x - Whether it can move in the x direction infinitely
     :var: y - Whether it can move in the y direction infinitely
@@ -18,10 +18,10 @@ class InfiniteDirection:
     diagonal: Optional[bool] = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class MoveSet:
     """
-    Represents the details of the move set of a chess piece
+    Represents the details of the move set of a chess piece, frozen so every piece of a type can share it
 
     :var: x - The x step the piece can take
     :var: y - The y step the piece can take
@@ -0,0 +1,143 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple, TYPE_CHECKING
+from Types.Helpers import piece_value
+from Types.LeafEvaluator import LeafEvaluator, SCORE_SCALE
+from Types.LookupTables import LOOKUP_TABLES, PIECE_NAMES, SQUARES
+from Types.Player import Team
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if TYPE_CHECKING:
+    from Types.Game import Game
+
+PLANE_COUNT: int = len(Team) * len(PIECE_NAMES)  # One plane per piece name and team
+INPUT_SIZE: int = PLANE_COUNT * SQUARES + 1  # Every plane, followed by whether white is to move
+
+
+class NumpyEvaluator(LeafEvaluator):
+    """
+    Scores leaves with a small CPU-only NumPy model, either linear or a multi-layer perceptron, over a piece-plane
+    encoding of the board: one 64 square plane per piece name and team, set to 1 where such a piece stands.
+
+    A whole batch of leaves is encoded into one matrix and scored with one matrix multiply per layer, which costs about
+    the same for hundreds of leaves as it does for one. NumPy releases the GIL while multiplying, so batches scored from
+    several search threads run in parallel.
+    """
+
+    def __init__(self: NumpyEvaluator, layers: List[Tuple[numpy.ndarray, numpy.ndarray]] | None = None) -> None:
+        """
+        Initializes the model from its layers, each a pair of weights and biases. Every layer but the last is followed
+        by a ReLU, and the last layer has a single output, squashed into a probability. Without layers, a linear model
+        scoring material and piece-square bonuses is used.
+
+        :param layers: The (weights, biases) of every layer, the first taking INPUT_SIZE inputs
+        """
+        if numpy is None:
+            raise ImportError("NumpyEvaluator requires numpy, install it with `pip install numpy`")
+        self.layers: List[Tuple[numpy.ndarray, numpy.ndarray]] = layers if layers is not None \
+            else NumpyEvaluator.material_layers()
+        self.plane_offsets: Dict[Tuple[str, Team], int] = {}
+        for each_team in Team:
+            for name_index, each_name in enumerate(PIECE_NAMES):
+                self.plane_offsets[(each_name, each_team)] = (each_team.value * len(PIECE_NAMES) + name_index) * SQUARES
+
+    @staticmethod
+    def material_layers() -> List[Tuple[numpy.ndarray, numpy.ndarray]]:
+        """
+        Builds a linear model equivalent to the material and piece-square part of the static evaluation, the pawn
+        structure terms not being linear in the squares occupied
+
+        :return: The single (weights, biases) layer of the model
+        """
+        weights = numpy.zeros((INPUT_SIZE, 1), dtype=numpy.float32)
+        for each_team in Team:
+            sign = 1 if each_team == Team.WHITE else -1
+            for name_index, each_name in enumerate(PIECE_NAMES):
+                offset = (each_team.value * len(PIECE_NAMES) + name_index) * SQUARES
+                material = piece_value(each_name) if each_name != "King" else 0
+                for square in range(SQUARES):
+                    bonus = LOOKUP_TABLES.piece_square_value(each_name, each_team, square % 8, square // 8)
+                    weights[offset + square, 0] = sign * (material + bonus) * numpy.log(10) / SCORE_SCALE
+        return [(weights, numpy.zeros(1, dtype=numpy.float32))]
+
+    @staticmethod
+    def load(path: str) -> NumpyEvaluator:
+        """
+        Loads a model saved with `save`
+
+        :param path: The path to the .npz file
+        :return: The loaded evaluator
+        """
+        if numpy is None:
+            raise ImportError("NumpyEvaluator requires numpy, install it with `pip install numpy`")
+        with numpy.load(path) as archive:
+            layer_count = len(archive.files) // 2
+            return NumpyEvaluator([(archive["weights_{}".format(index)], archive["biases_{}".format(index)])
+                                   for index in range(layer_count)])
+
+    def save(self: NumpyEvaluator, path: str) -> None:
+        """
+        Saves the model's layers to an .npz file
+
+        :param path: The path to the .npz file
+        :return: None
+        """
+        arrays: Dict[str, numpy.ndarray] = {}
+        for index, (weights, biases) in enumerate(self.layers):
+            arrays["weights_{}".format(index)] = weights
+            arrays["biases_{}".format(index)] = biases
+        numpy.savez(path, **arrays)
+
+    def encode(self: NumpyEvaluator, games: List[Game]) -> numpy.ndarray:
+        """
+        Encodes the games into piece planes, one row per game
+
+        :param games: The games to encode
+        :return: The (len(games), INPUT_SIZE) matrix of inputs
+        """
+        rows: List[int] = []
+        columns: List[int] = []
+        for row, each_game in enumerate(games):
+            for each_player in [each_game.player_1, each_game.player_2]:
+                for each_piece in each_player.pieces:
+                    rows.append(row)
+                    columns.append(self.plane_offsets[(each_piece.name, each_piece.team)] +
+                                   each_piece.y * 8 + each_piece.x)
+            if each_game.turn == Team.WHITE:
+                rows.append(row)
+                columns.append(INPUT_SIZE - 1)
+        inputs = numpy.zeros((len(games), INPUT_SIZE), dtype=numpy.float32)
+        inputs[rows, columns] = 1
+        return inputs
+
+    def predict(self: NumpyEvaluator, inputs: numpy.ndarray) -> numpy.ndarray:
+        """
+        Runs the model over a matrix of encoded positions
+
+        :param inputs: The (n, INPUT_SIZE) matrix of inputs
+        :return: The n expected results for white
+        """
+        activations = inputs
+        for index, (weights, biases) in enumerate(self.layers):
+            activations = activations @ weights + biases
+            if index < len(self.layers) - 1:
+                numpy.maximum(activations, 0, out=activations)
+        return 1 / (1 + numpy.exp(-activations[:, 0]))
+
+    def evaluate(self: NumpyEvaluator, games: List[Game]) -> List[float]:
+        """
+        Scores every game supplied with one pass of the model, finished games being scored exactly
+
+        :param games: The leaves to score
+        :return: The expected result for white of each game, in the same order
+        """
+        values: List[float | None] = [self.terminal_value(each_game) for each_game in games]
+        pending = [index for index, each_value in enumerate(values) if each_value is None]
+        if len(pending) > 0:
+            predictions = self.predict(self.encode([games[index] for index in pending]))
+            for index, each_prediction in zip(pending, predictions.tolist()):
+                values[index] = each_prediction
+        return values
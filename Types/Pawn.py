@@ -1,17 +1,27 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 
 from Types.MoveSet import MoveSet
 from Types.ChessPiece import ChessPiece
+from Types.PieceType import PieceType
 
 if TYPE_CHECKING:
     from Types.Player import Team
 
 
+PAWN_MOVES: Tuple[MoveSet, ...] = (MoveSet(0, 1), MoveSet(0, 2))
+PAWN_CAPTURE_MOVES: Tuple[MoveSet, ...] = (MoveSet(1, 1), MoveSet(-1, -1))
+
+
 class Pawn(ChessPiece):
     """
     Represents a pawn piece on the chess board. https://www.chess.com/terms/chess-pawn
     """
+    __slots__ = ()
+
+    piece_type: PieceType = PieceType("Pawn", PAWN_MOVES, PAWN_CAPTURE_MOVES)
+    name: str = piece_type.name
+
     def __init__(self: Pawn, x: int, y: int, team: Team) -> None:
         """
         Initializes a pawn instance, setting the x and y to its initial coordinates.
@@ -20,5 +30,4 @@ class Pawn(ChessPiece):
         :param y: The row where the pawn is being placed
         :param team: The team the piece belongs to
         """
-        super().__init__(x, y, [MoveSet(0, 1), MoveSet(0, 2)], [MoveSet(1, 1), MoveSet(-1, -1)], team)
-        self.name = "Pawn"
+        super().__init__(x, y, team)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+PAWN_HASH_ENTRIES: int = 1 << 14  # The default amount of slots, a power of two so the slot is the low bits of the key
+
+
+class PawnHashTable:
+    """
+    A pawn hash table, https://www.chessprogramming.org/Pawn_Hash_Table, caching the pawn structure score of every
+    pawn formation evaluated, keyed by the board's pawn-only Zobrist hash. Pawns move rarely compared to the other
+    pieces, so neighbouring positions nearly always share their pawn structure, and its score is looked up rather
+    than computed again.
+
+    The table has a fixed amount of slots, each holding one (key, score) pair, a newer formation replacing the one in
+    its slot. Each slot is replaced as a whole, so a search thread never reads the key of one formation along with the
+    score of another.
+    """
+
+    def __init__(self: PawnHashTable, size: int = PAWN_HASH_ENTRIES) -> None:
+        """
+        Initializes an empty table
+
+        :param size: The amount of slots, rounded up to a power of two
+        """
+        self.size: int = 1 << max(size - 1, 0).bit_length()
+        self.mask: int = self.size - 1
+        self.entries: List[Tuple[int, int] | None] = [None] * self.size
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def probe(self: PawnHashTable, key: int) -> int | None:
+        """
+        Looks up the score of the pawn formation supplied
+
+        :param key: The pawn hash of the formation
+        :return: The score of the formation, or None if it is not in the table
+        """
+        entry = self.entries[key & self.mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def store(self: PawnHashTable, key: int, score: int) -> None:
+        """
+        Stores the score of a pawn formation, replacing whatever formation held its slot
+
+        :param key: The pawn hash of the formation
+        :param score: The score of the formation
+        :return: None
+        """
+        self.entries[key & self.mask] = (key, score)
+
+    @property
+    def hit_rate(self: PawnHashTable) -> float:
+        """
+        The fraction of probes that found their formation in the table
+        """
+        probes = self.hits + self.misses
+        return self.hits / probes if probes > 0 else 0
+
+    def clear(self: PawnHashTable) -> None:
+        self.entries = [None] * self.size
+        self.hits = 0
+        self.misses = 0
+
+
+PAWN_HASH_TABLE: PawnHashTable = PawnHashTable()  # The table shared by every Evaluation that is not given its own
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+from Types.LookupTables import DIAGONAL_RAYS, X_RAYS, Y_RAYS
+from Types.MoveSet import MoveSet
+
+
+@dataclass(frozen=True)
+class PieceType:
+    """
+    Describes everything pieces of one type have in common, their name and how they move. A single, immutable
+    descriptor exists per type and is shared by every piece of that type, so creating or copying a piece allocates no
+    move sets, and copying a descriptor (as deepcopy does when a game is cloned) returns the descriptor itself.
+
+    :var: name - The name of the type, such as "Pawn" or "Queen"
+    :var: move_set - The moves pieces of the type can make
+    :var: capture_moves - The moves pieces of the type can capture with
+    :var: offsets - The (x, y) steps of the move set that do not slide, precomputed from move_set
+    :var: ray_indexes - The indexes of the LookupTables rays pieces of the type slide along, precomputed from move_set
+    """
+    name: str
+    move_set: Tuple[MoveSet, ...]
+    capture_moves: Tuple[MoveSet, ...]
+    offsets: Tuple[Tuple[int, int], ...] = field(init=False)
+    ray_indexes: Tuple[int, ...] = field(init=False)
+
+    def __post_init__(self: PieceType) -> None:
+        offsets = tuple((each_move.x, each_move.y) for each_move in self.move_set
+                        if each_move.infinite_direction is None)
+        ray_indexes: Tuple[int, ...] = ()
+        for each_move in self.move_set:
+            if each_move.infinite_direction is None:
+                continue
+            if each_move.infinite_direction.x:
+                ray_indexes += X_RAYS
+            elif each_move.infinite_direction.y:
+                ray_indexes += Y_RAYS
+            elif each_move.infinite_direction.diagonal:
+                ray_indexes += DIAGONAL_RAYS
+        object.__setattr__(self, "offsets", offsets)
+        object.__setattr__(self, "ray_indexes", ray_indexes)
+
+    def __copy__(self: PieceType) -> PieceType:
+        return self
+
+    def __deepcopy__(self: PieceType, memo: Dict[int, object]) -> PieceType:
+        return self
@@ -1,17 +1,28 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 from Types.MoveSet import MoveSet
 from Types.MoveSet import InfiniteDirection
 from Types.ChessPiece import ChessPiece
+from Types.PieceType import PieceType
 
 if TYPE_CHECKING:
     from Types.Player import Team
 
 
+QUEEN_MOVES: Tuple[MoveSet, ...] = (MoveSet(0, 0, InfiniteDirection(False, False, True)),
+                                    MoveSet(0, 0, InfiniteDirection(True, False, False)),
+                                    MoveSet(0, 0, InfiniteDirection(False, True, False)))
+
+
 class Queen(ChessPiece):
     """
     The Queen Piece in chess. https://en.wikipedia.org/wiki/Queen_(chess)
     """
+    __slots__ = ()
+
+    piece_type: PieceType = PieceType("Queen", QUEEN_MOVES, QUEEN_MOVES)
+    name: str = piece_type.name
+
     def __init__(self: Queen, x: int, y: int, team: Team) -> None:
         """
         Initializes the Queen Piece instance
@@ -20,12 +31,4 @@ class Queen(ChessPiece):
         :param y: The row where the queen piece is being placed upon its creation
         :param team: The team the piece belongs to
         """
-        super().__init__(x, y,
-                         [MoveSet(0, 0, InfiniteDirection(False, False, True)),
-                          MoveSet(0, 0, InfiniteDirection(True, False, False)),
-                          MoveSet(0, 0, InfiniteDirection(False, True, False))],
-                         [MoveSet(0, 0, InfiniteDirection(False, False, True)),
-                          MoveSet(0, 0, InfiniteDirection(True, False, False)),
-                          MoveSet(0, 0, InfiniteDirection(False, True, False))],
-                         team)
-        self.name = "Queen"
+        super().__init__(x, y, team)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+from typing import List, TYPE_CHECKING
+from Types.LeafEvaluator import LeafEvaluator
+from Types.QuiescenceSearch import QuiescenceSearch
+
+if TYPE_CHECKING:
+    from Types.Game import Game
+
+
+class QuiescenceEvaluator(LeafEvaluator):
+    """
+    Scores each leaf with a quiescence search, the static evaluation of the position once every capture worth making
+    has been made, converted to an expected result. Unlike a random playout, the value of a leaf reached in the middle
+    of an exchange does not depend on whether the exchange happens to be finished, so the values are stable and the
+    tree search converges in far fewer nodes.
+    """
+
+    def __init__(self: QuiescenceEvaluator, quiescence: QuiescenceSearch | None = None) -> None:
+        """
+        Initializes a QuiescenceEvaluator instance
+
+        :param quiescence: The quiescence search scoring the leaves, defaults to a new QuiescenceSearch
+        """
+        self.quiescence: QuiescenceSearch = quiescence if quiescence is not None else QuiescenceSearch()
+
+    def evaluate(self: QuiescenceEvaluator, games: List[Game]) -> List[float]:
+        """
+        Scores every game supplied, finished games being scored exactly
+
+        :param games: The leaves to score
+        :return: The expected result for white of each game, in the same order
+        """
+        values: List[float] = []
+        for each_game in games:
+            value = self.terminal_value(each_game)
+            values.append(value if value is not None else self.centipawn_value(self.quiescence.score(each_game)))
+        return values
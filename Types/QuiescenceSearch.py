@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from typing import List, TYPE_CHECKING
+from Types.Evaluation import Evaluation
+from Types.Helpers import piece_value
+from Types.Player import Team
+
+if TYPE_CHECKING:
+    from Types.ChessPiece import ChessPiece
+    from Types.Game import Game
+    from Types.Player import Player
+
+MATE_SCORE: int = 100000  # The score of capturing the king, less the plies it takes, above any material balance
+QUIESCENCE_MAX_PLY: int = 8  # The amount of plies the quiescence search may extend a leaf by
+DELTA_MARGIN: int = 200  # The positional swing a capture may bring on top of the material it wins
+
+
+class QuiescenceSearch:
+    """
+    Quiescence search, https://www.chessprogramming.org/Quiescence_Search, which extends a leaf through captures until
+    the position is quiet, so the leaf is not scored in the middle of an exchange. Scores are in centipawns, from the
+    point of view of the player to move.
+
+    The player to move may stand pat, https://www.chessprogramming.org/Quiescence_Search#Standing_Pat, taking the
+    static evaluation instead of capturing, which cuts the search off as soon as it is good enough. Captures are tried
+    most valuable victim first, least valuable attacker first (MVV-LVA), and are skipped by delta pruning,
+    https://www.chessprogramming.org/Delta_Pruning, when even winning the victim would not lift the score to alpha, or
+    when the static exchange evaluation says the capture loses material. A player in check may not stand pat, every
+    move is searched as a check evasion.
+
+    Games end once a king is captured, so a player who can capture the enemy king has won, which refutes the previous
+    move, such as an evasion that left the king in check.
+    """
+
+    def __init__(self: QuiescenceSearch, evaluation: Evaluation | None = None, max_ply: int = QUIESCENCE_MAX_PLY,
+                 delta_pruning: bool = True, delta_margin: int = DELTA_MARGIN) -> None:
+        """
+        Initializes a QuiescenceSearch instance
+
+        :param evaluation: The static evaluation standing pat is scored with, defaults to a new Evaluation
+        :param max_ply: The amount of plies a leaf may be extended by, after which it is scored as it stands
+        :param delta_pruning: Whether captures that cannot lift the score to alpha are skipped
+        :param delta_margin: The positional swing a capture may bring on top of the material it wins
+        """
+        self.evaluation: Evaluation = evaluation if evaluation is not None else Evaluation()
+        self.max_ply: int = max_ply
+        self.delta_pruning: bool = delta_pruning
+        self.delta_margin: int = delta_margin
+        self.nodes: int = 0  # The amount of positions the quiescence search visited
+
+    @staticmethod
+    def find_king(player: Player) -> ChessPiece | None:
+        """
+        Finds the king of a player
+
+        :param player: The player whose king is looked for
+        :return: The king, or None if it has been captured
+        """
+        for each_piece in player.pieces:
+            if each_piece.name == "King":
+                return each_piece
+        return None
+
+    @staticmethod
+    def opponent(game: Game) -> Player:
+        """
+        Finds the player who is not to move
+
+        :param game: The game being searched
+        :return: The Player instance waiting for its turn
+        """
+        return game.player_2 if game.current_player() == game.player_1 else game.player_1
+
+    @staticmethod
+    def in_check(game: Game) -> bool:
+        """
+        Checks if the king of the player to move is attacked
+
+        :param game: The game being searched
+        :return: Whether the player to move is in check
+        """
+        king = QuiescenceSearch.find_king(game.current_player())
+        return king is not None and len(game.board.attackers_to(king.x, king.y,
+                                                                QuiescenceSearch.opponent(game).team)) > 0
+
+    @staticmethod
+    def can_capture_king(game: Game) -> bool:
+        """
+        Checks if the player to move attacks the enemy king, which means the previous move left it en prise
+
+        :param game: The game being searched
+        :return: Whether the player to move wins by capturing the king
+        """
+        king = QuiescenceSearch.find_king(QuiescenceSearch.opponent(game))
+        return king is None or len(game.board.attackers_to(king.x, king.y, game.turn)) > 0
+
+    @staticmethod
+    def capture_order(game: Game, move: List[int]) -> int:
+        """
+        Ranks a move for MVV-LVA ordering, captures by the value of the victim then the cheapness of the attacker, and
+        quiet moves after every capture
+
+        :param game: The game the move is played in
+        :param move: The move, in the format [from_x, from_y, to_x, to_y]
+        :return: The rank of the move, higher being searched first
+        """
+        victim = game.board.grab_piece(move[2], move[3])
+        if victim is None:
+            return 0
+        return piece_value(victim.name) * 16 - piece_value(game.board.grab_piece(move[0], move[1]).name) // 100
+
+    def evaluate(self: QuiescenceSearch, game: Game) -> int:
+        """
+        Scores the game statically, from the point of view of the player to move
+
+        :param game: The game to score
+        :return: The score in centipawns
+        """
+        score = self.evaluation.evaluate(game.board)
+        return score if game.turn == Team.WHITE else -score
+
+    def search(self: QuiescenceSearch, game: Game, alpha: int, beta: int, ply: int = 0) -> int:
+        """
+        Searches the captures, or the evasions when in check, of the game until the position is quiet
+
+        :param game: The game to search, it is never modified
+        :param alpha: The score the player to move is already assured of
+        :param beta: The score the opponent is already assured of, a score at or above it is cut off
+        :param ply: The plies the quiescence search has extended the leaf by so far
+        :return: The score in centipawns from the point of view of the player to move, a fail-hard score within
+            alpha and beta
+        """
+        self.nodes += 1
+        if self.can_capture_king(game):
+            return min(MATE_SCORE - ply, beta)
+        in_check = self.in_check(game)
+        if not in_check:
+            stand_pat = self.evaluate(game)
+            if stand_pat >= beta:
+                return beta
+            if self.delta_pruning and stand_pat + piece_value("Queen") + self.delta_margin < alpha:
+                #  not even winning a queen would lift the score to alpha
+                return alpha
+            alpha = max(alpha, stand_pat)
+            if ply >= self.max_ply:
+                return alpha
+            moves = [each_move for each_move in game.generate_valid_moves()
+                     if game.board.grab_piece(each_move[2], each_move[3]) is not None]
+        else:
+            if ply >= self.max_ply:
+                return min(max(self.evaluate(game), alpha), beta)
+            moves = game.generate_valid_moves()
+        moves.sort(key=lambda each_move: self.capture_order(game, each_move), reverse=True)
+        for each_move in moves:
+            if not in_check and self.delta_pruning:
+                victim = game.board.grab_piece(each_move[2], each_move[3])
+                if stand_pat + piece_value(victim.name) + self.delta_margin <= alpha or \
+                        game.board.static_exchange_evaluation(*each_move) < 0:
+                    continue
+            score = -self.search(game.make_move(each_move), -beta, -alpha, ply + 1)
+            if score >= beta:
+                return beta
+            alpha = max(alpha, score)
+        if in_check and len(moves) == 0:
+            #  the player cannot move out of check, its king is captured on the next ply
+            return min(max(-(MATE_SCORE - ply - 1), alpha), beta)
+        return alpha
+
+    def score(self: QuiescenceSearch, game: Game) -> int:
+        """
+        Scores a leaf once it has been extended until quiet
+
+        :param game: The game to score, it is never modified
+        :return: The score in centipawns, positive when white is better
+        """
+        score = self.search(game, -MATE_SCORE, MATE_SCORE)
+        return score if game.turn == Team.WHITE else -score
@@ -1,17 +1,27 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Tuple, TYPE_CHECKING
 from Types.MoveSet import MoveSet
 from Types.MoveSet import InfiniteDirection
 from Types.ChessPiece import ChessPiece
+from Types.PieceType import PieceType
 
 if TYPE_CHECKING:
     from Types.Player import Team
 
 
+ROOK_MOVES: Tuple[MoveSet, ...] = (MoveSet(0, 0, InfiniteDirection(True, False)),
+                                   MoveSet(0, 0, InfiniteDirection(False, True)))
+
+
 class Rook(ChessPiece):
     """
     Represents a Rook piece on the chess board. https://en.wikipedia.org/wiki/Rook_(chess)
     """
+    __slots__ = ()
+
+    piece_type: PieceType = PieceType("Rook", ROOK_MOVES, ROOK_MOVES)
+    name: str = piece_type.name
+
     def __init__(self: Rook, x: int, y: int, team: Team) -> None:
         """
         Initializes a Rook instance, placing it at the initial x and y coordinates supplied
@@ -20,8 +30,4 @@ class Rook(ChessPiece):
         :param y: The row where the rook is being placed initially
         :param team: The team the piece belongs to
         """
-        super().__init__(x, y,
-                         [MoveSet(0, 0, InfiniteDirection(True, False)), MoveSet(0, 0, InfiniteDirection(False, True))],
-                         [MoveSet(0, 0, InfiniteDirection(True, False)), MoveSet(0, 0, InfiniteDirection(False, True))],
-                         team)
-        self.name = "Rook"
+        super().__init__(x, y, team)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+from Types.SearchStats import SearchStats
+
+
+@dataclass
+class MoveScore:
+    """
+    Represents the score the search gave to a single root move
+
+    :var: move - The move, in the format [from_x, from_y, to_x, to_y]
+    :var: score - The expected result of the move for the player making it, from 0 (loss) to 1 (win)
+    :var: visits - The amount of times the search visited the move
+    :var: exact - Whether the score is exact, or only an upper bound, the search having proven the move no better than
+        a move it prefers without scoring it any further
+    """
+    move: List[int]
+    score: float
+    visits: int
+    exact: bool = True
+
+
+@dataclass
+class SearchResult:
+    """
+    Represents the outcome of a search
+
+    :var: best_move - The move the search prefers, in the format [from_x, from_y, to_x, to_y]
+    :var: score - The expected result of the best move for the player making it, from 0 (loss) to 1 (win)
+    :var: iterations - The amount of iterations (nodes) the search ran
+    :var: depth - The deepest ply the search reached
+    :var: elapsed - The time the search took, in seconds
+    :var: principal_variation - The line of moves the search expects to be played
+    :var: move_scores - The score of every root move, best first
+    :var: stats - What the search spent its time on, if it was instrumented
+    """
+    best_move: Optional[List[int]]
+    score: float
+    iterations: int
+    depth: int
+    elapsed: float
+    principal_variation: List[List[int]] = field(default_factory=list)
+    move_scores: List[MoveScore] = field(default_factory=list)
+    stats: Optional[SearchStats] = None
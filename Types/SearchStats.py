@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import functools
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Callable, Dict, List, Set, TYPE_CHECKING
+from Types.LeafEvaluator import LeafEvaluator
+
+if TYPE_CHECKING:
+    from Types.Game import Game
+
+SAMPLE_INTERVAL: float = 0.001  # The seconds between two samples of the sampling profiler
+ACTIVE = threading.local()  # The stats the calling thread records into, if it is running an instrumented search
+
+
+@dataclass
+class SearchStats:
+    """
+    Represents what a search spent its time on, gathered only by searches created with instrumentation
+
+    :var: nodes_expanded - The amount of nodes added to the tree
+    :var: playouts - The amount of random playouts run
+    :var: playout_plies - The amount of plies played across every playout
+    :var: moves_simulated - The amount of moves played on any game, in the tree or in playouts
+    :var: checkmate_checks - The amount of calls to Game.is_checkmate
+    :var: move_generations - The amount of calls to Game.generate_valid_moves
+    :var: phase_times - The seconds spent in each phase of the search: selection (the expansion included),
+        evaluation and backpropagation
+    :var: samples - The amount of profiler samples that found each function running, by "file:function"
+    """
+    nodes_expanded: int = 0
+    playouts: int = 0
+    playout_plies: int = 0
+    moves_simulated: int = 0
+    checkmate_checks: int = 0
+    move_generations: int = 0
+    phase_times: Dict[str, float] = field(default_factory=dict)
+    samples: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def average_playout_length(self: SearchStats) -> float:
+        """
+        The average amount of plies played by a playout
+        """
+        return self.playout_plies / self.playouts if self.playouts > 0 else 0
+
+    def nodes_per_second(self: SearchStats, elapsed: float) -> float:
+        """
+        Computes the rate at which the search grew the tree
+
+        :param elapsed: The seconds the search ran for
+        :return: The amount of nodes expanded per second
+        """
+        return self.nodes_expanded / elapsed if elapsed > 0 else 0
+
+    def add_time(self: SearchStats, phase: str, seconds: float) -> None:
+        """
+        Adds to the time spent in a phase
+
+        :param phase: The name of the phase
+        :param seconds: The seconds spent
+        :return: None
+        """
+        self.phase_times[phase] = self.phase_times.get(phase, 0) + seconds
+
+    def merge(self: SearchStats, other: SearchStats) -> SearchStats:
+        """
+        Adds the stats of another worker of the same search
+
+        :param other: The stats to add
+        :return: The modified stats
+        """
+        self.nodes_expanded += other.nodes_expanded
+        self.playouts += other.playouts
+        self.playout_plies += other.playout_plies
+        self.moves_simulated += other.moves_simulated
+        self.checkmate_checks += other.checkmate_checks
+        self.move_generations += other.move_generations
+        for each_phase, each_time in other.phase_times.items():
+            self.add_time(each_phase, each_time)
+        for each_function, each_count in other.samples.items():
+            self.samples[each_function] = self.samples.get(each_function, 0) + each_count
+        return self
+
+    def copy(self: SearchStats) -> SearchStats:
+        """
+        Copies the stats, so a result keeps the stats of the search at the time it was made
+
+        :return: The copy
+        """
+        return SearchStats().merge(self)
+
+
+class Recording:
+    """
+    Makes the calling thread record into the stats supplied for the duration of a `with` block
+    """
+
+    def __init__(self: Recording, stats: SearchStats | None) -> None:
+        self.stats: SearchStats | None = stats
+        self.previous: SearchStats | None = None
+
+    def __enter__(self: Recording) -> SearchStats | None:
+        self.previous = getattr(ACTIVE, "stats", None)
+        ACTIVE.stats = self.stats
+        return self.stats
+
+    def __exit__(self: Recording, *exception_info: object) -> None:
+        ACTIVE.stats = self.previous
+
+
+def counted(counter: str, function: Callable) -> Callable:
+    """
+    Wraps a function so every call adds 1 to a counter of the stats the calling thread records into
+
+    :param counter: The name of the SearchStats counter
+    :param function: The function to wrap
+    :return: The wrapped function
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        stats = getattr(ACTIVE, "stats", None)
+        if stats is not None:
+            setattr(stats, counter, getattr(stats, counter) + 1)
+        return function(*args, **kwargs)
+    return wrapper
+
+
+def timed(phase: str, function: Callable) -> Callable:
+    """
+    Wraps a function so the time spent in it is added to a phase of the stats the calling thread records into
+
+    :param phase: The name of the phase
+    :param function: The function to wrap
+    :return: The wrapped function
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        stats = getattr(ACTIVE, "stats", None)
+        if stats is None:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats.add_time(phase, time.perf_counter() - start)
+    return wrapper
+
+
+def counted_playout(function: Callable) -> Callable:
+    """
+    Wraps Game.playout_game so every playout, and the moves it plays, are counted
+
+    :param function: The function to wrap
+    :return: The wrapped function
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        stats = getattr(ACTIVE, "stats", None)
+        if stats is None:
+            return function(*args, **kwargs)
+        moves_simulated = stats.moves_simulated
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats.playouts += 1
+            stats.playout_plies += stats.moves_simulated - moves_simulated
+    return wrapper
+
+
+class GameCounters:
+    """
+    Counts the calls to the hot methods of Game by replacing them with counting wrappers, for as long as at least one
+    instrumented search is running. Without one, Game runs its own methods, so searches without instrumentation pay
+    nothing for it. While one is running, calls from threads not recording pay for a single attribute lookup.
+    """
+    lock: threading.Lock = threading.Lock()
+    installs: int = 0
+    originals: Dict[str, Callable] = {}
+
+    @staticmethod
+    def wrappers() -> Dict[str, Callable[[Callable], Callable]]:
+        """
+        Lists the methods that are wrapped, and how
+
+        :return: The wrapper factory of each method, by name
+        """
+        return {
+            "is_checkmate": functools.partial(counted, "checkmate_checks"),
+            "generate_valid_moves": functools.partial(counted, "move_generations"),
+            "simulate_move": functools.partial(counted, "moves_simulated"),
+            "playout_game": counted_playout
+        }
+
+    @staticmethod
+    def install(game_class: type[Game]) -> None:
+        """
+        Wraps the methods, unless another instrumented search already did
+
+        :param game_class: The Game class, handed over by the search so this module does not import it
+        :return: None
+        """
+        with GameCounters.lock:
+            GameCounters.installs += 1
+            if GameCounters.installs > 1:
+                return
+            for each_name, each_wrapper in GameCounters.wrappers().items():
+                GameCounters.originals[each_name] = game_class.__dict__[each_name]
+                setattr(game_class, each_name, each_wrapper(GameCounters.originals[each_name]))
+
+    @staticmethod
+    def uninstall(game_class: type[Game]) -> None:
+        """
+        Puts the original methods back, once the last instrumented search is done
+
+        :param game_class: The Game class
+        :return: None
+        """
+        with GameCounters.lock:
+            GameCounters.installs -= 1
+            if GameCounters.installs > 0:
+                return
+            for each_name, each_method in GameCounters.originals.items():
+                setattr(game_class, each_name, each_method)
+            GameCounters.originals = {}
+
+
+class TimedEvaluator(LeafEvaluator):
+    """
+    Times the evaluation phase of an instrumented search, scoring leaves with the evaluator it wraps
+    """
+
+    def __init__(self: TimedEvaluator, evaluator: LeafEvaluator) -> None:
+        """
+        Initializes a TimedEvaluator instance
+
+        :param evaluator: The evaluator scoring the leaves
+        """
+        self.evaluator: LeafEvaluator = evaluator
+        self.timed_evaluate: Callable[[List[Game]], List[float]] = timed("evaluation", evaluator.evaluate)
+
+    def evaluate(self: TimedEvaluator, games: List[Game]) -> List[float]:
+        """
+        Scores the games with the wrapped evaluator, adding the time it took to the evaluation phase
+
+        :param games: The leaves to score
+        :return: The expected result for white of each game, in the same order
+        """
+        return self.timed_evaluate(games)
+
+
+class SamplingProfiler:
+    """
+    A sampling profiler, https://en.wikipedia.org/wiki/Profiling_(computer_programming)#Statistical_profilers, which
+    looks at the stacks of the threads it watches every `interval` seconds, from a thread of its own, and counts the
+    function each is running. It costs the watched threads nothing but the GIL switches, unlike tracing every call.
+    Subclasses may override `sample` to record more of each stack.
+    """
+
+    def __init__(self: SamplingProfiler, interval: float = SAMPLE_INTERVAL) -> None:
+        """
+        Initializes a profiler watching no thread yet
+
+        :param interval: The seconds between two samples
+        """
+        self.interval: float = interval
+        self.samples: Dict[str, int] = {}
+        self.thread_ids: Set[int] = set()
+        self.stop_event: threading.Event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def watch(self: SamplingProfiler, thread_id: int | None = None) -> None:
+        """
+        Adds a thread to the threads sampled
+
+        :param thread_id: The ident of the thread, defaults to the calling thread
+        :return: None
+        """
+        self.thread_ids.add(thread_id if thread_id is not None else threading.get_ident())
+
+    def start(self: SamplingProfiler) -> None:
+        """
+        Starts sampling in the background
+
+        :return: None
+        """
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self: SamplingProfiler) -> None:
+        """
+        Stops sampling, the samples taken being kept, and forgets the threads watched
+
+        :return: None
+        """
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.thread_ids = set()
+
+    def run(self: SamplingProfiler) -> None:
+        """
+        Samples the watched threads until stopped
+
+        :return: None
+        """
+        while not self.stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            for each_thread_id in list(self.thread_ids):
+                frame = frames.get(each_thread_id)
+                if frame is not None:
+                    self.sample(frame)
+
+    def sample(self: SamplingProfiler, frame: FrameType) -> None:
+        """
+        Records one sample of a watched thread
+
+        :param frame: The frame the thread is running
+        :return: None
+        """
+        label = "{}:{}".format(os.path.basename(frame.f_code.co_filename), frame.f_code.co_name)
+        self.samples[label] = self.samples.get(label, 0) + 1
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from enum import IntEnum
+from typing import Dict, List, Tuple
+from Types.AnalysisCache import AnalysisCache
+from Types.Game import Game
+from Types.LeafEvaluator import LeafEvaluator
+from Types.MonteCarloSearch import DEFAULT_ITERATIONS, MonteCarloSearch
+from Types.SearchResult import SearchResult
+from Types.TranspositionTable import TranspositionTable
+
+TIME_SLICE: float = 0.05  # The seconds a search runs on the executor before yielding it to the next search in line
+MAX_SESSIONS: int = 256  # The amount of live sessions past which new sessions are turned away
+MAX_PENDING_SEARCHES: int = 1024  # The amount of queued searches past which new searches are turned away
+IDLE_TIMEOUT: float = 600  # The seconds a session may go unused before it is evicted
+PONDER_ITERATIONS: int = 100000  # The iteration cap of a ponder search, which normally runs until the opponent moves
+
+
+class SearchPriority(IntEnum):
+    """
+    Represents how urgent a search is, lower values being scheduled first
+    """
+    HINT = 0  # A user is waiting on the answer
+    MOVE = 1  # The engine is choosing its own move
+    PONDER = 2  # Background work on the opponent's time, only run when nothing more urgent is waiting
+
+
+class SessionRejectedError(RuntimeError):
+    """
+    Raised when the manager is too busy to admit a new session or search
+    """
+
+
+class Session:
+    """
+    A live game hosted by the SessionManager, along with the search of its current position, which is kept between
+    requests so later searches pick up where earlier ones left off
+    """
+
+    def __init__(self: Session, session_id: str, game: Game) -> None:
+        """
+        Initializes a session
+
+        :param session_id: The id of the session
+        :param game: The game of the session
+        """
+        self.session_id: str = session_id
+        self.game: Game = game
+        self.transposition_table: TranspositionTable = TranspositionTable()
+        self.search: MonteCarloSearch | None = None
+        self.lock: asyncio.Lock = asyncio.Lock()  # Held while one of the session's searches runs a slice
+        self.pending: int = 0  # The amount of the session's searches queued or running
+        self.moves_played: int = 0  # Tells the searches of earlier positions apart from the current one
+        self.last_active: float = time.monotonic()
+        self.closed: bool = False
+
+    def touch(self: Session) -> None:
+        self.last_active = time.monotonic()
+
+
+class SearchJob:
+    """
+    A search request waiting on, or running through, the scheduler
+    """
+
+    def __init__(self: SearchJob, session: Session, search: MonteCarloSearch, iterations: int | None,
+                 deadline: float | None, priority: SearchPriority, future: asyncio.Future) -> None:
+        self.session: Session = session
+        self.search: MonteCarloSearch = search
+        self.iteration_target: int | None = search.iterations + iterations if iterations is not None else None
+        self.deadline: float | None = deadline
+        self.priority: SearchPriority = priority
+        self.future: asyncio.Future = future
+        self.moves_played: int = session.moves_played
+
+    def stale(self: SearchJob) -> bool:
+        """
+        Checks if the job's session was closed, or moved on from the position being searched
+
+        :return: Whether the job should be cancelled
+        """
+        return self.session.closed or self.session.moves_played != self.moves_played
+
+    def finished(self: SearchJob) -> bool:
+        """
+        Checks if the job has used up its budget, or was cancelled by its requester
+
+        :return: Whether the job should stop running
+        """
+        return self.future.done() or \
+            (self.iteration_target is not None and self.search.iterations >= self.iteration_target) or \
+            (self.deadline is not None and time.monotonic() >= self.deadline)
+
+
+class SessionManager:
+    """
+    Hosts many games at once, scheduling their searches onto a shared executor so no single search holds it for long.
+
+    Searches are resumable, so each one runs for a slice of at most TIME_SLICE seconds, after which it goes to the
+    back of the queue of its priority. Waiting searches are picked by priority first, so an interactive hint overtakes
+    background pondering, and in the order they were queued within a priority, so searches of the same priority share
+    the executor round-robin. New sessions and searches are turned away once the manager is full, and sessions left
+    unused for too long are evicted.
+
+    With an AnalysisCache, searches are warm-started from, and recorded to, the persistent store of search results, and
+    a search whose position is stored with at least as many visits as requested is answered without being scheduled.
+    Every search scores its leaves with the manager's LeafEvaluator, such as a QuiescenceEvaluator, or with random
+    playouts by default.
+
+    Searches keep their trees in memory, so the executor must be a thread pool. Threads running pure Python searches
+    share the GIL, so more workers make the scheduling fairer, not the searches faster.
+    """
+
+    def __init__(self: SessionManager, workers: int | None = None, executor: Executor | None = None,
+                 time_slice: float = TIME_SLICE, max_sessions: int = MAX_SESSIONS,
+                 max_pending: int = MAX_PENDING_SEARCHES, idle_timeout: float = IDLE_TIMEOUT,
+                 analysis_cache: AnalysisCache | None = None, evaluator: LeafEvaluator | None = None) -> None:
+        """
+        Initializes the manager, which starts scheduling once `start` is awaited
+
+        :param workers: The amount of slices run at the same time, defaults to the amount of CPUs
+        :param executor: The thread pool the slices run on, defaults to a new pool of `workers` threads
+        :param time_slice: The seconds a search runs before yielding the executor
+        :param max_sessions: The amount of live sessions past which new sessions are turned away
+        :param max_pending: The amount of queued searches past which new searches are turned away
+        :param idle_timeout: The seconds a session may go unused before it is evicted
+        :param analysis_cache: The persistent store of search results shared by every session, written out on `close`
+        :param evaluator: The evaluator scoring the leaves of every search, defaults to random playouts
+        """
+        self.workers: int = workers if workers is not None else os.cpu_count() or 1
+        self.executor: Executor = executor if executor is not None else ThreadPoolExecutor(self.workers)
+        self.owns_executor: bool = executor is None
+        self.time_slice: float = time_slice
+        self.max_sessions: int = max_sessions
+        self.max_pending: int = max_pending
+        self.idle_timeout: float = idle_timeout
+        self.analysis_cache: AnalysisCache | None = analysis_cache
+        self.evaluator: LeafEvaluator | None = evaluator
+        self.sessions: Dict[str, Session] = {}
+        self.queue: asyncio.PriorityQueue | None = None
+        self.sequence = itertools.count()  # Breaks ties between searches of the same priority, oldest first
+        self.session_ids = itertools.count(1)
+        self.tasks: List[asyncio.Task] = []
+        self.slices: int = 0  # The amount of slices run
+        self.evicted: int = 0  # The amount of sessions evicted for being idle
+        self.rejected: int = 0  # The amount of sessions and searches turned away
+        self.ponder_hits: int = 0  # The amount of moves played that had already been searched, keeping their subtree
+        self.ponder_misses: int = 0  # The amount of moves played that had not been searched, restarting the search
+        self.cached_answers: int = 0  # The amount of searches answered from the analysis cache without searching
+
+    async def start(self: SessionManager) -> SessionManager:
+        """
+        Starts the scheduler and the idle session eviction
+
+        :return: The manager
+        """
+        self.queue = asyncio.PriorityQueue()
+        self.tasks = [asyncio.create_task(self.run_worker()) for _ in range(self.workers)]
+        self.tasks.append(asyncio.create_task(self.run_eviction()))
+        return self
+
+    async def close(self: SessionManager) -> None:
+        """
+        Stops the scheduler, cancelling every search still waiting
+
+        :return: None
+        """
+        for each_task in self.tasks:
+            each_task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        while self.queue is not None and not self.queue.empty():
+            self.queue.get_nowait()[2].future.cancel()
+        if self.owns_executor:
+            self.executor.shutdown(wait=True)
+        if self.analysis_cache is not None:
+            self.analysis_cache.flush()
+
+    async def __aenter__(self: SessionManager) -> SessionManager:
+        return await self.start()
+
+    async def __aexit__(self: SessionManager, *exception_info: object) -> None:
+        await self.close()
+
+    def open_session(self: SessionManager, game: Game | None = None) -> str:
+        """
+        Opens a session hosting the game supplied
+
+        :param game: The game of the session, defaults to a new game from the initial position
+        :return: The id of the session
+        """
+        if len(self.sessions) >= self.max_sessions:
+            self.rejected += 1
+            raise SessionRejectedError("The manager already hosts {} sessions".format(len(self.sessions)))
+        session_id = str(next(self.session_ids))
+        self.sessions[session_id] = Session(session_id, game if game is not None else Game.from_fen())
+        return session_id
+
+    def close_session(self: SessionManager, session_id: str) -> None:
+        """
+        Closes a session, stopping its running search, if any
+
+        :param session_id: The id of the session
+        :return: None
+        """
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return
+        session.closed = True
+        if session.search is not None:
+            session.search.stop()
+
+    def session(self: SessionManager, session_id: str) -> Session:
+        """
+        Looks up a live session, marking it as used
+
+        :param session_id: The id of the session
+        :return: The session
+        """
+        if session_id not in self.sessions:
+            raise KeyError("No session {}, it may have been evicted".format(session_id))
+        session = self.sessions[session_id]
+        session.touch()
+        return session
+
+    async def play_move(self: SessionManager, session_id: str, move: List[int]) -> Game:
+        """
+        Plays a move in a session's game, cancelling the searches of the position that was left. The session's search
+        is re-rooted at the move, keeping what was searched below it, such as while pondering on the opponent's time.
+
+        :param session_id: The id of the session
+        :param move: The move to play, in the format [from_x, from_y, to_x, to_y]
+        :return: The game after the move
+        """
+        session = self.session(session_id)
+        session.moves_played += 1
+        session.game = session.game.make_move(move)
+        if session.search is not None:
+            session.search.stop()
+            async with session.lock:
+                #  the slice running when the move came in has finished, so the tree can be re-rooted
+                if session.search.advance(move):
+                    self.ponder_hits += 1
+                else:
+                    self.ponder_misses += 1
+        return session.game
+
+    def ponder(self: SessionManager, session_id: str, iterations: int = PONDER_ITERATIONS) -> asyncio.Task:
+        """
+        Searches a session's position in the background, at the lowest priority, typically once the engine has moved
+        and while the opponent is thinking. The search is cancelled by the opponent's move, and the engine's next search
+        carries on from the subtree of that move.
+
+        :param session_id: The id of the session
+        :param iterations: The maximum amount of iterations to run
+        :return: The task of the search, cancelled when the opponent moves
+        """
+        return asyncio.create_task(self.search(session_id, iterations, priority=SearchPriority.PONDER))
+
+    async def search(self: SessionManager, session_id: str, iterations: int | None = None,
+                     time_limit: float | None = None, priority: SearchPriority = SearchPriority.HINT,
+                     root_moves: List[List[int]] | None = None) -> SearchResult:
+        """
+        Searches the current position of a session, in slices shared fairly with every other session
+
+        :param session_id: The id of the session
+        :param iterations: The maximum amount of iterations to run, defaults to DEFAULT_ITERATIONS without a time limit
+        :param time_limit: The seconds until the result is due, counted from the request, waiting included
+        :param priority: How urgent the search is
+        :param root_moves: The moves the root is restricted to, searched in a tree of their own if supplied
+        :return: The result of the search
+        """
+        session = self.session(session_id)
+        if self.queue is None:
+            raise RuntimeError("The manager has not been started")
+        if self.queue.qsize() >= self.max_pending:
+            self.rejected += 1
+            raise SessionRejectedError("{} searches are already waiting".format(self.queue.qsize()))
+        if iterations is None and time_limit is None:
+            iterations = DEFAULT_ITERATIONS
+        if root_moves is not None:
+            search = MonteCarloSearch(session.game, root_moves, transposition_table=session.transposition_table,
+                                      evaluator=self.evaluator, analysis_cache=self.analysis_cache)
+        else:
+            if session.search is None:
+                session.search = MonteCarloSearch(session.game, transposition_table=session.transposition_table,
+                                                  evaluator=self.evaluator, analysis_cache=self.analysis_cache)
+            search = session.search
+            if search.iterations == 0 and search.analysis_covers(iterations):
+                self.cached_answers += 1
+                session.touch()
+                return search.result()
+        job = SearchJob(session, search, iterations,
+                        time.monotonic() + time_limit if time_limit is not None else None, priority,
+                        asyncio.get_running_loop().create_future())
+        session.pending += 1
+        self.queue.put_nowait((job.priority, next(self.sequence), job))
+        try:
+            return await job.future
+        finally:
+            session.pending -= 1
+            session.touch()
+
+    def run_slice(self: SessionManager, job: SearchJob) -> None:
+        """
+        Runs one slice of a search, on the executor
+
+        :param job: The search to run
+        :return: None
+        """
+        slice_time = self.time_slice
+        if job.deadline is not None:
+            slice_time = max(min(slice_time, job.deadline - time.monotonic()), 0)
+        remaining = job.iteration_target - job.search.iterations if job.iteration_target is not None else None
+        job.search.search(remaining, slice_time)
+
+    async def run_worker(self: SessionManager) -> None:
+        """
+        Runs slices of the most urgent waiting search, forever, putting each search back in line until it is done
+
+        :return: None
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, job = await self.queue.get()
+            if not job.future.done() and not job.stale():
+                try:
+                    async with job.session.lock:
+                        await loop.run_in_executor(self.executor, self.run_slice, job)
+                except asyncio.CancelledError:
+                    #  the manager is closing, the slice is stopped and its requester told the search will not finish
+                    job.search.stop()
+                    job.future.cancel()
+                    raise
+                self.slices += 1
+                if not job.finished() and not job.stale():
+                    self.queue.put_nowait((job.priority, next(self.sequence), job))
+                    continue
+            if job.future.done():
+                continue
+            if job.stale():
+                job.future.cancel()
+            else:
+                job.future.set_result(job.search.result())
+
+    async def run_eviction(self: SessionManager) -> None:
+        """
+        Evicts the sessions left unused for longer than the idle timeout, checking a few times per timeout
+
+        :return: None
+        """
+        while True:
+            await asyncio.sleep(self.idle_timeout / 4)
+            self.evict_idle()
+
+    def evict_idle(self: SessionManager) -> List[str]:
+        """
+        Evicts the sessions left unused for longer than the idle timeout, sparing those with searches in flight
+
+        :return: The ids of the evicted sessions
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        idle: List[Tuple[str, Session]] = [(session_id, each_session) for session_id, each_session
+                                           in self.sessions.items()
+                                           if each_session.last_active < cutoff and each_session.pending == 0]
+        for session_id, _ in idle:
+            self.close_session(session_id)
+        self.evicted += len(idle)
+        return [session_id for session_id, _ in idle]
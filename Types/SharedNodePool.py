@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Tuple
+
+NODE_POOL_STRIPES: int = 64  # The amount of locks the pool's slots are spread over
+NODE_POOL_PROBES: int = 16  # The amount of slots looked at before a position is given up on
+
+
+class SharedNodePool:
+    """
+    Houses the statistics of search nodes in shared memory, keyed by the Zobrist hash of their position, so search
+    workers running in separate processes all descend the same tree. Every process keeps its own nodes, but reads and
+    writes their statistics here, which makes the tree shared in everything but its layout.
+
+    The pool is an open-addressing hash table of fixed-size slots, stored as three flat arrays (keys, numerators and
+    denominators). Updates take one of a few striped locks, so workers touching different slots rarely wait on each
+    other, while reads take no lock at all.
+    """
+
+    def __init__(self: SharedNodePool, memory: SharedMemory, capacity: int, locks: List[multiprocessing.Lock],
+                 owner: bool = False) -> None:
+        """
+        Initializes the pool over a block of shared memory, use `create` or `attach` rather than calling this directly
+
+        :param memory: The shared memory holding the slots
+        :param capacity: The amount of slots in the pool
+        :param locks: The striped locks guarding updates
+        :param owner: Whether this process created the memory, and is the one to release it
+        """
+        self.memory: SharedMemory = memory
+        self.capacity: int = capacity
+        self.locks: List[multiprocessing.Lock] = locks
+        self.owner: bool = owner
+        self.keys: memoryview = memory.buf[:capacity * 8].cast("Q")
+        self.numerators: memoryview = memory.buf[capacity * 8:capacity * 16].cast("d")
+        self.denominators: memoryview = memory.buf[capacity * 16:capacity * 24].cast("d")
+
+    @staticmethod
+    def create(capacity: int = 1 << 18) -> SharedNodePool:
+        """
+        Creates a new, empty pool
+
+        :param capacity: The amount of slots in the pool
+        :return: The pool, owned by the calling process
+        """
+        memory = SharedMemory(create=True, size=capacity * 24)
+        memory.buf[:capacity * 24] = bytes(capacity * 24)
+        return SharedNodePool(memory, capacity, [multiprocessing.Lock() for _ in range(NODE_POOL_STRIPES)], True)
+
+    @staticmethod
+    def attach(name: str, capacity: int, locks: List[multiprocessing.Lock]) -> SharedNodePool:
+        """
+        Attaches to a pool created by another process
+
+        :param name: The name of the pool's shared memory
+        :param capacity: The amount of slots in the pool
+        :param locks: The pool's striped locks, handed over by the process that created it
+        :return: The attached pool
+        """
+        return SharedNodePool(SharedMemory(name=name), capacity, locks)
+
+    def handle(self: SharedNodePool) -> Tuple[str, int, List[multiprocessing.Lock]]:
+        """
+        Describes the pool so another process can attach to it
+
+        :return: The arguments to `attach`
+        """
+        return self.memory.name, self.capacity, self.locks
+
+    def find_slot(self: SharedNodePool, key: int, claim: bool) -> int:
+        """
+        Finds the slot holding the key, probing linearly from its home slot
+
+        :param key: The Zobrist hash of the position, 0 is treated as 1 since 0 marks an empty slot
+        :param claim: Whether an empty slot should be claimed for the key if it is not in the pool yet
+        :return: The index of the slot, or -1 if the key is missing (or the pool is too full to hold it)
+        """
+        key = key or 1
+        for probe in range(NODE_POOL_PROBES):
+            slot = (key + probe) % self.capacity
+            slot_key = self.keys[slot]
+            if slot_key == key:
+                return slot
+            if slot_key == 0:
+                if not claim:
+                    return -1
+                with self.locks[slot % NODE_POOL_STRIPES]:
+                    if self.keys[slot] == 0:
+                        self.keys[slot] = key
+                    if self.keys[slot] == key:
+                        return slot
+        return -1
+
+    def statistics(self: SharedNodePool, key: int) -> Tuple[float, float]:
+        """
+        Reads the statistics of a position
+
+        :param key: The Zobrist hash of the position
+        :return: The numerator and denominator of the position, both 0 if it has not been visited
+        """
+        slot = self.find_slot(key, False)
+        if slot < 0:
+            return 0, 0
+        return self.numerators[slot], self.denominators[slot]
+
+    def update(self: SharedNodePool, key: int, numerator: float, denominator: float) -> None:
+        """
+        Adds to the statistics of a position
+
+        :param key: The Zobrist hash of the position
+        :param numerator: The amount added to the numerator
+        :param denominator: The amount added to the denominator, negative when a virtual loss is taken back
+        :return: None
+        """
+        slot = self.find_slot(key, True)
+        if slot < 0:
+            return
+        with self.locks[slot % NODE_POOL_STRIPES]:
+            self.numerators[slot] += numerator
+            self.denominators[slot] += denominator
+
+    def close(self: SharedNodePool) -> None:
+        """
+        Detaches from the pool, releasing the shared memory too if this process created it
+
+        :return: None
+        """
+        self.keys.release()
+        self.numerators.release()
+        self.denominators.release()
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
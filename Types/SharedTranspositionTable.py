@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Tuple
+from Types.GameLog import decode_move, encode_move
+from Types.TranspositionTable import TranspositionEntry
+
+# check word, data word, numerator, denominator, the check word being the key XOR every other word of the slot
+SHARED_ENTRY = struct.Struct("<QQdd")
+STATISTICS_WORDS = struct.Struct("<QQ")  # The numerator and denominator, read back as words to be XORed
+STATISTICS = struct.Struct("<dd")
+BUCKET_SIZE: int = 4  # The amount of slots a key may be stored in, the shallowest being replaced when all are taken
+NO_MOVE: int = 0xFFFF  # The move code of an entry without a best move, out of the range of encode_move
+SCORE_OFFSET: int = 1 << 31  # Added to the score so it is stored as an unsigned 32 bit number
+MAX_DEPTH: int = 0xFF
+
+
+class SharedTranspositionTable:
+    """
+    A transposition table in shared memory, with the same probe and store interface as TranspositionTable, so search
+    workers running in separate processes attach to one table instead of each filling a private one.
+
+    The table is an array of fixed-size slots, grouped in buckets of BUCKET_SIZE, packed as a check word, a data word
+    holding the best move, depth, score and bound, and the numerator and denominator. Workers read and write it
+    without any lock, using lockless hashing, https://www.chessprogramming.org/Shared_Hash_Table#Lockless: the check
+    word is the key XOR every other word of the slot, so a slot torn by two workers writing at once, or read while
+    being written, no longer matches its key and is treated as a miss.
+
+    `probe` and `entry` return copies of what the table holds, changes to an entry only reach the table once it is
+    stored. Two workers storing the same position at once keep one of the two entries, the other being lost, as with
+    any replacement. `statistics` and `update` read and add to the statistics of a position the way a SharedNodePool
+    does, so worker processes of a Monte Carlo search share their statistics through the table, with the same
+    trade-off: of two updates of a position racing each other, one may be lost, a few visits of a search that counts
+    many thousands.
+    """
+
+    def __init__(self: SharedTranspositionTable, memory: SharedMemory, buckets: int, owner: bool = False) -> None:
+        """
+        Initializes the table over a block of shared memory, use `create` or `attach` rather than calling this directly
+
+        :param memory: The shared memory holding the slots
+        :param buckets: The amount of buckets in the table, a power of two
+        :param owner: Whether this process created the memory, and is the one to release it
+        """
+        self.memory: SharedMemory = memory
+        self.buckets: int = buckets
+        self.mask: int = buckets - 1
+        self.max_entries: int = buckets * BUCKET_SIZE
+        self.owner: bool = owner
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def create(max_entries: int = 1 << 20) -> SharedTranspositionTable:
+        """
+        Creates a new, empty table
+
+        :param max_entries: The amount of slots in the table, rounded up to a power of two amount of buckets
+        :return: The table, owned by the calling process
+        """
+        buckets = 1 << max(-(-max_entries // BUCKET_SIZE) - 1, 0).bit_length()
+        size = buckets * BUCKET_SIZE * SHARED_ENTRY.size
+        memory = SharedMemory(create=True, size=size)
+        memory.buf[:size] = bytes(size)
+        return SharedTranspositionTable(memory, buckets, True)
+
+    @staticmethod
+    def attach(name: str, buckets: int) -> SharedTranspositionTable:
+        """
+        Attaches to a table created by another process
+
+        :param name: The name of the table's shared memory
+        :param buckets: The amount of buckets in the table
+        :return: The attached table
+        """
+        return SharedTranspositionTable(SharedMemory(name=name), buckets)
+
+    def handle(self: SharedTranspositionTable) -> Tuple[str, int]:
+        """
+        Describes the table so another process can attach to it
+
+        :return: The arguments to `attach`
+        """
+        return self.memory.name, self.buckets
+
+    @staticmethod
+    def pack(entry: TranspositionEntry) -> int:
+        """
+        Packs the best move, depth, score and bound of an entry into the data word, the move in bits 0-15, the depth in
+        bits 16-23, the score in bits 24-55 and the bound in bits 56-57
+
+        :param entry: The entry to pack
+        :return: The data word
+        """
+        move = encode_move(entry.best_move) if entry.best_move is not None else NO_MOVE
+        depth = min(max(entry.depth, 0), MAX_DEPTH)
+        score = min(max(entry.score + SCORE_OFFSET, 0), (1 << 32) - 1)
+        return move | depth << 16 | score << 24 | (entry.bound & 0x3) << 56
+
+    @staticmethod
+    def unpack(key: int, data: int, numerator: float, denominator: float) -> TranspositionEntry:
+        """
+        Unpacks the entry of a slot
+
+        :param key: The Zobrist hash of the position
+        :param data: The data word of the slot
+        :param numerator: The numerator of the slot
+        :param denominator: The denominator of the slot
+        :return: The entry
+        """
+        move = data & 0xFFFF
+        return TranspositionEntry(key, numerator, denominator, decode_move(move) if move != NO_MOVE else None,
+                                  (data >> 16) & 0xFF, ((data >> 24) & 0xFFFFFFFF) - SCORE_OFFSET, (data >> 56) & 0x3)
+
+    def read_slot(self: SharedTranspositionTable, slot: int) -> Tuple[int, int, float, float]:
+        """
+        Reads a slot, verifying nothing
+
+        :param slot: The index of the slot
+        :return: The key the slot claims to hold, its data word, numerator and denominator
+        """
+        check, data, numerator, denominator = SHARED_ENTRY.unpack_from(self.memory.buf, slot * SHARED_ENTRY.size)
+        numerator_word, denominator_word = STATISTICS_WORDS.unpack(STATISTICS.pack(numerator, denominator))
+        return check ^ data ^ numerator_word ^ denominator_word, data, numerator, denominator
+
+    def probe(self: SharedTranspositionTable, key: int) -> TranspositionEntry | None:
+        """
+        Looks up the entry of the position supplied
+
+        :param key: The Zobrist hash of the position
+        :return: A copy of the entry, or None if the position is not in the table, or its slot is being written
+        """
+        stored_key = key or 1
+        first_slot = (stored_key & self.mask) * BUCKET_SIZE
+        for slot in range(first_slot, first_slot + BUCKET_SIZE):
+            slot_key, data, numerator, denominator = self.read_slot(slot)
+            if slot_key == stored_key:
+                self.hits += 1
+                return SharedTranspositionTable.unpack(key, data, numerator, denominator)
+        self.misses += 1
+        return None
+
+    def store(self: SharedTranspositionTable, entry: TranspositionEntry) -> TranspositionEntry:
+        """
+        Stores the entry in the slot of its bucket already holding its position, or else an empty slot, or else the
+        slot holding the shallowest, least visited entry
+
+        :param entry: The entry to store
+        :return: The entry stored
+        """
+        stored_key = entry.key or 1
+        first_slot = (stored_key & self.mask) * BUCKET_SIZE
+        replaced_slot = first_slot
+        replaced_worth: Tuple[int, float] | None = None
+        for slot in range(first_slot, first_slot + BUCKET_SIZE):
+            slot_key, data, numerator, denominator = self.read_slot(slot)
+            #  the data word of a stored entry is never 0, the score being offset
+            if slot_key == stored_key or data == 0:
+                replaced_slot = slot
+                break
+            worth = ((data >> 16) & 0xFF, denominator)
+            if replaced_worth is None or worth < replaced_worth:
+                replaced_slot = slot
+                replaced_worth = worth
+        data = SharedTranspositionTable.pack(entry)
+        numerator_word, denominator_word = STATISTICS_WORDS.unpack(STATISTICS.pack(entry.numerator,
+                                                                                   entry.denominator))
+        SHARED_ENTRY.pack_into(self.memory.buf, replaced_slot * SHARED_ENTRY.size,
+                               stored_key ^ data ^ numerator_word ^ denominator_word, data, entry.numerator,
+                               entry.denominator)
+        return entry
+
+    def entry(self: SharedTranspositionTable, key: int) -> TranspositionEntry:
+        """
+        Looks up the entry of the position supplied, creating an empty one if the position is not in the table yet
+
+        :param key: The Zobrist hash of the position
+        :return: A copy of the entry of the position
+        """
+        entry = self.probe(key)
+        if entry is None:
+            entry = self.store(TranspositionEntry(key))
+        return entry
+
+    def statistics(self: SharedTranspositionTable, key: int) -> Tuple[float, float]:
+        """
+        Reads the statistics of a position
+
+        :param key: The Zobrist hash of the position
+        :return: The numerator and denominator of the position, both 0 if it is not in the table
+        """
+        entry = self.probe(key)
+        return (entry.numerator, entry.denominator) if entry is not None else (0, 0)
+
+    def update(self: SharedTranspositionTable, key: int, numerator: float, denominator: float) -> None:
+        """
+        Adds to the statistics of a position, without a lock, so an update racing another one of the same position
+        may be lost
+
+        :param key: The Zobrist hash of the position
+        :param numerator: The amount added to the numerator
+        :param denominator: The amount added to the denominator, negative when a virtual loss is taken back
+        :return: None
+        """
+        entry = self.probe(key)
+        if entry is None:
+            entry = TranspositionEntry(key)
+        entry.numerator += numerator
+        entry.denominator += denominator
+        self.store(entry)
+
+    def clear(self: SharedTranspositionTable) -> SharedTranspositionTable:
+        """
+        Removes every entry from the table, for every process attached to it
+
+        :return: The modified table
+        """
+        size = self.max_entries * SHARED_ENTRY.size
+        self.memory.buf[:size] = bytes(size)
+        return self
+
+    def close(self: SharedTranspositionTable) -> None:
+        """
+        Detaches from the table, releasing the shared memory too if this process created it
+
+        :return: None
+        """
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+    def __len__(self: SharedTranspositionTable) -> int:
+        return sum(1 for slot in range(self.max_entries)
+                   if SHARED_ENTRY.unpack_from(self.memory.buf, slot * SHARED_ENTRY.size)[1] != 0)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+import random
+from typing import List, Sequence, TypeVar
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SPLITMIX_GAMMA: int = 0x9E3779B97F4A7C15  # The increment of the splitmix64 sequence, the golden ratio in 64 bits
+MASK_64: int = (1 << 64) - 1
+
+T = TypeVar("T")
+
+
+def splitmix64(state: int) -> int:
+    """
+    Scrambles a 64 bit value with splitmix64, https://prng.di.unimi.it/splitmix64.c, so seeds that differ in a single
+    bit, such as consecutive stream indices, give unrelated outputs
+
+    :param state: The value to scramble
+    :return: The scrambled 64 bit value
+    """
+    value = (state + SPLITMIX_GAMMA) & MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+class SimulationRandom:
+    """
+    A seedable, non-cryptographic random stream for playouts and searches. Draws come from the Mersenne Twister of the
+    standard library, whose C implementation is far cheaper than the secrets module, and indices are drawn by scaling a
+    float rather than through randrange, which rejects and retries in Python.
+
+    A stream spawns independent child streams, one per worker thread or process, each seeded by scrambling the parent's
+    seed with the child's index. A seeded parent always spawns the same children in the same order, which makes a whole
+    parallel search reproducible from one seed, without workers sharing or clashing on a stream.
+    """
+
+    def __init__(self: SimulationRandom, seed: int | None = None) -> None:
+        """
+        Initializes a stream
+
+        :param seed: The 64 bit seed of the stream, drawn from the operating system if None
+        """
+        self.seed: int = (seed if seed is not None else int.from_bytes(os.urandom(8), "little")) & MASK_64
+        self.generator: random.Random = random.Random(self.seed)
+        self.random = self.generator.random  # Bound once, it is called on every draw
+        self.spawned: int = 0  # The amount of children spawned so far
+        self.array_generator = None  # The NumPy generator of batch draws, created on the first batch
+
+    def child(self: SimulationRandom, index: int) -> SimulationRandom:
+        """
+        Derives the child stream at an index, the same index always giving the same stream
+
+        :param index: The index of the child
+        :return: The child stream
+        """
+        return SimulationRandom(splitmix64((self.seed + (index + 1) * SPLITMIX_GAMMA) & MASK_64))
+
+    def spawn(self: SimulationRandom) -> SimulationRandom:
+        """
+        Derives the next child stream, for a new worker
+
+        :return: The child stream
+        """
+        self.spawned += 1
+        return self.child(self.spawned - 1)
+
+    def below(self: SimulationRandom, bound: int) -> int:
+        """
+        Draws an integer in [0, bound)
+
+        :param bound: The exclusive upper bound, at least 1
+        :return: The drawn integer
+        """
+        return int(self.random() * bound)
+
+    def choice(self: SimulationRandom, items: Sequence[T]) -> T:
+        """
+        Picks one of the items supplied
+
+        :param items: The items to pick from, at least one
+        :return: The picked item
+        """
+        return items[int(self.random() * len(items))]
+
+    def flip(self: SimulationRandom) -> int:
+        """
+        Draws a single random bit
+
+        :return: Either 0 or 1
+        """
+        return self.generator.getrandbits(1)
+
+    def below_many(self: SimulationRandom, bound: int, count: int) -> List[int]:
+        """
+        Draws many integers in [0, bound) at once, for playouts that pick their moves in bulk. With NumPy, the whole
+        batch is drawn in one call, from a generator seeded by this stream.
+
+        :param bound: The exclusive upper bound, at least 1
+        :param count: The amount of integers to draw
+        :return: The drawn integers
+        """
+        if numpy is None:
+            draw = self.random
+            return [int(draw() * bound) for _ in range(count)]
+        if self.array_generator is None:
+            self.array_generator = numpy.random.Generator(numpy.random.PCG64(self.generator.getrandbits(64)))
+        return self.array_generator.integers(0, bound, count).tolist()
+
+
+SIMULATION_RANDOM: SimulationRandom = SimulationRandom()  # The stream used by games and searches that are not given one
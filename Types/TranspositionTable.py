@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+BOUND_EXACT: int = 0  # The score is the exact score of the position
+BOUND_LOWER: int = 1  # The search failed high, the position scores at least the score
+BOUND_UPPER: int = 2  # The search failed low, the position scores at most the score
+
+
+@dataclass
+class TranspositionEntry:
+    """
+    Represents what the search knows about a position, independent of the path that led to it
+
+    :var: key - The Zobrist hash of the position
+    :var: numerator - The accumulated score of the position, from the perspective of the player who moved into it
+    :var: denominator - The amount of times the position has been visited
+    :var: best_move - The best move found from the position, in the format [from_x, from_y, to_x, to_y]
+    :var: depth - The depth the position has been searched to
+    :var: score - The score of the position from a depth-limited search, in centipawns
+    :var: bound - Whether the score is exact, or only a lower or upper bound, one of the BOUND_ constants
+    """
+    key: int
+    numerator: float = 0
+    denominator: int = 0
+    best_move: Optional[List[int]] = None
+    depth: int = 0
+    score: int = 0
+    bound: int = BOUND_EXACT
+
+
+class TranspositionTable:
+    """
+    A transposition table, https://www.chessprogramming.org/Transposition_Table, which maps the Zobrist hash of a
+    position to a TranspositionEntry, so every line reaching the same position shares its statistics.
+    """
+
+    def __init__(self: TranspositionTable, max_entries: int = 1 << 20) -> None:
+        """
+        Initializes an empty table, holding at most `max_entries` entries, the oldest being replaced first
+
+        :param max_entries: The maximum amount of entries the table holds
+        """
+        self.max_entries: int = max_entries
+        self.entries: Dict[int, TranspositionEntry] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def probe(self: TranspositionTable, key: int) -> TranspositionEntry | None:
+        """
+        Looks up the entry of the position supplied
+
+        :param key: The Zobrist hash of the position
+        :return: The entry, or None if the position is not in the table
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def store(self: TranspositionTable, entry: TranspositionEntry) -> TranspositionEntry:
+        """
+        Stores the entry in the table, replacing the oldest entry if the table is full
+
+        :param entry: The entry to store
+        :return: The entry stored
+        """
+        if entry.key not in self.entries and len(self.entries) >= self.max_entries:
+            del self.entries[next(iter(self.entries))]
+        self.entries[entry.key] = entry
+        return entry
+
+    def entry(self: TranspositionTable, key: int) -> TranspositionEntry:
+        """
+        Looks up the entry of the position supplied, creating an empty one if the position is not in the table yet
+
+        :param key: The Zobrist hash of the position
+        :return: The entry of the position
+        """
+        entry = self.probe(key)
+        if entry is None:
+            entry = self.store(TranspositionEntry(key))
+        return entry
+
+    def clear(self: TranspositionTable) -> TranspositionTable:
+        """
+        Removes every entry from the table
+
+        :return: The modified table
+        """
+        self.entries = {}
+        return self
+
+    def __len__(self: TranspositionTable) -> int:
+        return len(self.entries)
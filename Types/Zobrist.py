@@ -0,0 +1,45 @@
+from __future__ import annotations
+from typing import Dict, Tuple, TYPE_CHECKING
+from Types.LookupTables import LOOKUP_TABLES, LookupTables, PIECE_NAMES, SQUARES
+from Types.Player import Team
+
+if TYPE_CHECKING:
+    from Types.ChessPiece import ChessPiece
+
+
+class Zobrist:
+    """
+    Houses the random keys used for Zobrist hashing, https://www.chessprogramming.org/Zobrist_Hashing, which lets the
+    board keep a 64-bit hash of its position up to date by XOR-ing keys in and out as pieces move. The keys are drawn
+    from a fixed seed and read from the lookup table cache, so the same position hashes to the same value in every
+    process.
+    """
+
+    def __init__(self: Zobrist, tables: LookupTables = LOOKUP_TABLES) -> None:
+        """
+        Initializes the Zobrist key set, one key per piece name, team and square, along with the side-to-move key
+
+        :param tables: The lookup tables the keys are read from
+        """
+        self.squares: int = SQUARES
+        self.piece_keys: Dict[Tuple[str, Team], memoryview] = {}
+        for each_team in Team:
+            for each_name in PIECE_NAMES:
+                offset = tables.zobrist_offset(each_name, each_team)
+                self.piece_keys[(each_name, each_team)] = tables.zobrist_keys[offset:offset + SQUARES]
+        self.side_key: int = tables.side_key()
+
+    def piece_key(self: Zobrist, piece: ChessPiece, x: int, y: int, width: int = 8) -> int:
+        """
+        Looks up the key of the piece standing on the square x, y
+
+        :param piece: The piece standing on the square
+        :param x: The column of the square
+        :param y: The row of the square
+        :param width: The width of the board, used to flatten the coordinates
+        :return: The key to XOR into the position hash
+        """
+        return self.piece_keys[(piece.name, piece.team)][y * width + x]
+
+
+ZOBRIST: Zobrist = Zobrist()
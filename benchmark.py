@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+from Types.Game import Game
+from Types.MonteCarloSearch import MonteCarloSearch
+from Types.SimulationRandom import SimulationRandom
+
+BENCHMARK_POSITIONS: Dict[str, str] = {  # The positions every benchmark runs over, by name
+    "opening": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1",
+    "middlegame": "r1bq1rk1/pp2bppp/2n1pn2/3p4/2PP4/2N1PN2/PP2BPPP/R2QKB1R w - - 0 8",
+    "endgame": "8/5k2/3p4/1p1Pp2p/pP2Pp1P/P4P1K/8/8 b - - 0 1",
+}
+BENCHMARK_SEEDS: List[int] = [11, 23, 37, 41]  # The seeds of the playouts and searches, so every run plays alike
+BASELINE_FORMAT_VERSION: int = 1  # Bumped whenever the layout of the baseline files changes
+REGRESSION_THRESHOLD: float = 0.1  # The fraction of throughput a benchmark may lose before it counts as a regression
+PLAYOUT_PLIES: int = 60  # The ply cap of the benchmarked playouts
+SEARCH_ITERATIONS: int = 40  # The iteration budget of each benchmarked search
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The measurement of a single benchmark, the fastest of its repeats
+
+    :var: name - The name of the benchmark
+    :var: operations - The amount of operations timed in one repeat
+    :var: seconds - The seconds the fastest repeat took
+    """
+    name: str
+    operations: int
+    seconds: float
+
+    @property
+    def ops_per_second(self: BenchmarkResult) -> float:
+        return self.operations / self.seconds if self.seconds > 0 else 0
+
+
+def benchmark_games() -> List[Game]:
+    """
+    Sets up a fresh game for every benchmark position, each with its own seeded random stream
+
+    :return: The games, in the order of BENCHMARK_POSITIONS
+    """
+    return [Game.from_fen(fen, SimulationRandom(BENCHMARK_SEEDS[0])) for fen in BENCHMARK_POSITIONS.values()]
+
+
+def generate_potential_moves(games: List[Game]) -> int:
+    """
+    Generates the potential moves of every piece of every position
+
+    :param games: The positions
+    :return: The amount of pieces whose moves were generated
+    """
+    operations = 0
+    for _ in range(10000):
+        for each_game in games:
+            for each_player in [each_game.player_1, each_game.player_2]:
+                for each_piece in each_player.pieces:
+                    each_piece.generate_potential_moves(each_game.board)
+                    operations += 1
+    return operations
+
+
+def move_piece(games: List[Game]) -> int:
+    """
+    Plays every quiet move of every position on the board and moves the piece back again
+
+    :param games: The positions, restored to where they started once done
+    :return: The amount of moves played, counting each move back
+    """
+    operations = 0
+    for each_game in games:
+        team = each_game.current_player().team
+        quiet_moves = [each_move for each_move in each_game.generate_valid_moves()
+                       if not each_game.board.is_capture(each_move[2], each_move[3], team)]
+        for _ in range(2000):
+            for from_x, from_y, to_x, to_y in quiet_moves:
+                each_game.board.move_piece(from_x, from_y, to_x, to_y, team)
+                each_game.board.move_piece(to_x, to_y, from_x, from_y, team)
+                operations += 2
+        each_game.board.reset_history()
+    return operations
+
+
+def is_checkmate(games: List[Game]) -> int:
+    """
+    Checks every position for checkmate
+
+    :param games: The positions
+    :return: The amount of checks made
+    """
+    operations = 0
+    for _ in range(3000):
+        for each_game in games:
+            each_game.is_checkmate()
+            operations += 1
+    return operations
+
+
+def clone(games: List[Game]) -> int:
+    """
+    Clones every position, which runs Game.__init__ over a copy of the board
+
+    :param games: The positions
+    :return: The amount of clones made
+    """
+    operations = 0
+    for _ in range(1500):
+        for each_game in games:
+            each_game.clone()
+            operations += 1
+    return operations
+
+
+def playout_game(games: List[Game]) -> int:
+    """
+    Plays out every position ten times per seed, up to PLAYOUT_PLIES plies
+
+    :param games: The positions
+    :return: The amount of playouts run
+    """
+    operations = 0
+    for _ in range(10):
+        for each_game in games:
+            for each_seed in BENCHMARK_SEEDS:
+                playout = each_game.clone()
+                playout.rng = SimulationRandom(each_seed)
+                playout.playout_game(PLAYOUT_PLIES)
+                operations += 1
+    return operations
+
+
+def monte_carlo(games: List[Game]) -> int:
+    """
+    Searches every position with a fixed budget of SEARCH_ITERATIONS iterations, the first seed's playouts capped at
+    PLAYOUT_PLIES plies
+
+    :param games: The positions
+    :return: The amount of search iterations run
+    """
+    operations = 0
+    for each_game in games:
+        search = MonteCarloSearch(each_game, playout_plies=PLAYOUT_PLIES, seed=BENCHMARK_SEEDS[0])
+        operations += search.search(SEARCH_ITERATIONS).iterations
+    return operations
+
+
+BENCHMARKS: Dict[str, Callable[[List[Game]], int]] = {  # Every benchmark, micro benchmarks first
+    "generate_potential_moves": generate_potential_moves,
+    "move_piece": move_piece,
+    "is_checkmate": is_checkmate,
+    "clone": clone,
+    "playout_game": playout_game,
+    "monte_carlo": monte_carlo,
+}
+
+
+def measure(name: str, benchmark: Callable[[List[Game]], int], repeats: int) -> BenchmarkResult:
+    """
+    Times a benchmark, keeping its fastest repeat, which is the least disturbed by whatever else the machine is doing
+
+    :param name: The name of the benchmark
+    :param benchmark: The benchmark, returning the amount of operations it ran
+    :param repeats: The amount of times the benchmark is run
+    :return: The measurement of the fastest repeat
+    """
+    best: BenchmarkResult | None = None
+    for _ in range(max(repeats, 1)):
+        games = benchmark_games()
+        start = time.perf_counter()
+        operations = benchmark(games)
+        result = BenchmarkResult(name, operations, time.perf_counter() - start)
+        if best is None or result.seconds < best.seconds:
+            best = result
+    return best
+
+
+def run_benchmarks(names: List[str] | None = None, repeats: int = 5) -> List[BenchmarkResult]:
+    """
+    Runs the benchmarks supplied, printing each result as it finishes
+
+    :param names: The names of the benchmarks to run, defaults to every benchmark
+    :param repeats: The amount of times each benchmark is run
+    :return: The measurement of every benchmark
+    """
+    results: List[BenchmarkResult] = []
+    for each_name in names if names is not None else BENCHMARKS.keys():
+        result = measure(each_name, BENCHMARKS[each_name], repeats)
+        print("{:<26}{:>14.1f} ops/s {:>10.4f} s".format(each_name, result.ops_per_second, result.seconds))
+        results.append(result)
+    return results
+
+
+def save_baseline(results: List[BenchmarkResult], path: str) -> None:
+    """
+    Saves the results as a JSON baseline
+
+    :param results: The results to save
+    :param path: The path of the JSON file
+    :return: None
+    """
+    baseline = {
+        "format_version": BASELINE_FORMAT_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "benchmarks": {each_result.name: {"operations": each_result.operations, "seconds": each_result.seconds,
+                                          "ops_per_second": each_result.ops_per_second}
+                       for each_result in results},
+    }
+    with open(path, "w") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, float]:
+    """
+    Loads the throughput of every benchmark from a JSON baseline
+
+    :param path: The path of the JSON file
+    :return: The operations per second of every benchmark, by name
+    """
+    with open(path) as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline.get("format_version") != BASELINE_FORMAT_VERSION:
+        raise ValueError("{} is a version {} baseline, expected version {}".format(
+            path, baseline.get("format_version"), BASELINE_FORMAT_VERSION))
+    return {name: values["ops_per_second"] for name, values in baseline["benchmarks"].items()}
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float],
+            threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """
+    Compares the throughput of two runs, printing the change of every benchmark they share
+
+    :param baseline: The operations per second of the baseline run, by benchmark name
+    :param current: The operations per second of the current run, by benchmark name
+    :param threshold: The fraction of throughput a benchmark may lose before it counts as a regression
+    :return: The names of the benchmarks that regressed
+    """
+    regressions: List[str] = []
+    for each_name, baseline_ops in baseline.items():
+        if each_name not in current:
+            continue
+        change = current[each_name] / baseline_ops - 1 if baseline_ops > 0 else 0
+        regressed = change < -threshold
+        if regressed:
+            regressions.append(each_name)
+        print("{:<26}{:>14.1f} -> {:>12.1f} ops/s {:>+8.1%}{}".format(
+            each_name, baseline_ops, current[each_name], change, "  REGRESSION" if regressed else ""))
+    return regressions
+
+
+def main(arguments: List[str]) -> int:
+    """
+    Runs the command line, `run` measuring the benchmarks and optionally saving them as a baseline, and `compare`
+    checking a run (or a fresh measurement) against a baseline. Throughput depends on the machine and its load, so both
+    sides of a comparison are measured on the same machine in the same session, e.g. `run --output base.json` on the
+    old revision and then `compare base.json` on the new one.
+
+    :param arguments: The command line arguments, without the program name
+    :return: The exit status, 1 if any benchmark regressed
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks the move generation, playouts and search")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="measure the benchmarks")
+    run_parser.add_argument("--output", help="save the results as a JSON baseline at this path")
+    compare_parser = commands.add_parser("compare", help="compare against a JSON baseline")
+    compare_parser.add_argument("baseline", help="the JSON baseline to compare against")
+    compare_parser.add_argument("current", nargs="?", help="a JSON run to compare, measured now if left out")
+    compare_parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                                help="the fraction of throughput a benchmark may lose, defaults to %(default)s")
+    for each_parser in [run_parser, compare_parser]:
+        each_parser.add_argument("--repeats", type=int, default=5, help="the repeats of each benchmark")
+        each_parser.add_argument("--benchmark", action="append", choices=list(BENCHMARKS.keys()),
+                                 help="run only this benchmark, may be given more than once")
+    options = parser.parse_args(arguments)
+    if options.command == "run":
+        results = run_benchmarks(options.benchmark, options.repeats)
+        if options.output is not None:
+            save_baseline(results, options.output)
+        return 0
+    baseline = load_baseline(options.baseline)
+    if options.current is not None:
+        current = load_baseline(options.current)
+    else:
+        current = {each_result.name: each_result.ops_per_second for each_result in
+                   run_benchmarks(options.benchmark or [name for name in BENCHMARKS if name in baseline],
+                                  options.repeats)}
+    return 1 if len(compare(baseline, current, options.threshold)) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -1,19 +1,37 @@
 from Types.Board import Board
+from Types.GameLog import GameLogWriter
+from Types.MonteCarloSearch import MonteCarloSearch
 from Types.Player import Player, Team
-from Types.Game import Game
+from Types.Game import Game, STARTING_FEN
 
+SELF_PLAY_ITERATIONS: int = 200  # The amount of search iterations spent on each move of a self-play game
+SELF_PLAY_LOG: str = "self_play.cpgl"  # The game log self-play games are appended to
 
-def play_chess():
+
+def play_chess(log_path: str = SELF_PLAY_LOG):
     board: Board = Board()
     player_1 = Player()
     player_1.team = Team.WHITE
     player_2 = Player()
     player_2.team = Team.BLACK
     game: Game = Game(board, player_1, player_2)
-    result_game: Game | None = game
-    while not result_game.is_checkmate():
-        result_game = game.monte_carlo().value
-    print("Hello")
+    starting_fen = game.to_fen()
+    moves = []
+    search = MonteCarloSearch(game)
+    while not game.is_checkmate() and not game.is_draw():
+        best_move = search.search(SELF_PLAY_ITERATIONS).best_move
+        if best_move is None:
+            #  the player has no moves to make, which is a stalemate
+            break
+        moves.append(best_move)
+        game = game.make_move(best_move)
+        #  the reply to the move has already been searched as part of the move's subtree, so the search carries on
+        search.advance(best_move)
+    #  the game is checkmate once the king of the player to move has been captured
+    winner = (Team.BLACK if game.turn == Team.WHITE else Team.WHITE) if game.is_checkmate() else None
+    with GameLogWriter(log_path) as game_log:
+        game_id = game_log.append(moves, winner, starting_fen if starting_fen != STARTING_FEN else None)
+    print("Game {} logged to {}, {} plies, winner: {}".format(game_id, log_path, len(moves), winner))
 
 
 # Press the green button in the gutter to run the script.
@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+import math
+import sys
+import threading
+import time
+from typing import Dict, List, TextIO
+from Types.AlphaBetaSearch import AlphaBetaSearch
+from Types.AnalysisCache import AnalysisCache
+from Types.Game import Game
+from Types.Helpers import move_name, parse_move
+from Types.LeafEvaluator import LeafEvaluator
+from Types.MonteCarloSearch import MonteCarloSearch
+from Types.Player import Team
+from Types.QuiescenceEvaluator import QuiescenceEvaluator
+from Types.SearchResult import SearchResult
+from Types.TranspositionTable import TranspositionTable
+
+INFO_INTERVAL: float = 0.5  # The seconds between two info lines while searching
+MOVES_TO_GO: int = 30  # The amount of moves the remaining clock time is spread over when the GUI does not say
+TIME_SAFETY_MARGIN: float = 0.05  # The seconds kept in reserve for the GUI and the process to answer
+INFINITE_DEPTH: int = 64  # The depth an alpha-beta search deepens to when only `stop` ends it
+ENGINES: List[str] = ["MonteCarlo", "AlphaBeta"]  # The values of the Engine option, the first being the default
+LEAF_EVALUATIONS: List[str] = ["Playout", "Quiescence"]  # The values of the LeafEvaluation option, likewise
+
+
+class UciEngine:
+    """
+    Drives the engine over the Universal Chess Interface, https://www.chessprogramming.org/UCI, reading commands from
+    an input stream and writing answers to an output stream, standard input and output by default. Searches run in a
+    background thread, so `stop` can be read while the engine is thinking.
+
+    With an AnalysisCache, searches are warm-started from the results stored by earlier runs, and a `go nodes` the
+    stored result of the position already covers is answered without searching.
+
+    The Engine option picks the search, a MonteCarloSearch by default, or an AlphaBetaSearch, which counts its nodes
+    rather than its iterations, and waits for `ponderhit` rather than pondering. The LeafEvaluation option picks how
+    the Monte Carlo search scores its leaves, by random playouts, or by a QuiescenceEvaluator.
+    """
+
+    def __init__(self: UciEngine, input_stream: TextIO = sys.stdin, output_stream: TextIO = sys.stdout,
+                 analysis_cache: AnalysisCache | None = None) -> None:
+        """
+        Initializes the engine at the initial position
+
+        :param input_stream: The stream commands are read from
+        :param output_stream: The stream answers are written to
+        :param analysis_cache: The persistent store of search results, closed once the engine quits
+        """
+        self.input_stream: TextIO = input_stream
+        self.output_stream: TextIO = output_stream
+        self.output_lock: threading.Lock = threading.Lock()
+        self.game: Game = Game.from_fen()
+        self.transposition_table: TranspositionTable = TranspositionTable()
+        self.threads: int = 1
+        self.engine: str = ENGINES[0]
+        self.leaf_evaluation: str = LEAF_EVALUATIONS[0]
+        self.search: MonteCarloSearch | AlphaBetaSearch | None = None
+        self.search_thread: threading.Thread | None = None
+        self.stop_requested: threading.Event = threading.Event()
+        self.pondering: threading.Event = threading.Event()  # Set while searching on the opponent's time
+        self.search_start: float = 0  # When the limits of the running search started counting, reset by ponderhit
+        self.start_iterations: int = 0  # The iterations the running search had when its limits started counting
+        self.analysis_cache: AnalysisCache | None = analysis_cache
+
+    def send(self: UciEngine, line: str) -> None:
+        """
+        Writes a line to the GUI
+
+        :param line: The line to write
+        :return: None
+        """
+        with self.output_lock:
+            self.output_stream.write(line + "\n")
+            self.output_stream.flush()
+
+    def run(self: UciEngine) -> None:
+        """
+        Reads and handles commands until `quit` is received or the input ends
+
+        :return: None
+        """
+        for each_line in self.input_stream:
+            if not self.handle(each_line.strip()):
+                break
+        self.stop_search()
+        if self.analysis_cache is not None:
+            self.analysis_cache.close()
+
+    def handle(self: UciEngine, command: str) -> bool:
+        """
+        Handles a single command
+
+        :param command: The command line, as sent by the GUI
+        :return: Whether the engine should keep reading commands
+        """
+        tokens = command.split()
+        if len(tokens) == 0:
+            return True
+        if tokens[0] == "uci":
+            self.send("id name ChessPredictor")
+            self.send("id author Cameron Thacker")
+            self.send("option name Threads type spin default 1 min 1 max 64")
+            self.send("option name Ponder type check default false")
+            self.send("option name Engine type combo default {} {}".format(
+                ENGINES[0], " ".join("var " + each_engine for each_engine in ENGINES)))
+            self.send("option name LeafEvaluation type combo default {} {}".format(
+                LEAF_EVALUATIONS[0], " ".join("var " + each_evaluation for each_evaluation in LEAF_EVALUATIONS)))
+            self.send("uciok")
+        elif tokens[0] == "isready":
+            self.send("readyok")
+        elif tokens[0] == "setoption":
+            self.handle_setoption(tokens)
+        elif tokens[0] == "ucinewgame":
+            self.stop_search()
+            self.transposition_table = TranspositionTable()
+            self.search = None
+            self.game = Game.from_fen()
+        elif tokens[0] == "position":
+            self.stop_search()
+            self.handle_position(tokens)
+        elif tokens[0] == "go":
+            self.stop_search()
+            self.handle_go(tokens)
+        elif tokens[0] == "ponderhit":
+            #  the limits restart here, and are in place before the search thread sees pondering cleared
+            self.search_start = time.perf_counter()
+            if isinstance(self.search, MonteCarloSearch):
+                self.start_iterations = self.search.iterations
+            self.pondering.clear()
+            if isinstance(self.search, MonteCarloSearch):
+                #  the unlimited ponder slice is cut short, so the next slice runs within the limits
+                self.search.stop()
+        elif tokens[0] == "stop":
+            self.stop_search()
+        elif tokens[0] == "quit":
+            return False
+        return True
+
+    def handle_setoption(self: UciEngine, tokens: List[str]) -> None:
+        """
+        Handles `setoption name <name> value <value>`
+
+        :param tokens: The tokens of the command
+        :return: None
+        """
+        if "name" not in tokens or "value" not in tokens:
+            return
+        name = " ".join(tokens[tokens.index("name") + 1:tokens.index("value")])
+        value = " ".join(tokens[tokens.index("value") + 1:])
+        if name.lower() == "threads":
+            if not value.isdigit() or int(value) < 1:
+                self.send("info string invalid Threads value {}".format(value))
+                return
+            self.threads = int(value)
+        elif name.lower() == "engine":
+            if value not in ENGINES:
+                self.send("info string invalid Engine value {}".format(value))
+                return
+            self.stop_search()
+            self.engine = value
+            self.search = None
+        elif name.lower() == "leafevaluation":
+            if value not in LEAF_EVALUATIONS:
+                self.send("info string invalid LeafEvaluation value {}".format(value))
+                return
+            self.stop_search()
+            self.leaf_evaluation = value
+            self.search = None
+
+    def create_evaluator(self: UciEngine) -> LeafEvaluator | None:
+        """
+        Creates the leaf evaluator picked by the LeafEvaluation option
+
+        :return: The evaluator, or None for the Monte Carlo search's default random playouts
+        """
+        return QuiescenceEvaluator() if self.leaf_evaluation == "Quiescence" else None
+
+    def handle_position(self: UciEngine, tokens: List[str]) -> None:
+        """
+        Handles `position [startpos | fen <fen>] [moves <move>...]`. A FEN that cannot be read leaves the position as
+        it was, and the moves stop at the first one that is not valid in the position reached, both reported with an
+        `info string`.
+
+        :param tokens: The tokens of the command
+        :return: None
+        """
+        moves_index = tokens.index("moves") if "moves" in tokens else len(tokens)
+        if len(tokens) > 1 and tokens[1] == "fen":
+            fen = " ".join(tokens[2:moves_index])
+            try:
+                game = Game.from_fen(fen)
+            except (ValueError, IndexError, KeyError):
+                self.send("info string invalid fen {}".format(fen))
+                return
+        else:
+            game = Game.from_fen()
+        for each_move in tokens[moves_index + 1:]:
+            try:
+                move = parse_move(each_move)
+            except (ValueError, IndexError):
+                move = None
+            if move not in game.generate_valid_moves():
+                self.send("info string invalid move {}".format(each_move))
+                break
+            game = game.make_move(move)
+        self.game = game
+
+    @staticmethod
+    def parse_limits(tokens: List[str]) -> Dict[str, int]:
+        """
+        Reads the limits of a `go` command
+
+        :param tokens: The tokens of the command
+        :return: The numeric limits by name, with `infinite` set to 1 if the search should run until stopped, and
+            `ponder` set to 1 if the search runs on the opponent's time
+        """
+        limits: Dict[str, int] = {}
+        index = 1
+        while index < len(tokens):
+            if tokens[index] in ["infinite", "ponder"]:
+                limits[tokens[index]] = 1
+            elif tokens[index] in ["nodes", "depth", "movetime", "wtime", "btime", "winc", "binc", "movestogo"] \
+                    and index + 1 < len(tokens):
+                limits[tokens[index]] = int(tokens[index + 1])
+                index += 1
+            index += 1
+        return limits
+
+    def allocate_time(self: UciEngine, limits: Dict[str, int]) -> float | None:
+        """
+        Decides how many seconds to search for, from either a fixed move time or the clock of the side to move
+
+        :param limits: The limits of the `go` command
+        :return: The seconds to search for, or None if the search is not limited by time
+        """
+        if "infinite" in limits:
+            return None
+        if "movetime" in limits:
+            return max(limits["movetime"] / 1000 - TIME_SAFETY_MARGIN, 0.01)
+        clock, increment = ("wtime", "winc") if self.game.turn == Team.WHITE else ("btime", "binc")
+        if clock not in limits:
+            return None
+        remaining = limits[clock] / 1000
+        allocated = remaining / limits.get("movestogo", MOVES_TO_GO) + limits.get(increment, 0) / 1000 * 0.8
+        return max(min(allocated, remaining / 2 - TIME_SAFETY_MARGIN), 0.01)
+
+    def reuse_search(self: UciEngine) -> MonteCarloSearch | AlphaBetaSearch:
+        """
+        Finds the search of the position to search, carrying on from the previous search if the position is its root,
+        or is reached from its root by one or two moves, such as the engine's move and the opponent's reply, in which
+        case the previous search is re-rooted at the position, keeping its subtree. An alpha-beta search is created
+        anew, carrying on from the transposition table alone.
+
+        :return: The search of the current position
+        """
+        if self.engine == "AlphaBeta":
+            return AlphaBetaSearch(self.game, transposition_table=self.transposition_table)
+        target = self.game.position_hash()
+        if self.search is not None:
+            root = self.search.tree.root
+            if root.value.position_hash() == target:
+                return self.search
+            for each_child in root.children:
+                if each_child.value.position_hash() == target:
+                    self.search.advance(each_child.move)
+                    return self.search
+                for each_grandchild in each_child.children:
+                    if each_grandchild.value.position_hash() == target:
+                        self.search.advance(each_child.move)
+                        self.search.advance(each_grandchild.move)
+                        return self.search
+        return MonteCarloSearch(self.game, transposition_table=self.transposition_table, threads=self.threads,
+                                evaluator=self.create_evaluator(), analysis_cache=self.analysis_cache)
+
+    def handle_go(self: UciEngine, tokens: List[str]) -> None:
+        """
+        Handles `go`, starting a search in the background with the limits supplied. Without any limit, the search runs
+        until `stop` is received. With `ponder`, the search runs on the opponent's time, ignoring its limits until
+        `ponderhit` is received.
+
+        :param tokens: The tokens of the command
+        :return: None
+        """
+        limits = self.parse_limits(tokens)
+        self.stop_requested.clear()
+        if "ponder" in limits:
+            self.pondering.set()
+        else:
+            self.pondering.clear()
+        self.search = self.reuse_search()
+        self.search_start = time.perf_counter()
+        self.start_iterations = self.search.iterations if isinstance(self.search, MonteCarloSearch) else 0
+        run = self.run_alpha_beta if isinstance(self.search, AlphaBetaSearch) else self.run_search
+        self.search_thread = threading.Thread(target=run, args=(self.search, limits.get("nodes"), limits.get("depth"),
+                                                                self.allocate_time(limits)))
+        self.search_thread.start()
+
+    def run_search(self: UciEngine, search: MonteCarloSearch, nodes: int | None, depth: int | None,
+                   time_limit: float | None) -> None:
+        """
+        Searches in slices of at most INFO_INTERVAL seconds, reporting progress after each, until a limit is reached or
+        the search is stopped, then reports the best move. While pondering, the limits are ignored, and start counting
+        once `ponderhit` is received, the nodes searched while pondering not counting towards the node limit.
+
+        :param search: The search to run
+        :param nodes: The maximum amount of nodes (iterations) to search
+        :param depth: The depth of the principal variation at which the search stops
+        :param time_limit: The maximum amount of seconds to search for
+        :return: None
+        """
+        result = search.result()
+        #  a position searched at least as deeply by an earlier run is answered with its stored result
+        cached = search.iterations == 0 and not self.pondering.is_set() and search.analysis_covers(nodes)
+        if cached:
+            self.report(result, time.perf_counter() - self.search_start, 0)
+        while not cached and not self.stop_requested.is_set():
+            if self.pondering.is_set():
+                result = search.search(None, INFO_INTERVAL)
+                self.report(result, time.perf_counter() - self.search_start,
+                            search.iterations - self.start_iterations)
+                if result.best_move is None:
+                    #  there is nothing to search, wait for the opponent's move without spinning
+                    self.stop_requested.wait(INFO_INTERVAL)
+                continue
+            elapsed = time.perf_counter() - self.search_start
+            remaining_time = time_limit - elapsed if time_limit is not None else None
+            remaining_nodes = nodes - (search.iterations - self.start_iterations) if nodes is not None else None
+            if (remaining_time is not None and remaining_time <= 0) or \
+                    (remaining_nodes is not None and remaining_nodes <= 0):
+                break
+            slice_time = min(INFO_INTERVAL, remaining_time) if remaining_time is not None else INFO_INTERVAL
+            result = search.search(remaining_nodes, slice_time)
+            self.report(result, time.perf_counter() - self.search_start, search.iterations - self.start_iterations)
+            if result.best_move is None or (depth is not None and len(result.principal_variation) >= depth):
+                break
+        self.send_bestmove(result)
+
+    def run_alpha_beta(self: UciEngine, search: AlphaBetaSearch, nodes: int | None, depth: int | None,
+                       time_limit: float | None) -> None:
+        """
+        Runs an alpha-beta search until a limit is reached or the search is stopped, then reports the best move. While
+        pondering, the search waits for `ponderhit`, its limits counting from then.
+
+        :param search: The search to run
+        :param nodes: The maximum amount of nodes to search
+        :param depth: The depth of the last iteration
+        :param time_limit: The maximum amount of seconds to search for
+        :return: None
+        """
+        while self.pondering.is_set() and not self.stop_requested.is_set():
+            self.stop_requested.wait(INFO_INTERVAL)
+        result = search.result()
+        if not self.stop_requested.is_set():
+            remaining_time = max(time_limit - (time.perf_counter() - self.search_start), 0.01) \
+                if time_limit is not None else None
+            if depth is None and remaining_time is None and nodes is None:
+                depth = INFINITE_DEPTH
+            result = search.search(depth, remaining_time, nodes)
+            self.report(result, time.perf_counter() - self.search_start, search.nodes)
+        self.send_bestmove(result)
+
+    def send_bestmove(self: UciEngine, result: SearchResult) -> None:
+        """
+        Sends the best move of a finished search, along with the reply to ponder on, if the search expects one
+
+        :param result: The result of the search
+        :return: None
+        """
+        bestmove = "bestmove {}".format(move_name(result.best_move) if result.best_move is not None else "0000")
+        if len(result.principal_variation) > 1 and result.principal_variation[0] == result.best_move:
+            bestmove += " ponder {}".format(move_name(result.principal_variation[1]))
+        self.send(bestmove)
+
+    @staticmethod
+    def centipawns(score: float) -> int:
+        """
+        Converts an expected result to a centipawn score, the inverse of the logistic curve used by the evaluation
+
+        :param score: The expected result, from 0 (loss) to 1 (win)
+        :return: The equivalent score in centipawns
+        """
+        score = min(max(score, 0.001), 0.999)
+        return round(400 * math.log10(score / (1 - score)))
+
+    def report(self: UciEngine, result: SearchResult, elapsed: float, nodes: int) -> None:
+        """
+        Sends an info line describing the search so far
+
+        :param result: The result of the search so far
+        :param elapsed: The seconds since `go` was received, or since `ponderhit`
+        :param nodes: The amount of nodes searched since `go` was received, or since `ponderhit`
+        :return: None
+        """
+        self.send("info depth {} seldepth {} nodes {} nps {} time {} score cp {} pv {}".format(
+            len(result.principal_variation), result.depth, nodes,
+            int(nodes / elapsed) if elapsed > 0 else 0, int(elapsed * 1000),
+            self.centipawns(result.score), " ".join(move_name(each_move) for each_move in result.principal_variation)
+        ).rstrip())
+
+    def stop_search(self: UciEngine) -> None:
+        """
+        Stops the running search, if any, and waits for it to report its best move
+
+        :return: None
+        """
+        if self.search_thread is None:
+            return
+        self.stop_requested.set()
+        self.search.stop()
+        self.search_thread.join()
+        self.search_thread = None
+
+
+if __name__ == '__main__':
+    UciEngine(analysis_cache=AnalysisCache()).run()